@@ -2,19 +2,31 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.service import async_register_admin_service
 
 from .chore_core import Chore
-from .const import CONF_LOGBOOK, DOMAIN
+from .const import (
+    ATTR_CHORE_ID,
+    CONF_LOGBOOK,
+    DOMAIN,
+    SERVICE_FORCE_COMPLETE,
+    SERVICE_FORCE_DUE,
+    SERVICE_FORCE_INACTIVE,
+    SERVICE_RELOAD,
+    CompletionType,
+    TriggerType,
+)
 from .coordinator import ChoresCoordinator
 from .store import ChoreStore
 
@@ -44,243 +56,153 @@ SENSOR_DISPLAY_SCHEMA = vol.Schema(
     }
 )
 
-TRIGGER_SCHEMA = vol.Any(
+# Detector fields, keyed by detector type. Schemas are dispatched on the
+# ``type`` key and each one is compiled on first use, then shared by the
+# trigger and completion stages.
+_DETECTOR_FIELDS: dict[str, dict[Any, Any]] = {
     # power_cycle
-    vol.Schema(
-        {
-            vol.Required("type"): "power_cycle",
-            vol.Optional("power_sensor"): cv.entity_id,
-            vol.Optional("current_sensor"): cv.entity_id,
-            vol.Optional("power_threshold", default=10.0): cv.positive_float,
-            vol.Optional("current_threshold", default=0.04): cv.positive_float,
-            vol.Optional("cooldown_minutes", default=5): cv.positive_int,
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
+    "power_cycle": {
+        vol.Optional("power_sensor"): cv.entity_id,
+        vol.Optional("current_sensor"): cv.entity_id,
+        vol.Optional("power_threshold", default=10.0): cv.positive_float,
+        vol.Optional("current_threshold", default=0.04): cv.positive_float,
+        vol.Optional("cooldown_minutes", default=5): cv.positive_int,
+    },
     # state_change
-    vol.Schema(
-        {
-            vol.Required("type"): "state_change",
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Required("from"): cv.string,
-            vol.Required("to"): cv.string,
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
+    "state_change": {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("from"): cv.string,
+        vol.Required("to"): cv.string,
+    },
     # daily
-    vol.Schema(
-        {
-            vol.Required("type"): "daily",
-            vol.Required("time"): cv.string,
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
+    "daily": {
+        vol.Required("time"): cv.string,
+    },
     # weekly (specific days with per-day times)
-    vol.Schema(
-        {
-            vol.Required("type"): "weekly",
-            vol.Required("schedule"): vol.All(
-                cv.ensure_list,
-                [
-                    vol.Schema(
-                        {
-                            vol.Required("day"): vol.In(
-                                ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
-                            ),
-                            vol.Required("time"): cv.string,
-                        }
-                    )
-                ],
-                vol.Length(min=1),
-            ),
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
+    "weekly": {
+        vol.Required("schedule"): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required("day"): vol.In(
+                            ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+                        ),
+                        vol.Required("time"): cv.string,
+                    }
+                )
+            ],
+            vol.Length(min=1),
+        ),
+    },
     # duration (fires after entity stays in target state for N hours)
-    vol.Schema(
-        {
-            vol.Required("type"): "duration",
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Optional("state", default="on"): cv.string,
-            vol.Required("duration_hours"): vol.All(
-                vol.Coerce(float), vol.Range(min=0, min_included=False)
-            ),
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
-    # ── Cross-stage detectors (primarily completion types, also usable as triggers)
-    # sensor_state
-    vol.Schema(
-        {
-            vol.Required("type"): "sensor_state",
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Optional("state", default="on"): cv.string,
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
-    # contact
-    vol.Schema(
-        {
-            vol.Required("type"): "contact",
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
-    # contact_cycle
-    vol.Schema(
-        {
-            vol.Required("type"): "contact_cycle",
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Optional("debounce_seconds", default=2): vol.All(
-                int, vol.Range(min=0)
-            ),
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
-    # presence_cycle
-    vol.Schema(
-        {
-            vol.Required("type"): "presence_cycle",
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
-    # sensor_threshold
-    vol.Schema(
-        {
-            vol.Required("type"): "sensor_threshold",
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Required("threshold"): vol.Coerce(float),
-            vol.Optional("operator", default="above"): vol.In(
-                ["above", "below", "equal"]
-            ),
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
-)
-
-COMPLETION_SCHEMA = vol.Any(
-    # manual
-    vol.Schema(
-        {
-            vol.Required("type"): "manual",
-        }
-    ),
+    "duration": {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("state", default="on"): cv.string,
+        vol.Required("duration_hours"): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+    },
     # sensor_state
-    vol.Schema(
-        {
-            vol.Required("type"): "sensor_state",
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Optional("state", default="on"): cv.string,
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
+    "sensor_state": {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("state", default="on"): cv.string,
+    },
     # contact (single step)
-    vol.Schema(
-        {
-            vol.Required("type"): "contact",
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
+    "contact": {
+        vol.Required("entity_id"): cv.entity_id,
+    },
     # contact_cycle (two step)
-    vol.Schema(
-        {
-            vol.Required("type"): "contact_cycle",
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Optional("debounce_seconds", default=2): vol.All(int, vol.Range(min=0)),
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
+    "contact_cycle": {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("debounce_seconds", default=2): vol.All(int, vol.Range(min=0)),
+    },
     # presence_cycle (two step)
-    vol.Schema(
-        {
-            vol.Required("type"): "presence_cycle",
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
+    "presence_cycle": {
+        vol.Required("entity_id"): cv.entity_id,
+    },
     # sensor_threshold (fires when sensor value crosses a numeric threshold)
-    vol.Schema(
-        {
-            vol.Required("type"): "sensor_threshold",
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Required("threshold"): vol.Coerce(float),
-            vol.Optional("operator", default="above"): vol.In(
-                ["above", "below", "equal"]
-            ),
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
-    # ── Cross-stage detectors (primarily trigger types, also usable as completions)
-    # power_cycle
-    vol.Schema(
-        {
-            vol.Required("type"): "power_cycle",
-            vol.Optional("power_sensor"): cv.entity_id,
-            vol.Optional("current_sensor"): cv.entity_id,
-            vol.Optional("power_threshold", default=10.0): cv.positive_float,
-            vol.Optional("current_threshold", default=0.04): cv.positive_float,
-            vol.Optional("cooldown_minutes", default=5): cv.positive_int,
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
-    # state_change
-    vol.Schema(
-        {
-            vol.Required("type"): "state_change",
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Required("from"): cv.string,
-            vol.Required("to"): cv.string,
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
-    # duration
-    vol.Schema(
-        {
-            vol.Required("type"): "duration",
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Optional("state", default="on"): cv.string,
-            vol.Required("duration_hours"): vol.All(
-                vol.Coerce(float), vol.Range(min=0, min_included=False)
-            ),
-            vol.Optional("gate"): GATE_SCHEMA,
-            vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
-        }
-    ),
-)
+    "sensor_threshold": {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("threshold"): vol.Coerce(float),
+        vol.Optional("operator", default="above"): vol.In(
+            ["above", "below", "equal"]
+        ),
+    },
+}
 
-RESET_SCHEMA = vol.Any(
-    vol.Schema(
-        {
-            vol.Required("type"): "delay",
-            vol.Optional("minutes", default=0): vol.All(int, vol.Range(min=0)),
-        }
-    ),
-    vol.Schema(
+# Keys accepted by every detector except manual
+_STAGE_OPTIONS: dict[Any, Any] = {
+    vol.Optional("gate"): GATE_SCHEMA,
+    vol.Optional("sensor"): SENSOR_DISPLAY_SCHEMA,
+}
+
+_RESET_FIELDS: dict[str, dict[Any, Any]] = {
+    "delay": {
+        vol.Optional("minutes", default=0): vol.All(int, vol.Range(min=0)),
+    },
+    "daily_reset": {
+        vol.Required("time"): cv.time,
+    },
+}
+
+_TRIGGER_TYPES: frozenset[str] = frozenset(TriggerType)
+_COMPLETION_TYPES: frozenset[str] = frozenset(CompletionType)
+_RESET_TYPES: frozenset[str] = frozenset(_RESET_FIELDS)
+
+
+@lru_cache(maxsize=None)
+def _detector_schema(detector_type: str) -> vol.Schema:
+    """Compile the schema for a detector type on first use."""
+    if detector_type == CompletionType.MANUAL:
+        return vol.Schema({vol.Required("type"): detector_type})
+    return vol.Schema(
         {
-            vol.Required("type"): "daily_reset",
-            vol.Required("time"): cv.time,
+            vol.Required("type"): detector_type,
+            **_DETECTOR_FIELDS[detector_type],
+            **_STAGE_OPTIONS,
         }
-    ),
-)
+    )
+
+
+@lru_cache(maxsize=None)
+def _reset_schema(reset_type: str) -> vol.Schema:
+    """Compile the schema for a reset type on first use."""
+    return vol.Schema(
+        {vol.Required("type"): reset_type, **_RESET_FIELDS[reset_type]}
+    )
+
+
+def _get_type(value: dict[str, Any], allowed: frozenset[str], kind: str) -> str:
+    """Return the ``type`` key of a stage config, validating it is allowed."""
+    type_ = value.get("type")
+    if not isinstance(type_, str) or type_ not in allowed:
+        raise vol.Invalid(f"invalid {kind} type: {type_}", path=["type"])
+    return type_
+
+
+def _validate_trigger(value: dict[str, Any]) -> dict[str, Any]:
+    """Validate a trigger config against the schema for its type."""
+    return _detector_schema(_get_type(value, _TRIGGER_TYPES, "trigger"))(value)
+
+
+def _validate_completion(value: dict[str, Any]) -> dict[str, Any]:
+    """Validate a completion config against the schema for its type."""
+    return _detector_schema(_get_type(value, _COMPLETION_TYPES, "completion"))(
+        value
+    )
+
+
+def _validate_reset(value: dict[str, Any]) -> dict[str, Any]:
+    """Validate a reset config against the schema for its type."""
+    return _reset_schema(_get_type(value, _RESET_TYPES, "reset"))(value)
+
+
+TRIGGER_SCHEMA = vol.All(dict, _validate_trigger)
+
+COMPLETION_SCHEMA = vol.All(dict, _validate_completion)
+
+RESET_SCHEMA = vol.All(dict, _validate_reset)
 
 CHORE_SCHEMA = vol.Schema(
     {
@@ -326,6 +248,13 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
+SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CHORE_ID): cv.string,
+    }
+)
+
+
 # ── Setup ───────────────────────────────────────────────────────────
 
 
@@ -358,35 +287,35 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Chores from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    entries: dict[str, dict[str, Any]] = domain_data.setdefault("entries", {})
 
     # Initialize store
     store = ChoreStore(hass)
     await store.async_load()
 
     # Load chores from YAML
-    yaml_config = hass.data[DOMAIN].get("yaml_config", {})
+    yaml_config = domain_data.get("yaml_config", {})
     chores_config = yaml_config.get("chores", [])
     logbook_enabled: bool = yaml_config.get(CONF_LOGBOOK, True)
 
+    entry_id = entry.entry_id
+    device_registry = dr.async_get(hass)
+
+    # Nothing to poll or expose: keep services available for a later reload
+    if not chores_config:
+        _LOGGER.debug("No chores configured")
+        _async_remove_orphaned_devices(device_registry, entry_id, set())
+        entries[entry_id] = {"coordinator": None, "store": store}
+        _async_setup_services(hass)
+        return True
+
     # Initialize coordinator
     coordinator = ChoresCoordinator(hass, entry, store, logbook_enabled=logbook_enabled)
 
     for chore_config in chores_config:
         try:
-            chore = Chore(chore_config)
-            coordinator.register_chore(chore)
-
-            # Create device for this chore
-            device_registry = dr.async_get(hass)
-            device_registry.async_get_or_create(
-                config_entry_id=entry.entry_id,
-                identifiers={(DOMAIN, chore.id)},
-                name=chore.name,
-                manufacturer="Chores",
-                model=chore.trigger_type.replace("_", " ").title(),
-                sw_version="2.0.0",
-            )
+            coordinator.register_chore(Chore(chore_config))
         except Exception as err:
             _LOGGER.error(
                 "Error creating chore %s: %s",
@@ -394,29 +323,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 err,
             )
 
+    # Create a device for each chore
+    _async_register_devices(device_registry, entry_id, coordinator.chores.values())
+
     # Remove devices for chores that no longer exist in YAML (handles reload)
-    current_chore_ids = set(coordinator.chores.keys())
-    device_registry = dr.async_get(hass)
-    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
-        chore_ids_for_device = {
-            identifier[1]
-            for identifier in device.identifiers
-            if identifier[0] == DOMAIN
-        }
-        if chore_ids_for_device and not chore_ids_for_device & current_chore_ids:
-            _LOGGER.info(
-                "Removing orphaned device %s (chore IDs %s no longer in YAML)",
-                device.name,
-                chore_ids_for_device,
-            )
-            device_registry.async_remove_device(device.id)
+    _async_remove_orphaned_devices(device_registry, entry_id, set(coordinator.chores))
 
     # Store coordinator
-    hass.data[DOMAIN][entry.entry_id] = {
+    entries[entry_id] = {
         "coordinator": coordinator,
         "store": store,
     }
 
+    # Index chores by id so services can find their coordinator directly
+    chore_index = domain_data.setdefault("chore_index", {})
+    for chore_id in coordinator.chores:
+        chore_index[chore_id] = coordinator
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -437,46 +360,85 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    coordinator: ChoresCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    coordinator.remove_listeners()
-
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    domain_data = hass.data[DOMAIN]
+    entries: dict[str, dict[str, Any]] = domain_data["entries"]
+    coordinator: ChoresCoordinator | None = entries[entry.entry_id]["coordinator"]
+    if coordinator is None:
+        # Set up without chores: no listeners or platforms were created
+        entries.pop(entry.entry_id)
+        unload_ok = True
+    else:
+        coordinator.remove_listeners()
+        unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        if unload_ok:
+            entries.pop(entry.entry_id)
+            chore_index = domain_data.get("chore_index", {})
+            for chore_id in coordinator.chores:
+                if chore_index.get(chore_id) is coordinator:
+                    del chore_index[chore_id]
 
     # Remove services if no more entries
-    remaining = {
-        k: v for k, v in hass.data[DOMAIN].items()
-        if k != "yaml_config" and isinstance(v, dict) and "coordinator" in v
-    }
-    if not remaining:
+    if not entries:
         _async_remove_services(hass)
 
     return unload_ok
 
 
+# ── Devices ─────────────────────────────────────────────────────────
+
+
+@callback
+def _async_register_devices(
+    device_registry: dr.DeviceRegistry, entry_id: str, chores: Iterable[Chore]
+) -> None:
+    """Create or update the device for every chore in a single registry pass."""
+    for chore in chores:
+        device_registry.async_get_or_create(
+            config_entry_id=entry_id,
+            identifiers={(DOMAIN, chore.id)},
+            name=chore.name,
+            manufacturer="Chores",
+            model=chore.model_label,
+            sw_version="2.0.0",
+        )
+
+
+@callback
+def _async_remove_orphaned_devices(
+    device_registry: dr.DeviceRegistry, entry_id: str, current_chore_ids: set[str]
+) -> None:
+    """Remove devices whose chores are no longer configured."""
+    for device in dr.async_entries_for_config_entry(device_registry, entry_id):
+        chore_ids_for_device = {
+            identifier[1]
+            for identifier in device.identifiers
+            if identifier[0] == DOMAIN
+        }
+        if chore_ids_for_device and not chore_ids_for_device & current_chore_ids:
+            _LOGGER.info(
+                "Removing orphaned device %s (chore IDs %s no longer in YAML)",
+                device.name,
+                chore_ids_for_device,
+            )
+            device_registry.async_remove_device(device.id)
+
+
 # ── Services ────────────────────────────────────────────────────────
 
 
 def _async_setup_services(hass: HomeAssistant) -> None:
     """Set up global Chores services."""
-    from .const import ATTR_CHORE_ID, SERVICE_FORCE_COMPLETE, SERVICE_FORCE_DUE, SERVICE_FORCE_INACTIVE, SERVICE_RELOAD
+    domain_data = hass.data[DOMAIN]
+    if domain_data.get("services_registered"):
+        return
 
-    if hass.services.has_service(DOMAIN, SERVICE_FORCE_DUE):
-        return  # Already registered
-
-    async def _get_coordinator(chore_id: str) -> ChoresCoordinator | None:
-        for entry_data in hass.data[DOMAIN].values():
-            if isinstance(entry_data, dict) and "coordinator" in entry_data:
-                coordinator: ChoresCoordinator = entry_data["coordinator"]
-                if coordinator.get_chore(chore_id):
-                    return coordinator
-        return None
+    def _get_coordinator(chore_id: str) -> ChoresCoordinator | None:
+        return hass.data[DOMAIN].get("chore_index", {}).get(chore_id)
 
     async def handle_force_due(call) -> None:
         chore_id = call.data[ATTR_CHORE_ID]
-        coordinator = await _get_coordinator(chore_id)
+        coordinator = _get_coordinator(chore_id)
         if coordinator:
             await coordinator.async_force_due(chore_id)
         else:
@@ -484,7 +446,7 @@ def _async_setup_services(hass: HomeAssistant) -> None:
 
     async def handle_force_inactive(call) -> None:
         chore_id = call.data[ATTR_CHORE_ID]
-        coordinator = await _get_coordinator(chore_id)
+        coordinator = _get_coordinator(chore_id)
         if coordinator:
             await coordinator.async_force_inactive(chore_id)
         else:
@@ -492,7 +454,7 @@ def _async_setup_services(hass: HomeAssistant) -> None:
 
     async def handle_force_complete(call) -> None:
         chore_id = call.data[ATTR_CHORE_ID]
-        coordinator = await _get_coordinator(chore_id)
+        coordinator = _get_coordinator(chore_id)
         if coordinator:
             await coordinator.async_force_complete(chore_id)
         else:
@@ -522,28 +484,22 @@ def _async_setup_services(hass: HomeAssistant) -> None:
 
         _LOGGER.info("Chores integration reloaded successfully")
 
-    service_schema = vol.Schema(
-        {
-            vol.Required(ATTR_CHORE_ID): cv.string,
-        }
-    )
-
     hass.services.async_register(
-        DOMAIN, SERVICE_FORCE_DUE, handle_force_due, schema=service_schema
+        DOMAIN, SERVICE_FORCE_DUE, handle_force_due, schema=SERVICE_SCHEMA
     )
     hass.services.async_register(
-        DOMAIN, SERVICE_FORCE_INACTIVE, handle_force_inactive, schema=service_schema
+        DOMAIN, SERVICE_FORCE_INACTIVE, handle_force_inactive, schema=SERVICE_SCHEMA
     )
     hass.services.async_register(
-        DOMAIN, SERVICE_FORCE_COMPLETE, handle_force_complete, schema=service_schema
+        DOMAIN, SERVICE_FORCE_COMPLETE, handle_force_complete, schema=SERVICE_SCHEMA
     )
     async_register_admin_service(hass, DOMAIN, SERVICE_RELOAD, handle_reload)
+    domain_data["services_registered"] = True
 
 
 def _async_remove_services(hass: HomeAssistant) -> None:
     """Remove Chores services."""
-    from .const import SERVICE_FORCE_COMPLETE, SERVICE_FORCE_DUE, SERVICE_FORCE_INACTIVE, SERVICE_RELOAD
-
+    hass.data[DOMAIN].pop("services_registered", None)
     hass.services.async_remove(DOMAIN, SERVICE_FORCE_DUE)
     hass.services.async_remove(DOMAIN, SERVICE_FORCE_INACTIVE)
     hass.services.async_remove(DOMAIN, SERVICE_FORCE_COMPLETE)
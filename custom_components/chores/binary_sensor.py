@@ -14,7 +14,6 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -24,6 +23,11 @@ from .coordinator import ChoresCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Chore states in which the chore needs attention
+_ATTENTION_STATES: frozenset[ChoreState] = frozenset(
+    {ChoreState.DUE, ChoreState.STARTED}
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,7 +35,9 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up binary sensor entities."""
-    coordinator: ChoresCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator: ChoresCoordinator = hass.data[DOMAIN]["entries"][entry.entry_id][
+        "coordinator"
+    ]
 
     entities = [
         NeedsAttentionBinarySensor(coordinator, chore, entry)
@@ -45,6 +51,8 @@ class NeedsAttentionBinarySensor(
 ):
     """Binary sensor that is ON when a chore needs attention (due or started)."""
 
+    __slots__ = ("_chore", "_attrs_cache")
+
     _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
 
@@ -56,26 +64,27 @@ class NeedsAttentionBinarySensor(
     ) -> None:
         super().__init__(coordinator)
         self._chore = chore
+        self._attrs_cache: dict[str, Any] | None = None
         self._attr_unique_id = f"{DOMAIN}_{chore.id}_needs_attention"
         self._attr_name = "Needs Attention"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, chore.id)},
-        )
+        self._attr_device_info = chore.device_info
 
     @property
     def is_on(self) -> bool:
-        return self._chore.state in (ChoreState.DUE, ChoreState.STARTED)
+        return self._chore.state in _ATTENTION_STATES
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        return {
-            "chore_id": self._chore.id,
-            "chore_state": self._chore.state.value,
-            "due_since": (
-                self._chore.due_since.isoformat() if self._chore.due_since else None
-            ),
-        }
+        # Rebuilt only after a coordinator update invalidates the cache
+        if self._attrs_cache is None:
+            self._attrs_cache = {
+                "chore_id": self._chore.id,
+                "chore_state": self._chore.state.value,
+                "due_since": self._chore.due_since_iso,
+            }
+        return self._attrs_cache
 
     @callback
     def _handle_coordinator_update(self) -> None:
+        self._attrs_cache = None
         self.async_write_ha_state()
@@ -1,19 +1,18 @@
 """Button entities for the Chores integration.
 
-Creates 3 buttons per chore:
-  - ForceDueButton: force to 'due' from any state
-  - ForceInactiveButton: force to 'inactive' from any state
-  - ForceCompleteButton: force to 'completed' from any state
+Creates 3 buttons per chore, all driven by the FORCE_BUTTONS table:
+  - force_due: force to 'due' from any state
+  - force_inactive: force to 'inactive' from any state
+  - force_complete: force to 'completed' from any state
 """
 from __future__ import annotations
 
 import logging
-from typing import Any
+from dataclasses import dataclass
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .chore_core import Chore
@@ -23,70 +22,61 @@ from .coordinator import ChoresCoordinator
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class ForceButtonSpec:
+    """Static description of a force button."""
+
+    key: str  # unique_id suffix, e.g. "force_due"
+    name: str
+    icon: str
+    action: str  # ChoresCoordinator coroutine method taking a chore_id
+
+
+FORCE_BUTTONS: tuple[ForceButtonSpec, ...] = (
+    ForceButtonSpec("force_due", "Force Due", "mdi:alert-circle", "async_force_due"),
+    ForceButtonSpec(
+        "force_inactive", "Force Inactive", "mdi:cancel", "async_force_inactive"
+    ),
+    ForceButtonSpec(
+        "force_complete", "Force Complete", "mdi:check-circle", "async_force_complete"
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up button entities."""
-    coordinator: ChoresCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator: ChoresCoordinator = hass.data[DOMAIN]["entries"][entry.entry_id][
+        "coordinator"
+    ]
 
-    entities: list[ButtonEntity] = []
-    for chore in coordinator.chores.values():
-        entities.append(ForceDueButton(coordinator, chore))
-        entities.append(ForceInactiveButton(coordinator, chore))
-        entities.append(ForceCompleteButton(coordinator, chore))
+    async_add_entities(
+        ChoreForceButton(coordinator, chore, spec)
+        for chore in coordinator.chores.values()
+        for spec in FORCE_BUTTONS
+    )
 
-    async_add_entities(entities)
 
+class ChoreForceButton(ButtonEntity):
+    """Button that forces a chore into a state via the coordinator."""
 
-class _ChoreButtonBase(ButtonEntity):
-    """Base class for chore force buttons."""
+    __slots__ = ("_coordinator", "_chore", "_action")
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: ChoresCoordinator, chore: Chore) -> None:
+    def __init__(
+        self, coordinator: ChoresCoordinator, chore: Chore, spec: ForceButtonSpec
+    ) -> None:
         self._coordinator = coordinator
         self._chore = chore
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, chore.id)},
-        )
-
-
-class ForceDueButton(_ChoreButtonBase):
-    """Button to force chore to 'due'."""
-
-    def __init__(self, coordinator: ChoresCoordinator, chore: Chore) -> None:
-        super().__init__(coordinator, chore)
-        self._attr_unique_id = f"{DOMAIN}_{chore.id}_force_due"
-        self._attr_name = "Force Due"
-        self._attr_icon = "mdi:alert-circle"
-
-    async def async_press(self) -> None:
-        await self._coordinator.async_force_due(self._chore.id)
-
-
-class ForceInactiveButton(_ChoreButtonBase):
-    """Button to force chore to 'inactive'."""
-
-    def __init__(self, coordinator: ChoresCoordinator, chore: Chore) -> None:
-        super().__init__(coordinator, chore)
-        self._attr_unique_id = f"{DOMAIN}_{chore.id}_force_inactive"
-        self._attr_name = "Force Inactive"
-        self._attr_icon = "mdi:cancel"
-
-    async def async_press(self) -> None:
-        await self._coordinator.async_force_inactive(self._chore.id)
-
-
-class ForceCompleteButton(_ChoreButtonBase):
-    """Button to force chore to 'completed'."""
-
-    def __init__(self, coordinator: ChoresCoordinator, chore: Chore) -> None:
-        super().__init__(coordinator, chore)
-        self._attr_unique_id = f"{DOMAIN}_{chore.id}_force_complete"
-        self._attr_name = "Force Complete"
-        self._attr_icon = "mdi:check-circle"
+        self._action = spec.action
+        self._attr_unique_id = f"{DOMAIN}_{chore.id}_{spec.key}"
+        self._attr_name = spec.name
+        self._attr_icon = spec.icon
+        self._attr_device_info = chore.device_info
 
     async def async_press(self) -> None:
-        await self._coordinator.async_force_complete(self._chore.id)
+        await getattr(self._coordinator, self._action)(self._chore.id)
@@ -7,10 +7,14 @@ trigger/completion/reset modules.
 from __future__ import annotations
 
 import logging
+from collections import deque
+from collections.abc import Callable, Mapping
 from datetime import datetime, time, timedelta
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.util import dt as dt_util
 
 from .completions import CompletionStage, create_completion
@@ -36,6 +40,7 @@ from .const import (
     ChoreState,
     CompletionType,
     DEFAULT_ICON,
+    DOMAIN,
     SubState,
 )
 from .resets import BaseReset, create_reset
@@ -43,6 +48,42 @@ from .triggers import TriggerStage, create_trigger
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bound once for the per-poll state machine paths below
+_utcnow = dt_util.utcnow
+_IDLE = SubState.IDLE
+_ACTIVE = SubState.ACTIVE
+_DONE = SubState.DONE
+_INACTIVE = ChoreState.INACTIVE
+_PENDING = ChoreState.PENDING
+_DUE = ChoreState.DUE
+_STARTED = ChoreState.STARTED
+_COMPLETED = ChoreState.COMPLETED
+
+
+def _iso(value: datetime) -> str:
+    """Format a chore timestamp for attributes and persistence (whole seconds)."""
+    return value.isoformat(timespec="seconds")
+
+
+_HISTORY_MAX = 100  # completion records kept in memory and persisted
+
+# completed_by labels; history records store the index
+_COMPLETED_BY: tuple[str, ...] = ("forced", "manual", "sensor")
+_BY_FORCED, _BY_MANUAL, _BY_SENSOR = range(len(_COMPLETED_BY))
+_COMPLETED_BY_INDEX: dict[str, int] = {
+    label: index for index, label in enumerate(_COMPLETED_BY)
+}
+
+# Shared by every chore that does not override them; never mutated.
+_DEFAULT_STATE_LABELS: Mapping[str, str] = MappingProxyType({
+    state.value: state.value.capitalize() for state in ChoreState
+})
+_NO_STATE_ICONS: Mapping[ChoreState, str] = MappingProxyType({})
+# (state, config key) for the optional per-state icon overrides
+_STATE_ICON_KEYS: tuple[tuple[ChoreState, str], ...] = tuple(
+    (state, f"icon_{state.value}") for state in ChoreState
+)
+
 
 class Chore:
     """State machine orchestrator for a single chore.
@@ -50,60 +91,133 @@ class Chore:
     Manages the lifecycle: inactive -> pending -> due -> started -> completed -> inactive
     """
 
+    __slots__ = (
+        "_id",
+        "_name",
+        "_description",
+        "_context",
+        "_icon",
+        "_trigger",
+        "_completion",
+        "_reset",
+        "_trigger_needs_poll",
+        "_completion_needs_poll",
+        "_model_label",
+        "_device_info",
+        "_state_labels",
+        "_state_icons",
+        "_notify_at",
+        "_notify_after_minutes",
+        "_completion_is_manual",
+        "_completion_button_entity_id",
+        "_on_update",
+        "_state",
+        "_state_entered_at",
+        "_due_since",
+        "_last_completed",
+        "_state_entered_at_iso",
+        "_due_since_iso",
+        "_last_completed_iso",
+        "_forced",
+        "_settled",
+        "_reset_at",
+        "_state_dict_cache",
+        "_state_dict_key",
+        "_next_due_cache",
+        "_completion_history",
+        "_history_records",
+        "_last_completed_by",
+    )
+
     def __init__(self, config: dict[str, Any]) -> None:
+        get = config.get
         self._id: str = config["id"]
         self._name: str = config["name"]
-        self._description: str | None = config.get("description")
-        self._context: str | None = config.get("context")
-        self._icon: str = config.get("icon", "mdi:checkbox-marked-circle-outline")
+        self._description: str | None = get("description")
+        self._context: str | None = get("context")
+        self._icon: str = get("icon", DEFAULT_ICON)
 
         # Build components from config
-        self._trigger: TriggerStage = create_trigger(config["trigger"])
-        self._completion: CompletionStage = create_completion(
-            config.get("completion", {"type": "manual"})
-        )
+        trigger_config = config["trigger"]
+        self._trigger: TriggerStage = create_trigger(trigger_config)
+        self._completion: CompletionStage = create_completion(get("completion"))
         self._reset: BaseReset = create_reset(
-            config.get("reset"),
+            get("reset"),
             self._trigger.trigger_type,
-            config["trigger"],
+            trigger_config,
         )
 
-        # State labels (default to capitalized state names)
-        state_labels_config = config.get("state_labels", {})
-        self._state_labels: dict[str, str] = {
-            "inactive": state_labels_config.get("inactive", "Inactive"),
-            "pending": state_labels_config.get("pending", "Pending"),
-            "due": state_labels_config.get("due", "Due"),
-            "started": state_labels_config.get("started", "Started"),
-            "completed": state_labels_config.get("completed", "Completed"),
-        }
+        # Stages whose evaluate() is a no-op are skipped on coordinator polls
+        self._trigger_needs_poll: bool = self._trigger.needs_poll
+        self._completion_needs_poll: bool = self._completion.needs_poll
+
+        # Device model shown in the device registry, e.g. "Power Cycle"
+        self._model_label: str = self.trigger_type.replace("_", " ").title()
+        # Device link shared by every entity of this chore across platforms
+        self._device_info = DeviceInfo(identifiers={(DOMAIN, self._id)})
+
+        # State labels; chores without overrides share _DEFAULT_STATE_LABELS
+        state_labels_config = get("state_labels")
+        self._state_labels: Mapping[str, str] = (
+            {**_DEFAULT_STATE_LABELS, **state_labels_config}
+            if state_labels_config
+            else _DEFAULT_STATE_LABELS
+        )
 
-        # Per-state icons (optional; fall back to single icon then DEFAULT_ICON)
-        default_icon = config.get("icon", DEFAULT_ICON)
-        self._state_icons: dict[ChoreState, str] = {
-            ChoreState.INACTIVE: config.get("icon_inactive") or default_icon,
-            ChoreState.PENDING: config.get("icon_pending") or default_icon,
-            ChoreState.DUE: config.get("icon_due") or default_icon,
-            ChoreState.STARTED: config.get("icon_started") or default_icon,
-            ChoreState.COMPLETED: config.get("icon_completed") or default_icon,
+        # Per-state icon overrides only; icon_for_state falls back to self._icon
+        state_icons = {
+            state: icon
+            for state, key in _STATE_ICON_KEYS
+            if (icon := get(key))
         }
+        self._state_icons: Mapping[ChoreState, str] = state_icons or _NO_STATE_ICONS
 
         # Notification timing config
-        self._notify_at: time | None = config.get("notify_at")
-        self._notify_after_minutes: int | None = config.get("notify_after_minutes")
+        self._notify_at: time | None = get("notify_at")
+        self._notify_after_minutes: int | None = get("notify_after_minutes")
 
+        self._completion_is_manual: bool = (
+            self._completion.completion_type is CompletionType.MANUAL
+        )
         # Resolved entity_id for completion button (manual only); set by coordinator
         self._completion_button_entity_id: str | None = None
 
+        # Stored by async_setup_listeners for the shared _fire_update callback
+        self._on_update: Callable[[str, ChoreState, ChoreState], None] | None = None
+
         # State
         self._state: ChoreState = ChoreState.INACTIVE
         self._state_entered_at: datetime = dt_util.utcnow()
         self._due_since: datetime | None = None
         self._last_completed: datetime | None = None
+        # ISO strings of the timestamps above, formatted once on assignment
+        self._state_entered_at_iso: str = _iso(self._state_entered_at)
+        self._due_since_iso: str | None = None
+        self._last_completed_iso: str | None = None
         self._forced: bool = False
 
+        # (state, trigger state, completion state) of the last evaluate that
+        # made no transition; the same inputs cannot transition either.
+        self._settled: tuple[ChoreState, SubState, SubState] | None = None
+        # When the current completion resets, once the reset has given a
+        # deadline for it; None until then (or for resets without one)
+        self._reset_at: datetime | None = None
+
+        # to_state_dict() cache, valid while (state, trigger state, completion
+        # state) is unchanged; cleared on transitions and restores.
+        self._state_dict_cache: dict[str, Any] | None = None
+        self._state_dict_key: tuple[ChoreState, SubState, SubState] | None = None
+        # (next_due, next_due ISO) for _next_due_iso()
+        self._next_due_cache: tuple[datetime, str] | None = None
+
         # Completion history for stats
-        self._completion_history: list[dict[str, Any]] = []
+        # (completed_at epoch seconds, _COMPLETED_BY index), newest last
+        self._completion_history: deque[tuple[float, int]] = deque(
+            maxlen=_HISTORY_MAX
+        )
+        self._last_completed_by: str | None = None
+        # completion_history in its persisted shape; rebuilt after changes
+        self._history_records: list[dict[str, Any]] | None = None
 
     # ── Properties ──────────────────────────────────────────────────
 
@@ -121,7 +235,7 @@ class Chore:
 
     def icon_for_state(self, state: ChoreState) -> str:
         """Return icon for a given chore state (uses per-state config or fallback)."""
-        return self._state_icons.get(state, self._icon or DEFAULT_ICON)
+        return self._state_icons.get(state, self._icon)
 
     @property
     def state(self) -> ChoreState:
@@ -135,6 +249,10 @@ class Chore:
     def due_since(self) -> datetime | None:
         return self._due_since
 
+    @property
+    def due_since_iso(self) -> str | None:
+        return self._due_since_iso
+
     @property
     def last_completed(self) -> datetime | None:
         return self._last_completed
@@ -143,6 +261,16 @@ class Chore:
     def forced(self) -> bool:
         return self._forced
 
+    @property
+    def completion_button_entity_id(self) -> str | None:
+        """Entity id of the force-complete button (manual completions only)."""
+        return self._completion_button_entity_id
+
+    @completion_button_entity_id.setter
+    def completion_button_entity_id(self, entity_id: str | None) -> None:
+        self._completion_button_entity_id = entity_id
+        self._state_dict_cache = None
+
     @property
     def trigger(self) -> TriggerStage:
         return self._trigger
@@ -163,11 +291,40 @@ class Chore:
     def completion_type(self) -> str:
         return self._completion.completion_type.value
 
+    @property
+    def completion_is_manual(self) -> bool:
+        return self._completion_is_manual
+
+    @property
+    def model_label(self) -> str:
+        """Human-readable trigger type used as the device model."""
+        return self._model_label
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Device link for this chore's entities (built once, shared)."""
+        return self._device_info
+
     @property
     def next_due(self) -> datetime | None:
         """Next predicted due time (detectors that support it, e.g. daily/weekly)."""
         return self._trigger.next_trigger_datetime
 
+    def _next_due_iso(self) -> str | None:
+        """ISO string of next_due, reused until that moment has passed.
+
+        The predicted time only moves forward once the clock reaches it, so
+        the formatted value stays valid while now < next_due.
+        """
+        cached = self._next_due_cache
+        if cached is not None and _utcnow() < cached[0]:
+            return cached[1]
+        next_due = self.next_due
+        if next_due is None:
+            return None
+        self._next_due_cache = (next_due, _iso(next_due))
+        return self._next_due_cache[1]
+
     @property
     def notify_at(self) -> time | None:
         """Return configured notify_at time, or None."""
@@ -211,110 +368,151 @@ class Chore:
     @property
     def state_label(self) -> str:
         """Return human-readable label for current state."""
-        return self._state_labels.get(self._state.value, self._state.value.capitalize())
+        # Every state has a label (defaults are merged in), and ChoreState
+        # hashes like its string value, so this is a single dict probe.
+        return self._state_labels[self._state]
 
     # ── State transitions ───────────────────────────────────────────
 
     def _set_state(self, new_state: ChoreState, forced: bool = False) -> ChoreState | None:
         """Set chore state. Returns old state if changed, None otherwise."""
-        if new_state == self._state:
+        if new_state is self._state:
             return None
         old = self._state
+        now = _utcnow()
+        now_iso = _iso(now)
         self._state = new_state
-        self._state_entered_at = dt_util.utcnow()
+        self._state_entered_at = now
+        self._state_entered_at_iso = now_iso
         self._forced = forced
-
-        if new_state == ChoreState.DUE:
-            self._due_since = dt_util.utcnow()
-        elif new_state == ChoreState.COMPLETED:
-            self._last_completed = dt_util.utcnow()
-            self._record_completion(forced)
-        elif new_state == ChoreState.INACTIVE:
+        self._state_dict_cache = None
+        self._reset_at = None
+
+        if new_state is _DUE:
+            self._due_since = now
+            self._due_since_iso = now_iso
+        elif new_state is _COMPLETED:
+            self._last_completed = now
+            self._last_completed_iso = now_iso
+            self._record_completion(now, forced)
+        elif new_state is _INACTIVE:
             self._due_since = None
+            self._due_since_iso = None
 
         _LOGGER.debug("Chore %s: %s -> %s%s", self._id, old, new_state, " (forced)" if forced else "")
         return old
 
-    def _record_completion(self, forced: bool) -> None:
+    def _record_completion(self, now: datetime, forced: bool) -> None:
         """Record a completion in history."""
-        record = {
-            "completed_at": dt_util.utcnow().isoformat(),
-            "completed_by": "forced" if forced else (
-                "manual" if self._completion.completion_type.value == "manual"
-                else "sensor"
-            ),
-        }
-        self._completion_history.append(record)
-        # Keep last 100 records in memory
-        if len(self._completion_history) > 100:
-            self._completion_history = self._completion_history[-100:]
+        by = _BY_FORCED if forced else (
+            _BY_MANUAL if self._completion_is_manual else _BY_SENSOR
+        )
+        self._completion_history.append((now.timestamp(), by))
+        self._last_completed_by = _COMPLETED_BY[by]
+        self._history_records = None
 
     # ── Core evaluate (called on every coordinator poll) ────────────
 
-    def evaluate(self, hass: HomeAssistant) -> ChoreState | None:
-        """Evaluate state machine. Returns old state if changed, None if unchanged."""
+    def evaluate(
+        self, hass: HomeAssistant, now: datetime | None = None
+    ) -> ChoreState | None:
+        """Evaluate state machine. Returns old state if changed, None if unchanged.
+
+        ``now`` is the poll's UTC timestamp, handed to the time-based detectors.
+        """
         # Let trigger and completion evaluate (for time-based/polling checks)
-        self._trigger.evaluate(hass)
-        self._completion.evaluate(hass)
+        if self._trigger_needs_poll:
+            self._trigger.evaluate(hass, now)
+        if self._completion_needs_poll:
+            self._completion.evaluate(hass, now)
+        return self._advance()
+
+    def _advance(self) -> ChoreState | None:
+        """Apply at most one transition for the current stage states."""
+        inputs = (self._state, self._trigger.state, self._completion.state)
+        if inputs == self._settled:
+            return None
 
         # Check for state transitions based on current state
-        if self._state == ChoreState.INACTIVE:
-            return self._evaluate_inactive()
-        elif self._state == ChoreState.PENDING:
-            return self._evaluate_pending()
-        elif self._state == ChoreState.DUE:
-            return self._evaluate_due()
-        elif self._state == ChoreState.STARTED:
-            return self._evaluate_started()
-        elif self._state == ChoreState.COMPLETED:
-            return self._evaluate_completed()
-        return None
+        old = self._EVALUATORS[self._state](self)
+
+        # Completed depends on wall time (reset), so it never settles
+        if old is None and self._state is not _COMPLETED:
+            self._settled = inputs
+        else:
+            self._settled = None
+        return old
 
     def _evaluate_inactive(self) -> ChoreState | None:
         """inactive: wait for trigger."""
-        if self._trigger.state == SubState.DONE:
+        trigger_state = self._trigger.state
+        if trigger_state is _DONE:
             self._completion.enable()
-            return self._set_state(ChoreState.DUE)
-        if self._trigger.state == SubState.ACTIVE:
-            return self._set_state(ChoreState.PENDING)
+            return self._set_state(_DUE)
+        if trigger_state is _ACTIVE:
+            return self._set_state(_PENDING)
         return None
 
     def _evaluate_pending(self) -> ChoreState | None:
         """pending: wait for trigger to complete (gate) or fall back to idle."""
-        if self._trigger.state == SubState.DONE:
+        trigger_state = self._trigger.state
+        if trigger_state is _DONE:
             self._completion.enable()
-            return self._set_state(ChoreState.DUE)
-        if self._trigger.state == SubState.IDLE:
-            return self._set_state(ChoreState.INACTIVE)
+            return self._set_state(_DUE)
+        if trigger_state is _IDLE:
+            return self._set_state(_INACTIVE)
         return None
 
     def _evaluate_due(self) -> ChoreState | None:
         """due: wait for completion."""
-        if self._completion.state == SubState.DONE:
-            return self._set_state(ChoreState.COMPLETED)
-        if self._completion.state == SubState.ACTIVE:
-            return self._set_state(ChoreState.STARTED)
+        completion_state = self._completion.state
+        if completion_state is _DONE:
+            return self._set_state(_COMPLETED)
+        if completion_state is _ACTIVE:
+            return self._set_state(_STARTED)
         return None
 
     def _evaluate_started(self) -> ChoreState | None:
         """started: wait for completion step 2."""
-        if self._completion.state == SubState.DONE:
-            return self._set_state(ChoreState.COMPLETED)
+        if self._completion.state is _DONE:
+            return self._set_state(_COMPLETED)
         return None
 
     def _evaluate_completed(self) -> ChoreState | None:
-        """completed: wait for reset condition."""
-        if self._reset.should_reset(self._state_entered_at):
-            self._trigger.reset()
-            self._completion.reset()
-            return self._set_state(ChoreState.INACTIVE)
-        return None
+        """completed: wait for reset condition.
+
+        Resets with a deadline are asked for it once per completion; each
+        poll then only compares it with the clock.
+        """
+        reset_at = self._reset_at
+        if reset_at is None:
+            reset_at = self._reset_at = self._reset.next_reset_at(
+                self._state_entered_at
+            )
+        if reset_at is not None:
+            # Same clock as the resets' own should_reset
+            if dt_util.now() < reset_at:
+                return None
+        elif not self._reset.should_reset(self._state_entered_at):
+            return None
+        self._trigger.reset()
+        self._completion.reset()
+        return self._set_state(_INACTIVE)
+
+    # Transition step for each state, dispatched by evaluate()
+    _EVALUATORS: dict[ChoreState, Callable[[Chore], ChoreState | None]] = {
+        ChoreState.INACTIVE: _evaluate_inactive,
+        ChoreState.PENDING: _evaluate_pending,
+        ChoreState.DUE: _evaluate_due,
+        ChoreState.STARTED: _evaluate_started,
+        ChoreState.COMPLETED: _evaluate_completed,
+    }
 
     # ── Force actions ───────────────────────────────────────────────
 
     def force_due(self) -> ChoreState | None:
         """Force chore to due from any state."""
-        self._trigger.set_state(SubState.DONE)
+        self._trigger.set_state(_DONE)
         self._completion.reset()
         self._completion.enable()
         return self._set_state(ChoreState.DUE, forced=True)
@@ -327,31 +525,33 @@ class Chore:
 
     def force_complete(self) -> ChoreState | None:
         """Force chore to completed from any state."""
-        self._completion.set_state(SubState.DONE)
+        self._completion.set_state(_DONE)
         self._completion.disable()
         return self._set_state(ChoreState.COMPLETED, forced=True)
 
     # ── Listener setup ──────────────────────────────────────────────
 
-    def async_setup_listeners(self, hass: HomeAssistant, on_update: callback) -> None:
+    def async_setup_listeners(
+        self,
+        hass: HomeAssistant,
+        on_update: Callable[[str, ChoreState, ChoreState], None],
+    ) -> None:
         """Set up all event listeners for this chore."""
-
-        @callback
-        def _on_trigger_change() -> None:
-            """Called when trigger state changes."""
-            old = self.evaluate(hass)
-            if old is not None:
-                on_update(self._id, old, self._state)
-
-        @callback
-        def _on_completion_change() -> None:
-            """Called when completion state changes."""
-            old = self.evaluate(hass)
-            if old is not None:
-                on_update(self._id, old, self._state)
-
-        self._trigger.async_setup_listeners(hass, _on_trigger_change)
-        self._completion.async_setup_listeners(hass, _on_completion_change)
+        self._on_update = on_update
+        self._trigger.async_setup_listeners(hass, self._fire_update)
+        self._completion.async_setup_listeners(hass, self._fire_update)
+
+    @callback
+    def _fire_update(self) -> None:
+        """Re-evaluate after a trigger or completion state change.
+
+        The stage already applied the event, so the time-based stage polls
+        are left to the coordinator; a burst of events that leaves the
+        stage states unchanged stops at the settled-inputs check.
+        """
+        old = self._advance()
+        if old is not None:
+            self._on_update(self._id, old, self._state)
 
     def async_remove_listeners(self) -> None:
         """Remove all event listeners."""
@@ -362,25 +562,37 @@ class Chore:
 
     def to_state_dict(self, hass: HomeAssistant) -> dict[str, Any]:
         """Return the full state dict for entities to consume."""
+        key = (self._state, self._trigger.state, self._completion.state)
+        if self._state_dict_cache is None or key != self._state_dict_key:
+            self._state_dict_cache = self._build_state_dict()
+            self._state_dict_key = key
+        result = self._state_dict_cache.copy()
+        # next_due follows the wall clock, so it is kept out of the cache above
+        result[ATTR_NEXT_DUE] = self._next_due_iso()
+        return result
+
+    def _build_state_dict(self) -> dict[str, Any]:
+        """Build the cacheable part of the state dict."""
+        notify_after = self.notify_after
         result: dict[str, Any] = {
             ATTR_CHORE_ID: self._id,
             ATTR_DESCRIPTION: self._description,
             ATTR_CONTEXT: self._context,
             ATTR_CHORE_TYPE: self._trigger.trigger_type.value,
-            ATTR_DUE_SINCE: self._due_since.isoformat() if self._due_since else None,
-            ATTR_LAST_COMPLETED: self._last_completed.isoformat() if self._last_completed else None,
-            ATTR_NEXT_DUE: self.next_due.isoformat() if self.next_due else None,
-            ATTR_STATE_ENTERED_AT: self._state_entered_at.isoformat(),
+            ATTR_DUE_SINCE: self._due_since_iso,
+            ATTR_LAST_COMPLETED: self._last_completed_iso,
+            ATTR_NEXT_DUE: None,
+            ATTR_STATE_ENTERED_AT: self._state_entered_at_iso,
             ATTR_STATE_LABEL: self.state_label,
             ATTR_TRIGGER_STATE: self._trigger.state.value,
             ATTR_COMPLETION_STATE: self._completion.state.value,
             ATTR_COMPLETION_TYPE: self._completion.completion_type.value,
             ATTR_FORCED: self._forced,
-            ATTR_NOTIFY_AFTER: self.notify_after.isoformat() if self.notify_after else None,
+            ATTR_NOTIFY_AFTER: _iso(notify_after) if notify_after else None,
             ATTR_NOTIFY_AT: self.notify_at_str,
             ATTR_NOTIFY_AFTER_MINUTES: self._notify_after_minutes,
         }
-        if self._completion.completion_type == CompletionType.MANUAL and self._completion_button_entity_id:
+        if self._completion_is_manual and self._completion_button_entity_id:
             result[ATTR_COMPLETION_BUTTON] = self._completion_button_entity_id
         return result
 
@@ -390,13 +602,13 @@ class Chore:
         """Return full state for persistence."""
         return {
             "chore_state": self._state.value,
-            "state_entered_at": self._state_entered_at.isoformat(),
-            "due_since": self._due_since.isoformat() if self._due_since else None,
-            "last_completed": self._last_completed.isoformat() if self._last_completed else None,
+            "state_entered_at": self._state_entered_at_iso,
+            "due_since": self._due_since_iso,
+            "last_completed": self._last_completed_iso,
             "forced": self._forced,
             "trigger": self._trigger.snapshot_state(),
             "completion": self._completion.snapshot_state(),
-            "completion_history": self._completion_history[-100:],
+            "completion_history": self.completion_history,
         }
 
     def restore_state(self, data: dict[str, Any]) -> None:
@@ -405,34 +617,56 @@ class Chore:
             self._state = ChoreState(data["chore_state"])
         if "state_entered_at" in data:
             self._state_entered_at = dt_util.parse_datetime(data["state_entered_at"]) or dt_util.utcnow()
+            self._state_entered_at_iso = _iso(self._state_entered_at)
         if data.get("due_since"):
             self._due_since = dt_util.parse_datetime(data["due_since"])
+            self._due_since_iso = _iso(self._due_since) if self._due_since else None
         if data.get("last_completed"):
             self._last_completed = dt_util.parse_datetime(data["last_completed"])
+            self._last_completed_iso = (
+                _iso(self._last_completed) if self._last_completed else None
+            )
         self._forced = data.get("forced", False)
+        self._state_dict_cache = None
+        self._reset_at = None
         if "trigger" in data:
             self._trigger.restore_state(data["trigger"])
         if "completion" in data:
             self._completion.restore_state(data["completion"])
-        self._completion_history = data.get("completion_history", [])
+        self._completion_history.clear()
+        self._history_records = None
+        for record in data.get("completion_history", []):
+            completed_at = dt_util.parse_datetime(record.get("completed_at") or "")
+            completed_by = _COMPLETED_BY_INDEX.get(record.get("completed_by"))
+            if completed_at is None or completed_by is None:
+                continue
+            self._completion_history.append((completed_at.timestamp(), completed_by))
+        self._last_completed_by = (
+            _COMPLETED_BY[self._completion_history[-1][1]]
+            if self._completion_history
+            else None
+        )
 
     # ── Completion history helpers ──────────────────────────────────
 
     @property
     def completion_history(self) -> list[dict[str, Any]]:
-        return self._completion_history
+        """Completion records in their persisted (list of dicts) shape."""
+        if self._history_records is None:
+            self._history_records = [
+                {
+                    "completed_at": _iso(dt_util.utc_from_timestamp(ts)),
+                    "completed_by": _COMPLETED_BY[by],
+                }
+                for ts, by in self._completion_history
+            ]
+        return self._history_records
 
     def completion_count_since(self, since: datetime) -> int:
         """Count completions since a given datetime."""
-        count = 0
-        for record in self._completion_history:
-            completed_at = dt_util.parse_datetime(record["completed_at"])
-            if completed_at and completed_at >= since:
-                count += 1
-        return count
+        cutoff = since.timestamp()
+        return sum(1 for ts, _ in self._completion_history if ts >= cutoff)
 
     def last_completed_by(self) -> str | None:
         """Return how the last completion was triggered."""
-        if self._completion_history:
-            return self._completion_history[-1].get("completed_by")
-        return None
+        return self._last_completed_by
@@ -19,7 +19,7 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 
 from .const import CompletionType, DetectorType, SubState
 from .detectors import BaseDetector, create_detector
@@ -27,6 +27,14 @@ from .gate import Gate
 
 _LOGGER = logging.getLogger(__name__)
 
+_ACTIVE = SubState.ACTIVE
+_DONE = SubState.DONE
+
+_STEPS_ACTIVE = 1  # an ACTIVE detector has completed its first step
+
+# Shared by every chore without a completion block; never mutated
+_DEFAULT_COMPLETION_CONFIG: dict[str, Any] = {"type": CompletionType.MANUAL.value}
+
 __all__ = [
     "CompletionStage",
     "BaseCompletion",
@@ -41,17 +49,29 @@ class CompletionStage:
     tracking, and an optional Gate.
     """
 
+    __slots__ = (
+        "_detector",
+        "_completion_type",
+        "_gate",
+        "_gate_holding",
+        "_enabled",
+        "_steps_done",
+        "_hass",
+        "_on_state_change",
+    )
+
     def __init__(self, config: dict[str, Any]) -> None:
         self._detector: BaseDetector = create_detector(config)
+        self._completion_type = CompletionType(self._detector.type_value)
         self._gate: Gate | None = None
         if config.get("gate"):
             self._gate = Gate(config["gate"])
         self._gate_holding: bool = False
         self._enabled: bool = False
         self._steps_done: int = 0
-        # Stored during setup so enable() can delegate check_immediate
+        # Stored during setup for the listener methods and check_immediate
         self._hass: HomeAssistant | None = None
-        self._on_detector_change_ref: callback | None = None
+        self._on_state_change: CALLBACK_TYPE | None = None
 
     # ── Properties ──────────────────────────────────────────────────
 
@@ -63,7 +83,7 @@ class CompletionStage:
     @property
     def completion_type(self) -> CompletionType:
         """Backwards-compat completion type enum."""
-        return CompletionType(self._detector.detector_type.value)
+        return self._completion_type
 
     @property
     def detector_type(self) -> DetectorType:
@@ -73,7 +93,7 @@ class CompletionStage:
     def state(self) -> SubState:
         """Return effective state, accounting for gate holding."""
         if self._gate_holding:
-            return SubState.ACTIVE
+            return _ACTIVE
         return self._detector.state
 
     @property
@@ -104,6 +124,11 @@ class CompletionStage:
     def has_gate(self) -> bool:
         return self._gate is not None
 
+    @property
+    def needs_poll(self) -> bool:
+        """Whether evaluate() can change anything on a coordinator poll."""
+        return self._detector.needs_poll or self._gate is not None
+
     # ── Enable/Disable ──────────────────────────────────────────────
 
     def enable(self) -> None:
@@ -114,105 +139,137 @@ class CompletionStage:
         check_immediate for detectors that support it (e.g. sensor_threshold)
         to handle the case where the condition is already met.
         """
-        self._enabled = True
+        self._set_enabled(True)
         self._detector.reset()
         self._steps_done = 0
         # Delegate check_immediate for detectors that support it
-        if self._hass and self._on_detector_change_ref:
-            self._detector.check_immediate(self._hass, self._on_detector_change_ref)
+        if self._detector.has_immediate_check and self._hass is not None:
+            self._detector.check_immediate(self._hass, self._on_detector_change)
         self._update_steps()
 
     def disable(self) -> None:
         """Disable listening."""
-        self._enabled = False
+        self._set_enabled(False)
+
+    def _set_enabled(self, enabled: bool) -> None:
+        """Update enabled; the detector is only subscribed while enabled.
+
+        Events on a disabled stage would be discarded anyway (enable()
+        resets the detector), so they are not delivered at all.
+        """
+        if enabled == self._enabled:
+            return
+        self._enabled = enabled
+        if self._hass is None:
+            return  # not set up yet; async_setup_listeners subscribes if enabled
+        if enabled:
+            self._detector.async_setup_listeners(self._hass, self._on_detector_change)
+        else:
+            self._detector.async_remove_listeners()
 
     # ── State management ────────────────────────────────────────────
 
     def _update_steps(self) -> None:
         """Sync steps_done with detector state."""
-        if self._detector.state == SubState.ACTIVE:
-            self._steps_done = 1
-        elif self._detector.state == SubState.DONE:
-            self._steps_done = self._detector.steps_total
-        else:
-            self._steps_done = 0
+        detector_state = self._detector.state
+        self._steps_done = (
+            self._detector.steps_total if detector_state is _DONE
+            else _STEPS_ACTIVE if detector_state is _ACTIVE
+            else 0
+        )
 
     def set_state(self, new_state: SubState) -> bool:
         """Set detector state directly (used by force actions)."""
-        if new_state == SubState.DONE:
-            self._gate_holding = False
+        if new_state is _DONE:
+            self._set_gate_holding(False)
         result = self._detector.set_state(new_state)
         self._update_steps()
         return result
 
     def reset(self) -> None:
         """Reset completion to idle."""
-        self._gate_holding = False
-        self._enabled = False
+        self._set_gate_holding(False)
+        self._set_enabled(False)
         self._steps_done = 0
         self._detector.reset()
 
     # ── Listener management ─────────────────────────────────────────
 
     def async_setup_listeners(
-        self, hass: HomeAssistant, on_state_change: callback
+        self, hass: HomeAssistant, on_state_change: CALLBACK_TYPE
     ) -> None:
         """Set up listeners for the detector and optional gate."""
         self._hass = hass
-
-        @callback
-        def _on_detector_change() -> None:
-            """Intercept detector state changes to apply enable/gate logic."""
-            if not self._enabled:
-                return
-            self._update_steps()
-            if self._detector.state == SubState.DONE and self._gate is not None:
-                if self._gate.is_met(hass):
-                    self._gate_holding = False
-                else:
-                    self._gate_holding = True
+        self._on_state_change = on_state_change
+        if self._enabled:
+            self._detector.async_setup_listeners(hass, self._on_detector_change)
+        if self._gate is not None and self._gate_holding:
+            self._gate.async_setup_listener(hass, self._on_gate_met)
+
+    @callback
+    def _on_detector_change(self) -> None:
+        """Intercept detector state changes to apply enable/gate logic."""
+        if not self._enabled:
+            return
+        self._update_steps()
+        if self._detector.state is _DONE and self._gate is not None:
+            if self._gate.is_met(self._hass):
+                self._set_gate_holding(False)
             else:
-                self._gate_holding = False
-            on_state_change()
-
-        self._on_detector_change_ref = _on_detector_change
-        self._detector.async_setup_listeners(hass, _on_detector_change)
-
-        if self._gate is not None:
-
-            @callback
-            def _on_gate_met() -> None:
-                """Gate entity entered expected state."""
-                if self._gate_holding and self._gate.is_met(hass):
-                    self._gate_holding = False
-                    on_state_change()
+                self._set_gate_holding(True)
+        else:
+            self._set_gate_holding(False)
+        self._on_state_change()
 
-            self._gate.async_setup_listener(hass, _on_gate_met)
+    @callback
+    def _on_gate_met(self) -> None:
+        """Gate entity entered expected state."""
+        if self._gate_holding and self._gate.is_met(self._hass):
+            self._set_gate_holding(False)
+            self._on_state_change()
 
     def async_remove_listeners(self) -> None:
         """Remove all registered listeners."""
+        self._hass = None
         self._detector.async_remove_listeners()
         if self._gate:
             self._gate.async_remove_listeners()
 
+    def _set_gate_holding(self, holding: bool) -> None:
+        """Update gate holding; the gate is only listened to while holding."""
+        if holding == self._gate_holding:
+            return
+        self._gate_holding = holding
+        if self._gate is None or self._hass is None:
+            return  # not set up yet; async_setup_listeners subscribes if holding
+        if holding:
+            self._gate.async_setup_listener(self._hass, self._on_gate_met)
+        else:
+            self._gate.async_remove_listeners()
+
     # ── Polling ──────────────────────────────────────────────────────
 
-    def evaluate(self, hass: HomeAssistant) -> SubState:
-        """Evaluate on every coordinator poll."""
+    def evaluate(self, hass: HomeAssistant, now: datetime | None = None) -> SubState:
+        """Evaluate on every coordinator poll (``now`` is passed to the detector)."""
         if not self._enabled:
             return self.state
+        # Detectors never leave DONE on a poll; with no gate to re-check
+        # there is nothing left to evaluate until the stage is reset.
+        detector = self._detector
+        if detector.state is _DONE and not self._gate_holding:
+            return _DONE
 
-        old_state = self._detector.state
-        self._detector.evaluate(hass)
+        if detector.needs_poll and detector.can_transition_on_poll():
+            detector.evaluate(hass, now)
 
         # If detector just transitioned to DONE, apply gate logic
-        if self._detector.state == SubState.DONE and old_state != SubState.DONE:
+        if detector.state is _DONE:
             if self._gate is not None and not self._gate.is_met(hass):
-                self._gate_holding = True
+                self._set_gate_holding(True)
 
         # If holding for gate, check if gate is now met
         if self._gate_holding and self._gate is not None and self._gate.is_met(hass):
-            self._gate_holding = False
+            self._set_gate_holding(False)
 
         self._update_steps()
         return self.state
@@ -221,10 +278,7 @@ class CompletionStage:
 
     def extra_attributes(self, hass: HomeAssistant) -> dict[str, Any]:
         """Return attributes for the progress sensor."""
-        attrs = self._detector.extra_attributes(hass)
-        # Remap detector_type -> completion_type for backwards compat
-        if "detector_type" in attrs:
-            attrs["completion_type"] = attrs.pop("detector_type")
+        attrs = self._detector.extra_attributes(hass, "completion_type")
         attrs["steps_total"] = self.steps_total
         attrs["steps_done"] = self._steps_done
         if self._gate:
@@ -245,8 +299,8 @@ class CompletionStage:
         """Restore state from persistence."""
         self._detector.restore_state(data)
         self._steps_done = data.get("steps_done", 0)
-        self._enabled = data.get("enabled", False)
-        self._gate_holding = data.get("gate_holding", False)
+        self._set_enabled(data.get("enabled", False))
+        self._set_gate_holding(data.get("gate_holding", False))
 
 
 # Backwards-compat alias for type hints in other modules
@@ -256,5 +310,5 @@ BaseCompletion = CompletionStage
 def create_completion(config: dict[str, Any]) -> CompletionStage:
     """Create a completion stage from configuration."""
     if not config or config.get("type") is None:
-        config = {"type": "manual"}
+        config = _DEFAULT_COMPLETION_CONFIG
     return CompletionStage(config)
@@ -147,5 +147,9 @@ DEFAULT_COOLDOWN_MINUTES: Final = 5
 DEFAULT_POWER_THRESHOLD: Final = 10.0
 DEFAULT_CURRENT_THRESHOLD: Final = 0.04
 
+# ── Entity states ───────────────────────────────────────────────────
+# States a watched entity reports while it has no usable reading.
+UNAVAILABLE_STATES: Final = frozenset({"unavailable", "unknown"})
+
 # ── Platforms ───────────────────────────────────────────────────────
 PLATFORMS: Final = ["binary_sensor", "sensor", "button"]
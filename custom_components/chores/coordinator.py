@@ -9,13 +9,15 @@ The coordinator:
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
 from .chore_core import Chore
 from .const import (
@@ -31,15 +33,18 @@ from .const import (
     EVENT_CHORE_RESET,
     EVENT_CHORE_STARTED,
     ChoreState,
-    CompletionType,
 )
 from .store import ChoreStore
 
 _LOGGER = logging.getLogger(__name__)
 
 UPDATE_INTERVAL = timedelta(seconds=60)
+# Window in which listener/force updates are coalesced into one data push
+UPDATE_BATCH_DELAY = 0.05
 
-# Map chore states to event names
+_UNIQUE_ID_PREFIX = f"{DOMAIN}_"
+
+# Map chore states to event names (every state fires one)
 STATE_EVENT_MAP: dict[ChoreState, str] = {
     ChoreState.PENDING: EVENT_CHORE_PENDING,
     ChoreState.DUE: EVENT_CHORE_DUE,
@@ -52,6 +57,16 @@ STATE_EVENT_MAP: dict[ChoreState, str] = {
 class ChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for managing all chores."""
 
+    __slots__ = (
+        "_entry",
+        "_store",
+        "_chores",
+        "_logbook_enabled",
+        "_cancel_pending_update",
+        "_data_cache",
+        "_event_templates",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -70,12 +85,23 @@ class ChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._store = store
         self._chores: dict[str, Chore] = {}
         self._logbook_enabled: bool = logbook_enabled
+        self._cancel_pending_update: CALLBACK_TYPE | None = None
+        # Per-chore state dicts from the last build; transitions drop their
+        # chore's entry and each poll rebuilds all of them
+        self._data_cache: dict[str, dict[str, Any]] = {}
+        # Per-chore event data fields that never change; copied per event
+        self._event_templates: dict[str, dict[str, Any]] = {}
 
     # ── Chore management ────────────────────────────────────────────
 
     def register_chore(self, chore: Chore) -> None:
         """Register a chore and restore its persisted state."""
         self._chores[chore.id] = chore
+        self._event_templates[chore.id] = {
+            ATTR_CHORE_ID: chore.id,
+            ATTR_CHORE_NAME: chore.name,
+            "logbook_enabled": self._logbook_enabled,
+        }
         # Restore persisted state
         stored = self._store.get_chore_state(chore.id)
         if stored:
@@ -95,23 +121,41 @@ class ChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def setup_listeners(self) -> None:
         """Set up state change listeners for all chores."""
+        hass = self.hass
+        on_update = self._on_chore_state_change
         for chore in self._chores.values():
-            chore.async_setup_listeners(self.hass, self._on_chore_state_change)
+            chore.async_setup_listeners(hass, on_update)
 
     def remove_listeners(self) -> None:
         """Remove all state change listeners."""
+        self._cancel_scheduled_update()
         for chore in self._chores.values():
             chore.async_remove_listeners()
 
     async def async_refresh_completion_buttons(self) -> None:
         """Resolve force-complete button entity_id for manual-completion chores."""
+        unresolved = [
+            chore
+            for chore in self._chores.values()
+            if chore.completion_is_manual and chore.completion_button_entity_id is None
+        ]
+        if not unresolved:
+            return
+        # One pass over this entry's registry entries instead of a lookup per chore
         registry = er.async_get(self.hass)
-        for chore in self._chores.values():
-            if chore.completion_type != CompletionType.MANUAL.value:
+        button_ids = {
+            reg_entry.unique_id: reg_entry.entity_id
+            for reg_entry in er.async_entries_for_config_entry(
+                registry, self._entry.entry_id
+            )
+            if reg_entry.domain == "button"
+        }
+        for chore in unresolved:
+            entity_id = button_ids.get(f"{_UNIQUE_ID_PREFIX}{chore.id}_force_complete")
+            if entity_id is None:
                 continue
-            unique_id = f"{DOMAIN}_{chore.id}_force_complete"
-            entity_id = registry.async_get_entity_id("button", DOMAIN, unique_id)
-            chore._completion_button_entity_id = entity_id  # noqa: SLF001
+            chore.completion_button_entity_id = entity_id
+            self._data_cache.pop(chore.id, None)
 
     @callback
     def _on_chore_state_change(
@@ -124,7 +168,7 @@ class ChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         self._fire_event(chore, old_state, new_state)
         self._persist_chore(chore)
-        self.async_set_updated_data(self._build_data())
+        self._schedule_update()
 
     # ── Force actions (called by buttons/services) ──────────────────
 
@@ -138,7 +182,7 @@ class ChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if old is not None:
             self._fire_event(chore, old, chore.state)
             self._persist_chore(chore)
-            self.async_set_updated_data(self._build_data())
+            self._schedule_update()
 
     async def async_force_inactive(self, chore_id: str) -> None:
         """Force a chore to inactive."""
@@ -150,7 +194,7 @@ class ChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if old is not None:
             self._fire_event(chore, old, chore.state)
             self._persist_chore(chore)
-            self.async_set_updated_data(self._build_data())
+            self._schedule_update()
 
     async def async_force_complete(self, chore_id: str) -> None:
         """Force a chore to completed."""
@@ -162,50 +206,88 @@ class ChoresCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if old is not None:
             self._fire_event(chore, old, chore.state)
             self._persist_chore(chore)
-            self.async_set_updated_data(self._build_data())
+            self._schedule_update()
 
     # ── Polling update ──────────────────────────────────────────────
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Poll all chores (called every 60s)."""
+        # Time-derived fields (next_due, progress) may have moved for any chore
+        self._data_cache.clear()
+        hass = self.hass
+        fire_event = self._fire_event
+        persist_chore = self._persist_chore
+        # One clock read shared by every time-based detector in this poll
+        now = dt_util.utcnow()
         for chore in self._chores.values():
-            old = chore.evaluate(self.hass)
+            old = chore.evaluate(hass, now)
             if old is not None:
-                self._fire_event(chore, old, chore.state)
-                self._persist_chore(chore)
-
-        # Persist all state periodically
-        await self._store.async_save()
+                fire_event(chore, old, chore.state)
+                persist_chore(chore)
+
+        # Persist on the poll, but only when something changed since the last save
+        if self._store.dirty:
+            await self._store.async_save()
+        # The poll pushes fresh data itself; a pending batch would repeat it
+        self._cancel_scheduled_update()
         return self._build_data()
 
     # ── Internal helpers ────────────────────────────────────────────
 
+    @callback
+    def _schedule_update(self) -> None:
+        """Push new data to entities once the current burst of changes settles.
+
+        Scripts and scenes can change many chores back to back; each change
+        only persists and fires its event, and a single rebuild of the data
+        dict follows UPDATE_BATCH_DELAY later.
+        """
+        if self._cancel_pending_update is None:
+            self._cancel_pending_update = async_call_later(
+                self.hass, UPDATE_BATCH_DELAY, self._flush_update
+            )
+
+    @callback
+    def _flush_update(self, _now: datetime) -> None:
+        self._cancel_pending_update = None
+        # Entities not set up yet (or already unloaded): nobody to notify,
+        # and the next push or poll rebuilds the data anyway
+        if not self._listeners:
+            return
+        self.async_set_updated_data(self._build_data())
+
+    def _cancel_scheduled_update(self) -> None:
+        if self._cancel_pending_update is not None:
+            self._cancel_pending_update()
+            self._cancel_pending_update = None
+
     def _build_data(self) -> dict[str, Any]:
-        """Build the data dict that entities read from."""
-        return {
-            chore_id: chore.to_state_dict(self.hass)
-            for chore_id, chore in self._chores.items()
-        }
+        """Build the data dict that entities read from.
+
+        Only chores without a cached entry (changed since the last build)
+        are asked for a fresh state dict.
+        """
+        cache = self._data_cache
+        hass = self.hass
+        for chore_id, chore in self._chores.items():
+            if chore_id not in cache:
+                cache[chore_id] = chore.to_state_dict(hass)
+        return dict(cache)
 
     def _fire_event(
         self, chore: Chore, old_state: ChoreState, new_state: ChoreState
     ) -> None:
         """Fire a Home Assistant event for a state transition."""
-        event_name = STATE_EVENT_MAP.get(new_state)
-        if not event_name:
-            return
-
-        event_data = {
-            ATTR_CHORE_ID: chore.id,
-            ATTR_CHORE_NAME: chore.name,
-            ATTR_PREVIOUS_STATE: old_state.value,
-            ATTR_NEW_STATE: new_state.value,
-            ATTR_FORCED: chore.forced,
-            "logbook_enabled": self._logbook_enabled,
-        }
+        event_name = STATE_EVENT_MAP[new_state]
+        event_data = self._event_templates[chore.id].copy()
+        event_data[ATTR_PREVIOUS_STATE] = old_state.value
+        event_data[ATTR_NEW_STATE] = new_state.value
+        event_data[ATTR_FORCED] = chore.forced
         self.hass.bus.async_fire(event_name, event_data)
         _LOGGER.debug("Fired event %s for chore %s", event_name, chore.id)
 
     def _persist_chore(self, chore: Chore) -> None:
-        """Persist a single chore's state (in memory; saved on next poll)."""
+        """Persist a single chore's state (written by a delayed save or the poll)."""
+        self._data_cache.pop(chore.id, None)
         self._store.set_chore_state(chore.id, chore.snapshot_state())
+        self._store.async_delay_save()
@@ -67,8 +67,8 @@ DETECTOR_REGISTRY: dict[DetectorType, type[BaseDetector]] = {
 
 def create_detector(config: dict[str, Any]) -> BaseDetector:
     """Create a detector instance from configuration."""
-    detector_type = DetectorType(config["type"])
-    cls = DETECTOR_REGISTRY.get(detector_type)
+    # DetectorType is a StrEnum, so the raw config string hits the registry
+    cls = DETECTOR_REGISTRY.get(config["type"])
     if cls is None:
         raise ValueError(f"Unknown detector type: {config['type']}")
     return cls(config)
@@ -15,30 +15,64 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any
 
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 from homeassistant.util import dt as dt_util
 
 from ..const import DetectorType, SubState
 
 _LOGGER = logging.getLogger(__name__)
 
+_utcnow = dt_util.utcnow
+_IDLE = SubState.IDLE
+
 
 class BaseDetector(ABC):
     """Abstract base class for all detector types."""
 
+    __slots__ = (
+        "_state",
+        "_state_entered_at",
+        "_state_entered_at_iso",
+        "_sensor_config",
+        "_listeners",
+        "_on_state_change",
+        "_static_attrs",
+    )
+
     detector_type: DetectorType
+    # detector_type.value, resolved once per class for attribute building
+    type_value: str
     steps_total: int = 1  # 1 for single-step, 2 for multi-step (e.g. contact_cycle)
+    # True when the subclass overrides evaluate(); stages skip polling otherwise
+    needs_poll: bool = False
+    # True when the subclass overrides check_immediate(); enable() skips it otherwise
+    has_immediate_check: bool = False
+    # Stages this detector may be used in; built once per class
+    _SUPPORTED_STAGES: frozenset[str] = frozenset({"trigger", "completion"})
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.needs_poll = cls.evaluate is not BaseDetector.evaluate
+        cls.has_immediate_check = (
+            cls.check_immediate is not BaseDetector.check_immediate
+        )
+        if "detector_type" in vars(cls):
+            cls.type_value = cls.detector_type.value
 
     def __init__(self, config: dict[str, Any]) -> None:
-        self._state: SubState = SubState.IDLE
-        self._state_entered_at: datetime = dt_util.utcnow()
+        self._state: SubState = _IDLE
+        self._state_entered_at: datetime = _utcnow()
+        self._state_entered_at_iso: str = self._state_entered_at.isoformat()
         self._sensor_config: dict[str, Any] | None = config.get("sensor")
         self._listeners: list[CALLBACK_TYPE] = []
+        self._on_state_change: CALLBACK_TYPE | None = None
+        # Config-derived progress-sensor attributes, built on first use
+        self._static_attrs: dict[str, Any] | None = None
 
     @classmethod
     def supported_stages(cls) -> frozenset[str]:
         """Return which stages this detector supports: 'trigger', 'completion'."""
-        return frozenset({"trigger", "completion"})
+        return cls._SUPPORTED_STAGES
 
     # ── Public API ──────────────────────────────────────────────────
 
@@ -60,17 +94,18 @@ class BaseDetector(ABC):
 
     def set_state(self, new_state: SubState) -> bool:
         """Set the detector state. Returns True if changed."""
-        if new_state == self._state:
-            return False
         old = self._state
+        if new_state is old:
+            return False
         self._state = new_state
-        self._state_entered_at = dt_util.utcnow()
-        _LOGGER.debug("Detector %s: %s -> %s", self.detector_type, old, new_state)
+        self._state_entered_at = now = _utcnow()
+        self._state_entered_at_iso = now.isoformat()
+        _LOGGER.debug("Detector %s: %s -> %s", self.type_value, old, new_state)
         return True
 
     def reset(self) -> None:
         """Reset detector to idle."""
-        self.set_state(SubState.IDLE)
+        self.set_state(_IDLE)
         self._reset_internal()
 
     @abstractmethod
@@ -81,30 +116,54 @@ class BaseDetector(ABC):
 
     @abstractmethod
     def async_setup_listeners(
-        self, hass: HomeAssistant, on_state_change: callback
+        self, hass: HomeAssistant, on_state_change: CALLBACK_TYPE
     ) -> None:
-        """Set up HA event listeners for this detector."""
+        """Set up HA event listeners for this detector.
+
+        ``on_state_change`` is a synchronous ``@callback``; handlers call it
+        directly from the event loop without scheduling a task.
+        """
 
     def async_remove_listeners(self) -> None:
-        """Remove all registered listeners."""
+        """Remove all registered listeners and cancel pending timers."""
         for unsub in self._listeners:
             unsub()
         self._listeners.clear()
+        self._cancel_timers()
+
+    def _cancel_timers(self) -> None:
+        """Cancel the detector's own one-shot timers (debounce, cooldown).
+
+        Timers expire on their own, so they are kept out of ``_listeners``;
+        detectors that schedule any override this to cancel them.
+        """
 
     # ── Polling (called every coordinator update) ───────────────────
 
-    def evaluate(self, hass: HomeAssistant) -> SubState:
+    def evaluate(self, hass: HomeAssistant, now: datetime | None = None) -> SubState:
         """Evaluate current state (called on every coordinator poll).
 
         Default implementation returns current state. Override for detectors
-        that need time-based evaluation (e.g. cooldown timers).
+        that need time-based evaluation (e.g. cooldown timers); overriding
+        sets ``needs_poll`` so the stage wrappers call it.  ``now`` is the
+        poll's UTC timestamp, shared by every detector in that poll; when
+        None the detector reads the clock itself.
         """
         return self._state
 
+    def can_transition_on_poll(self) -> bool:
+        """Whether a poll could move this detector to another state.
+
+        Stage wrappers check this before calling ``evaluate`` so detectors
+        with nothing pending (done, or waiting on a listener or wake-up
+        timer) skip the call.  Default: True.
+        """
+        return True
+
     # ── Enable-time check ───────────────────────────────────────────
 
     def check_immediate(
-        self, hass: HomeAssistant, on_state_change: callback
+        self, hass: HomeAssistant, on_state_change: CALLBACK_TYPE
     ) -> None:
         """Check if detection condition is already met.
 
@@ -115,23 +174,45 @@ class BaseDetector(ABC):
 
     # ── Attributes for progress sensor ──────────────────────────────
 
-    @abstractmethod
-    def extra_attributes(self, hass: HomeAssistant) -> dict[str, Any]:
-        """Return extra state attributes for the progress sensor."""
+    def extra_attributes(
+        self, hass: HomeAssistant, type_key: str = "detector_type"
+    ) -> dict[str, Any]:
+        """Return extra state attributes for the progress sensor.
+
+        ``type_key`` lets the stage wrappers label the type as
+        ``trigger_type`` / ``completion_type`` without rebuilding the dict.
+        """
+        static = self._static_attrs
+        if static is None:
+            static = self._static_attrs = self._static_attributes()
+        attrs: dict[str, Any] = {
+            type_key: self.type_value,
+            "state_entered_at": self._state_entered_at_iso,
+            **static,
+        }
+        self._add_attributes(hass, attrs)
+        return attrs
+
+    def _static_attributes(self) -> dict[str, Any]:
+        """Return attributes fixed by the config. Default: none."""
+        return {}
+
+    def _add_attributes(self, hass: HomeAssistant, attrs: dict[str, Any]) -> None:
+        """Add detector-specific attributes that change. Default: none."""
 
     # ── Persistence ─────────────────────────────────────────────────
 
     def snapshot_state(self) -> dict[str, Any]:
         """Return state for persistence."""
-        return {
+        data: dict[str, Any] = {
             "state": self._state.value,
-            "state_entered_at": self._state_entered_at.isoformat(),
-            **self._snapshot_internal(),
+            "state_entered_at": self._state_entered_at_iso,
         }
+        self._add_snapshot(data)
+        return data
 
-    @abstractmethod
-    def _snapshot_internal(self) -> dict[str, Any]:
-        """Return detector-specific state for persistence."""
+    def _add_snapshot(self, data: dict[str, Any]) -> None:
+        """Add detector-specific state for persistence. Default: none."""
 
     def restore_state(self, data: dict[str, Any]) -> None:
         """Restore state from persistence."""
@@ -141,6 +222,7 @@ class BaseDetector(ABC):
             self._state_entered_at = (
                 dt_util.parse_datetime(data["state_entered_at"]) or dt_util.utcnow()
             )
+            self._state_entered_at_iso = self._state_entered_at.isoformat()
         self._restore_internal(data)
 
     @abstractmethod
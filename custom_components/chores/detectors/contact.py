@@ -3,16 +3,20 @@ from __future__ import annotations
 
 from typing import Any
 
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
 
 from ..const import DetectorType, SubState
 from .base import BaseDetector
 
+_DONE = SubState.DONE
+
 
 class ContactDetector(BaseDetector):
     """Detects a contact sensor opening (single step)."""
 
+    __slots__ = ("_entity_id",)
+
     detector_type = DetectorType.CONTACT
 
     def __init__(self, config: dict[str, Any]) -> None:
@@ -23,32 +27,36 @@ class ContactDetector(BaseDetector):
         pass
 
     def async_setup_listeners(
-        self, hass: HomeAssistant, on_state_change: callback
+        self, hass: HomeAssistant, on_state_change: CALLBACK_TYPE
     ) -> None:
-        @callback
-        def _handle_state_change(event: Event) -> None:
-            new_state = event.data.get("new_state")
-            if new_state and new_state.state == "on":
-                if self._state != SubState.DONE:
-                    self.set_state(SubState.DONE)
-                    on_state_change()
-
+        self._on_state_change = on_state_change
         unsub = async_track_state_change_event(
-            hass, [self._entity_id], _handle_state_change
+            hass, [self._entity_id], self._handle_state_change
         )
         self._listeners.append(unsub)
 
-    def extra_attributes(self, hass: HomeAssistant) -> dict[str, Any]:
+    @callback
+    def _handle_state_change(self, event: Event) -> None:
+        if self._state is _DONE:
+            return
+        data = event.data
+        new_state = data.get("new_state")
+        if new_state is None:
+            return
+        value = new_state.state
+        old_state = data.get("old_state")
+        if old_state is not None and old_state.state == value:
+            return  # attribute-only update
+        if value == "on":
+            self.set_state(_DONE)
+            self._on_state_change()
+
+    def _static_attributes(self) -> dict[str, Any]:
+        return {"watched_entity": self._entity_id}
+
+    def _add_attributes(self, hass: HomeAssistant, attrs: dict[str, Any]) -> None:
         state = hass.states.get(self._entity_id)
-        return {
-            "detector_type": self.detector_type.value,
-            "state_entered_at": self._state_entered_at.isoformat(),
-            "watched_entity": self._entity_id,
-            "watched_entity_state": state.state if state else None,
-        }
-
-    def _snapshot_internal(self) -> dict[str, Any]:
-        return {}
+        attrs["watched_entity_state"] = state.state if state else None
 
     def _restore_internal(self, data: dict[str, Any]) -> None:
         pass
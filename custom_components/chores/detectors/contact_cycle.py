@@ -1,17 +1,36 @@
 """Contact cycle detector (two step: open -> close) for the Chores integration."""
 from __future__ import annotations
 
+from time import monotonic
 from typing import Any
 
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 
-from ..const import DetectorType, SubState
+from ..const import UNAVAILABLE_STATES, DetectorType, SubState
 from .base import BaseDetector
 
+_IDLE = SubState.IDLE
+_ACTIVE = SubState.ACTIVE
+_DONE = SubState.DONE
+
 
 class ContactCycleDetector(BaseDetector):
-    """Detects a contact open-then-close cycle (two-step)."""
+    """Detects a contact open-then-close cycle (two-step).
+
+    An open edge sets a monotonic deadline ``debounce_seconds`` ahead; the
+    contact is confirmed open once the deadline passes without a close.
+    Bounces only move or clear the deadline: a single timer stays armed
+    and re-arms itself for the remainder if the deadline moved.
+    """
+
+    __slots__ = (
+        "_entity_id",
+        "_debounce_seconds",
+        "_pending_active_deadline",
+        "_pending_active_cancel",
+        "_hass",
+    )
 
     detector_type = DetectorType.CONTACT_CYCLE
     steps_total = 2
@@ -20,65 +39,89 @@ class ContactCycleDetector(BaseDetector):
         super().__init__(config)
         self._entity_id: str = config["entity_id"]
         self._debounce_seconds: int = config.get("debounce_seconds", 2)
+        # monotonic() time at which an open contact counts as step 1 done
+        self._pending_active_deadline: float | None = None
         self._pending_active_cancel: CALLBACK_TYPE | None = None
+        self._hass: HomeAssistant | None = None
 
     def _reset_internal(self) -> None:
+        self._cancel_timers()
+
+    def _cancel_timers(self) -> None:
+        self._pending_active_deadline = None
         if self._pending_active_cancel:
             self._pending_active_cancel()
             self._pending_active_cancel = None
 
     def async_setup_listeners(
-        self, hass: HomeAssistant, on_state_change: callback
+        self, hass: HomeAssistant, on_state_change: CALLBACK_TYPE
     ) -> None:
-        @callback
-        def _handle_state_change(event: Event) -> None:
-            new_state = event.data.get("new_state")
-            old_state = event.data.get("old_state")
-            if not new_state:
-                return
-
-            if old_state is None or old_state.state in ("unavailable", "unknown"):
-                return
-
-            if new_state.state == "on" and self._state == SubState.IDLE:
-                if self._pending_active_cancel:
-                    self._pending_active_cancel()
-
-                @callback
-                def _confirm_active(_now: Any) -> None:
-                    self._pending_active_cancel = None
-                    if self._state == SubState.IDLE:
-                        self.set_state(SubState.ACTIVE)
-                        on_state_change()
-
-                self._pending_active_cancel = async_call_later(
-                    hass, self._debounce_seconds, _confirm_active
-                )
-
-            elif new_state.state == "off" and self._state == SubState.IDLE and self._pending_active_cancel:
-                self._pending_active_cancel()
-                self._pending_active_cancel = None
-
-            elif new_state.state == "off" and self._state == SubState.ACTIVE:
-                self.set_state(SubState.DONE)
-                on_state_change()
-
+        self._hass = hass
+        self._on_state_change = on_state_change
         unsub = async_track_state_change_event(
-            hass, [self._entity_id], _handle_state_change
+            hass, [self._entity_id], self._handle_state_change
         )
         self._listeners.append(unsub)
 
-    def extra_attributes(self, hass: HomeAssistant) -> dict[str, Any]:
+    @callback
+    def _handle_state_change(self, event: Event) -> None:
+        if self._state is _DONE:
+            return
+        data = event.data
+        new_state = data.get("new_state")
+        if new_state is None:
+            return
+        old_state = data.get("old_state")
+        if old_state is None:
+            return
+        old_value = old_state.state
+        if old_value in UNAVAILABLE_STATES:
+            return
+        value = new_state.state
+        if old_value == value:
+            return  # attribute-only update
+
+        state = self._state
+        if value == "on" and state is _IDLE:
+            self._pending_active_deadline = monotonic() + self._debounce_seconds
+            if self._pending_active_cancel is None:
+                self._arm_confirm_timer(self._debounce_seconds)
+
+        elif value == "off" and state is _IDLE:
+            # Bounced shut; an armed timer finds no deadline and stops
+            self._pending_active_deadline = None
+
+        elif value == "off" and state is _ACTIVE:
+            self.set_state(_DONE)
+            self._on_state_change()
+
+    def _arm_confirm_timer(self, delay: float) -> None:
+        self._pending_active_cancel = async_call_later(
+            self._hass, delay, self._confirm_active
+        )
+
+    @callback
+    def _confirm_active(self, _now: Any) -> None:
+        """Debounce timer fired; confirm the open unless it bounced."""
+        self._pending_active_cancel = None
+        deadline = self._pending_active_deadline
+        if deadline is None or self._state is not _IDLE:
+            return
+        remaining = deadline - monotonic()
+        if remaining > 0:
+            # Re-opened after a bounce: wait out the rest of the new window
+            self._arm_confirm_timer(remaining)
+            return
+        self._pending_active_deadline = None
+        self.set_state(_ACTIVE)
+        self._on_state_change()
+
+    def _static_attributes(self) -> dict[str, Any]:
+        return {"watched_entity": self._entity_id}
+
+    def _add_attributes(self, hass: HomeAssistant, attrs: dict[str, Any]) -> None:
         state = hass.states.get(self._entity_id)
-        return {
-            "detector_type": self.detector_type.value,
-            "state_entered_at": self._state_entered_at.isoformat(),
-            "watched_entity": self._entity_id,
-            "watched_entity_state": state.state if state else None,
-        }
-
-    def _snapshot_internal(self) -> dict[str, Any]:
-        return {}
+        attrs["watched_entity_state"] = state.state if state else None
 
     def _restore_internal(self, data: dict[str, Any]) -> None:
         pass
@@ -4,12 +4,15 @@ from __future__ import annotations
 from datetime import datetime, time, timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
 from ..const import DetectorType, SubState
 from .base import BaseDetector
+from .helpers import async_track_time_shared, parse_time
+
+_IDLE = SubState.IDLE
+_DONE = SubState.DONE
 
 
 class DailyDetector(BaseDetector):
@@ -19,21 +22,18 @@ class DailyDetector(BaseDetector):
     Gate logic (if any) is handled by the stage wrapper, not this detector.
     """
 
-    detector_type = DetectorType.DAILY
+    __slots__ = ("_time", "_time_iso", "_time_fired_today", "_next_trigger_cache")
 
-    @classmethod
-    def supported_stages(cls) -> frozenset[str]:
-        return frozenset({"trigger"})
+    detector_type = DetectorType.DAILY
+    _SUPPORTED_STAGES = frozenset({"trigger"})
 
     def __init__(self, config: dict[str, Any]) -> None:
         super().__init__(config)
-        time_val = config["time"]
-        if isinstance(time_val, str):
-            parts = time_val.split(":")
-            self._time: time = time(int(parts[0]), int(parts[1]))
-        else:
-            self._time = time_val
+        self._time: time = parse_time(config["time"])
+        self._time_iso: str = self._time.isoformat()
         self._time_fired_today: bool = False
+        # (next trigger, its ISO string); valid until that moment arrives
+        self._next_trigger_cache: tuple[datetime, str] | None = None
 
     @property
     def trigger_time(self) -> time:
@@ -41,8 +41,20 @@ class DailyDetector(BaseDetector):
 
     @property
     def next_trigger_datetime(self) -> datetime:
-        """Calculate the next trigger datetime."""
+        """Next trigger datetime, recalculated only once it has passed."""
+        return self._next_trigger()[0]
+
+    def _next_trigger(self) -> tuple[datetime, str]:
         now = dt_util.now()
+        cached = self._next_trigger_cache
+        if cached is not None and now < cached[0]:
+            return cached
+        next_trigger = self._calculate_next_trigger(now)
+        self._next_trigger_cache = (next_trigger, next_trigger.isoformat())
+        return self._next_trigger_cache
+
+    def _calculate_next_trigger(self, now: datetime) -> datetime:
+        """Calculate the next trigger datetime."""
         today_trigger = now.replace(
             hour=self._time.hour,
             minute=self._time.minute,
@@ -57,47 +69,50 @@ class DailyDetector(BaseDetector):
         self._time_fired_today = False
 
     def async_setup_listeners(
-        self, hass: HomeAssistant, on_state_change: callback
+        self, hass: HomeAssistant, on_state_change: CALLBACK_TYPE
     ) -> None:
-        @callback
-        def _handle_time(now: datetime) -> None:
-            if self._state != SubState.IDLE:
-                return
-            self._time_fired_today = True
-            self.set_state(SubState.DONE)
-            on_state_change()
-
-        unsub_time = async_track_time_change(
-            hass, _handle_time, hour=self._time.hour, minute=self._time.minute, second=0
+        self._on_state_change = on_state_change
+        unsub_time = async_track_time_shared(
+            hass, self._time.hour, self._time.minute, self._handle_time
         )
         self._listeners.append(unsub_time)
 
-    def evaluate(self, hass: HomeAssistant) -> SubState:
+    @callback
+    def _handle_time(self, now: datetime) -> None:
+        if self._state is not _IDLE:
+            return
+        self._time_fired_today = True
+        self.set_state(_DONE)
+        self._on_state_change()
+
+    def evaluate(self, hass: HomeAssistant, now: datetime | None = None) -> SubState:
         """Check if we've passed the trigger time (handles startup after time)."""
-        if self._state == SubState.IDLE and not self._time_fired_today:
-            now = dt_util.now()
-            today_trigger = now.replace(
-                hour=self._time.hour,
-                minute=self._time.minute,
-                second=0,
-                microsecond=0,
-            )
-            if now >= today_trigger:
-                self._time_fired_today = True
-                self.set_state(SubState.DONE)
+        if not self.can_transition_on_poll():
+            return self._state
+        now = dt_util.as_local(now) if now is not None else dt_util.now()
+        today_trigger = now.replace(
+            hour=self._time.hour,
+            minute=self._time.minute,
+            second=0,
+            microsecond=0,
+        )
+        if now >= today_trigger:
+            self._time_fired_today = True
+            self.set_state(_DONE)
         return self._state
 
-    def extra_attributes(self, hass: HomeAssistant) -> dict[str, Any]:
-        return {
-            "detector_type": self.detector_type.value,
-            "state_entered_at": self._state_entered_at.isoformat(),
-            "trigger_time": self._time.isoformat(),
-            "next_trigger": self.next_trigger_datetime.isoformat(),
-            "time_fired_today": self._time_fired_today,
-        }
-
-    def _snapshot_internal(self) -> dict[str, Any]:
-        return {"time_fired_today": self._time_fired_today}
+    def can_transition_on_poll(self) -> bool:
+        return self._state is _IDLE and not self._time_fired_today
+
+    def _static_attributes(self) -> dict[str, Any]:
+        return {"trigger_time": self._time_iso}
+
+    def _add_attributes(self, hass: HomeAssistant, attrs: dict[str, Any]) -> None:
+        attrs["next_trigger"] = self._next_trigger()[1]
+        attrs["time_fired_today"] = self._time_fired_today
+
+    def _add_snapshot(self, data: dict[str, Any]) -> None:
+        data["time_fired_today"] = self._time_fired_today
 
     def _restore_internal(self, data: dict[str, Any]) -> None:
         self._time_fired_today = data.get("time_fired_today", False)
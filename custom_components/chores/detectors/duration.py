@@ -4,13 +4,17 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from homeassistant.core import Event, HomeAssistant, callback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.util import dt as dt_util
 
-from ..const import DetectorType, SubState
+from ..const import UNAVAILABLE_STATES, DetectorType, SubState
 from .base import BaseDetector
 
+_IDLE = SubState.IDLE
+_ACTIVE = SubState.ACTIVE
+_DONE = SubState.DONE
+
 
 class DurationDetector(BaseDetector):
     """Detects an entity staying in a target state for a duration.
@@ -20,9 +24,24 @@ class DurationDetector(BaseDetector):
 
     The persisted ``_state_since`` timestamp survives HA restarts.
     Transitions through ``unavailable`` / ``unknown`` are ignored to
-    preserve the timer.
+    preserve the timer.  While listening, the end of the duration is a
+    scheduled wake-up; the poll only checks it when no timer is armed.
+    The listener also keeps the last usable entity state, so the poll only
+    reads ``hass.states`` before the first event arrives.
     """
 
+    __slots__ = (
+        "_entity_id",
+        "_target_state",
+        "_duration_hours",
+        "_duration_seconds",
+        "_state_since",
+        "_state_since_iso_cache",
+        "_last_state_value",
+        "_duration_cancel",
+        "_hass",
+    )
+
     detector_type = DetectorType.DURATION
 
     def __init__(self, config: dict[str, Any]) -> None:
@@ -30,99 +49,172 @@ class DurationDetector(BaseDetector):
         self._entity_id: str = config["entity_id"]
         self._target_state: str = config.get("state", "on")
         self._duration_hours: float = config["duration_hours"]
+        self._duration_seconds: float = self._duration_hours * 3600
         self._state_since: datetime | None = None
+        # (_state_since, its ISO string), refreshed when _state_since changes
+        self._state_since_iso_cache: tuple[datetime, str] | None = None
+        # Last usable state seen by the listener; None until an event arrives
+        self._last_state_value: str | None = None
+        self._duration_cancel: CALLBACK_TYPE | None = None
+        self._hass: HomeAssistant | None = None
 
     def _reset_internal(self) -> None:
+        self._cancel_timers()
         self._state_since = None
+        self._last_state_value = None
 
     def async_setup_listeners(
-        self, hass: HomeAssistant, on_state_change: callback
+        self, hass: HomeAssistant, on_state_change: CALLBACK_TYPE
     ) -> None:
-        @callback
-        def _handle_state_change(event: Event) -> None:
-            new_state = event.data.get("new_state")
-            old_state = event.data.get("old_state")
-            if not new_state:
-                return
-
-            new_val = new_state.state
-            old_val = old_state.state if old_state else None
-
-            if old_val is None or old_val in ("unavailable", "unknown"):
-                return
-            if new_val in ("unavailable", "unknown"):
-                return
-            if old_val == new_val:
-                return
-
-            if new_val == self._target_state and self._state == SubState.IDLE:
-                self._state_since = dt_util.utcnow()
-                self.set_state(SubState.ACTIVE)
-                on_state_change()
-            elif new_val != self._target_state and self._state == SubState.ACTIVE:
-                self._state_since = None
-                self.set_state(SubState.IDLE)
-                on_state_change()
-
+        self._hass = hass
+        self._on_state_change = on_state_change
+        # Nothing seen while unsubscribed; read hass.states until an event
+        self._last_state_value = None
         unsub = async_track_state_change_event(
-            hass, [self._entity_id], _handle_state_change
+            hass, [self._entity_id], self._handle_state_change
         )
         self._listeners.append(unsub)
+        # Restored mid-duration: wake up when the remainder has passed
+        self._sync_duration_timer()
+
+    @callback
+    def _handle_state_change(self, event: Event) -> None:
+        new_state = event.data.get("new_state")
+        old_state = event.data.get("old_state")
+        if not new_state:
+            return
+
+        new_val = new_state.state
+        old_val = old_state.state if old_state else None
+        self._last_state_value = (
+            new_val if new_val not in UNAVAILABLE_STATES else None
+        )
 
-    def evaluate(self, hass: HomeAssistant) -> SubState:
-        """Check duration timer on every poll and handle startup recovery."""
-        now = dt_util.utcnow()
+        if old_val is None or old_val in UNAVAILABLE_STATES:
+            return
+        if new_val in UNAVAILABLE_STATES:
+            return
+        if old_val == new_val:
+            return
+
+        if new_val == self._target_state and self._state is _IDLE:
+            self._state_since = dt_util.utcnow()
+            self.set_state(_ACTIVE)
+            self._sync_duration_timer()
+            self._on_state_change()
+        elif new_val != self._target_state and self._state is _ACTIVE:
+            self._state_since = None
+            self.set_state(_IDLE)
+            self._cancel_timers()
+            self._on_state_change()
+
+    def _sync_duration_timer(self) -> None:
+        """Arm the wake-up for the end of the duration while one is running."""
+        since = self._state_since
+        if since is None or self._state is not _ACTIVE:
+            self._cancel_timers()
+            return
+        if self._duration_cancel is None:
+            remaining = (
+                self._duration_seconds
+                - (dt_util.utcnow() - since).total_seconds()
+            )
+            self._duration_cancel = async_call_later(
+                self._hass, max(0, remaining), self._duration_elapsed
+            )
+
+    def async_remove_listeners(self) -> None:
+        super().async_remove_listeners()
+        self._last_state_value = None
+
+    def _cancel_timers(self) -> None:
+        if self._duration_cancel is not None:
+            self._duration_cancel()
+            self._duration_cancel = None
+
+    @callback
+    def _duration_elapsed(self, _now: datetime) -> None:
+        """The duration ran out; done if the entity is still in the target."""
+        self._duration_cancel = None
+        if self._state is not _ACTIVE or self._state_since is None:
+            return
+        value = self._last_state_value
+        if value is not None and value != self._target_state:
+            # Left the target through unavailable, which the listener skips
+            self._state_since = None
+            self.set_state(_IDLE)
+        else:
+            self.set_state(_DONE)
+        self._on_state_change()
 
-        if self._state == SubState.IDLE:
-            state = hass.states.get(self._entity_id)
-            if (
-                state
-                and state.state not in ("unknown", "unavailable")
-                and state.state == self._target_state
-            ):
-                self._state_since = self._state_since or now
-                self.set_state(SubState.ACTIVE)
-
-        if self._state == SubState.ACTIVE and self._state_since is not None:
+    def evaluate(self, hass: HomeAssistant, now: datetime | None = None) -> SubState:
+        """Check duration timer on every poll and handle startup recovery."""
+        if not self.can_transition_on_poll():
+            return self._state
+        if now is None:
+            now = dt_util.utcnow()
+
+        # The listener's last value serves both the recovery and the
+        # left-target checks; read the state machine only until it has one
+        value = self._last_state_value if self._listeners else None
+        if value is None:
             state = hass.states.get(self._entity_id)
-            if (
-                state
-                and state.state not in ("unknown", "unavailable")
-                and state.state != self._target_state
-            ):
+            value = (
+                state.state
+                if state and state.state not in UNAVAILABLE_STATES
+                else None
+            )
+
+        if self._state is _IDLE and value == self._target_state:
+            self._state_since = self._state_since or now
+            self.set_state(_ACTIVE)
+
+        if self._state is _ACTIVE and self._state_since is not None:
+            if value is not None and value != self._target_state:
                 self._state_since = None
-                self.set_state(SubState.IDLE)
-            else:
+                self.set_state(_IDLE)
+                self._cancel_timers()
+            elif self._duration_cancel is None:
                 elapsed = (now - self._state_since).total_seconds()
-                if elapsed >= self._duration_hours * 3600:
-                    self.set_state(SubState.DONE)
+                if elapsed >= self._duration_seconds:
+                    self.set_state(_DONE)
 
         return self._state
 
-    def extra_attributes(self, hass: HomeAssistant) -> dict[str, Any]:
-        state = hass.states.get(self._entity_id)
-        attrs: dict[str, Any] = {
-            "detector_type": self.detector_type.value,
-            "state_entered_at": self._state_entered_at.isoformat(),
+    def can_transition_on_poll(self) -> bool:
+        # Idle polls recover a target state missed while HA was down
+        return self._state is not _DONE
+
+    def _state_since_iso(self) -> str | None:
+        """ISO string of _state_since, formatted once per timestamp."""
+        since = self._state_since
+        if since is None:
+            return None
+        cached = self._state_since_iso_cache
+        if cached is None or cached[0] is not since:
+            cached = self._state_since_iso_cache = (since, since.isoformat())
+        return cached[1]
+
+    def _static_attributes(self) -> dict[str, Any]:
+        return {
             "watched_entity": self._entity_id,
-            "watched_entity_state": state.state if state else None,
             "target_state": self._target_state,
             "duration_hours": self._duration_hours,
-            "state_since": self._state_since.isoformat() if self._state_since else None,
         }
+
+    def _add_attributes(self, hass: HomeAssistant, attrs: dict[str, Any]) -> None:
+        state = hass.states.get(self._entity_id)
+        attrs["watched_entity_state"] = state.state if state else None
+        attrs["state_since"] = self._state_since_iso()
         if self._state_since is not None:
             elapsed = (dt_util.utcnow() - self._state_since).total_seconds()
-            total = self._duration_hours * 3600
-            remaining = max(0, total - elapsed)
+            remaining = max(0, self._duration_seconds - elapsed)
             attrs["time_remaining_seconds"] = int(remaining)
         else:
             attrs["time_remaining_seconds"] = None
-        return attrs
 
-    def _snapshot_internal(self) -> dict[str, Any]:
-        return {
-            "state_since": self._state_since.isoformat() if self._state_since else None,
-        }
+    def _add_snapshot(self, data: dict[str, Any]) -> None:
+        data["state_since"] = self._state_since_iso()
 
     def _restore_internal(self, data: dict[str, Any]) -> None:
         ss = data.get("state_since")
@@ -1,12 +1,96 @@
 """Shared helpers for detector modules."""
 from __future__ import annotations
 
+import logging
+from collections.abc import Callable
+from datetime import datetime, time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# hass.data[DOMAIN] key for the shared time trackers,
+# {(hour, minute): _SharedTimeTracker}
+_SHARED_TIME_TRACKERS = "shared_time_trackers"
+
 WEEKDAY_MAP: dict[str, int] = {
     "mon": 0, "tue": 1, "wed": 2, "thu": 3,
     "fri": 4, "sat": 5, "sun": 6,
 }
 
-WEEKDAY_SHORT_NAMES: dict[int, str] = {
-    0: "Mon", 1: "Tue", 2: "Wed", 3: "Thu",
-    4: "Fri", 5: "Sat", 6: "Sun",
-}
+# Indexed by weekday number (Monday == 0)
+WEEKDAY_SHORT_NAMES: tuple[str, ...] = (
+    "Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun",
+)
+
+
+def parse_time(value: str | time) -> time:
+    """Parse a configured ``HH:MM`` time of day; seconds are dropped.
+
+    Canonical strings go through the C ``time.fromisoformat``; anything it
+    rejects (e.g. a single-digit hour such as ``8:00``) is split by hand.
+    """
+    if not isinstance(value, str):
+        return value
+    try:
+        parsed = time.fromisoformat(value)
+    except ValueError:
+        parts = value.split(":")
+        return time(int(parts[0]), int(parts[1]))
+    return parsed.replace(second=0, microsecond=0)
+
+
+class _SharedTimeTracker:
+    """One HA time listener fanning out to every action for its time of day."""
+
+    __slots__ = ("actions", "unsub")
+
+    def __init__(self) -> None:
+        self.actions: list[Callable[[datetime], None]] = []
+        self.unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def dispatch(self, now: datetime) -> None:
+        for action in tuple(self.actions):
+            # One failing detector must not stop the others at this time
+            try:
+                action(now)
+            except Exception:
+                _LOGGER.exception("Error running time listener %s", action)
+
+
+def async_track_time_shared(
+    hass: HomeAssistant,
+    hour: int,
+    minute: int,
+    action: Callable[[datetime], None],
+) -> CALLBACK_TYPE:
+    """Call ``action`` every day at hour:minute:00.
+
+    Daily and weekly detectors scheduled for the same time of day share a
+    single async_track_time_change listener; it is removed with the last of
+    them.  Returns the unsubscribe callback for ``action``.
+    """
+    trackers: dict[tuple[int, int], _SharedTimeTracker] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(_SHARED_TIME_TRACKERS, {})
+    key = (hour, minute)
+    tracker = trackers.get(key)
+    if tracker is None:
+        tracker = trackers[key] = _SharedTimeTracker()
+        tracker.unsub = async_track_time_change(
+            hass, tracker.dispatch, hour=hour, minute=minute, second=0
+        )
+    tracker.actions.append(action)
+
+    @callback
+    def _remove() -> None:
+        tracker.actions.remove(action)
+        if not tracker.actions:
+            tracker.unsub()
+            del trackers[key]
+
+    return _remove
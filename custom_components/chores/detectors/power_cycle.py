@@ -4,21 +4,43 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from homeassistant.core import Event, HomeAssistant, callback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.util import dt as dt_util
 
-from ..const import DetectorType, SubState
+from ..const import UNAVAILABLE_STATES, DetectorType, SubState
 from .base import BaseDetector
 
+_IDLE = SubState.IDLE
+_ACTIVE = SubState.ACTIVE
+_DONE = SubState.DONE
+
 
 class PowerCycleDetector(BaseDetector):
     """Detects power/current cycles (e.g. washing machine, dishwasher).
 
     Active: power or current above threshold (machine running).
     Done: power AND current drop below threshold for cooldown_minutes.
+
+    While listening, the end of the cooldown is a scheduled wake-up; the
+    poll only checks it when no timer is armed (e.g. right after a restore).
     """
 
+    __slots__ = (
+        "_power_sensor",
+        "_current_sensor",
+        "_power_threshold",
+        "_current_threshold",
+        "_cooldown_minutes",
+        "_cooldown_seconds",
+        "_sensor_thresholds",
+        "_power_dropped_at",
+        "_power_dropped_at_iso_cache",
+        "_machine_running",
+        "_cooldown_cancel",
+        "_hass",
+    )
+
     detector_type = DetectorType.POWER_CYCLE
 
     def __init__(self, config: dict[str, Any]) -> None:
@@ -28,27 +50,79 @@ class PowerCycleDetector(BaseDetector):
         self._power_threshold: float = config.get("power_threshold", 10.0)
         self._current_threshold: float = config.get("current_threshold", 0.04)
         self._cooldown_minutes: int = config.get("cooldown_minutes", 5)
+        self._cooldown_seconds: int = self._cooldown_minutes * 60
+        # Configured sensors with their thresholds, power first
+        self._sensor_thresholds: tuple[tuple[str, float], ...] = tuple(
+            (entity_id, threshold)
+            for entity_id, threshold in (
+                (self._power_sensor, self._power_threshold),
+                (self._current_sensor, self._current_threshold),
+            )
+            if entity_id
+        )
         self._power_dropped_at: datetime | None = None
+        # (_power_dropped_at, its ISO string), refreshed when the drop time changes
+        self._power_dropped_at_iso_cache: tuple[datetime, str] | None = None
         self._machine_running: bool = False
+        self._cooldown_cancel: CALLBACK_TYPE | None = None
+        self._hass: HomeAssistant | None = None
 
     def _reset_internal(self) -> None:
+        self._cancel_timers()
         self._power_dropped_at = None
         self._machine_running = False
 
     def async_setup_listeners(
-        self, hass: HomeAssistant, on_state_change: callback
+        self, hass: HomeAssistant, on_state_change: CALLBACK_TYPE
     ) -> None:
         entities = [e for e in [self._power_sensor, self._current_sensor] if e]
         if not entities:
             return
+        self._hass = hass
+        self._on_state_change = on_state_change
+        unsub = async_track_state_change_event(
+            hass, entities, self._handle_state_change
+        )
+        self._listeners.append(unsub)
+        # Restored mid-cooldown: wake up when the remainder has passed
+        self._sync_cooldown_timer()
+
+    @callback
+    def _handle_state_change(self, event: Event) -> None:
+        changed = self._evaluate_power(self._hass)
+        self._sync_cooldown_timer()
+        # Readings while running (or idle) move no state; only a start is news
+        if changed:
+            self._on_state_change()
+
+    def _sync_cooldown_timer(self) -> None:
+        """Arm the cooldown wake-up while one is running, cancel it otherwise."""
+        dropped_at = self._power_dropped_at
+        if dropped_at is None or self._state is not _ACTIVE:
+            self._cancel_timers()
+            return
+        if self._cooldown_cancel is None:
+            remaining = (
+                self._cooldown_seconds
+                - (dt_util.utcnow() - dropped_at).total_seconds()
+            )
+            self._cooldown_cancel = async_call_later(
+                self._hass, max(0, remaining), self._cooldown_elapsed
+            )
 
-        @callback
-        def _handle_state_change(event: Event) -> None:
-            self._evaluate_power(hass)
-            on_state_change()
+    def _cancel_timers(self) -> None:
+        if self._cooldown_cancel is not None:
+            self._cooldown_cancel()
+            self._cooldown_cancel = None
 
-        unsub = async_track_state_change_event(hass, entities, _handle_state_change)
-        self._listeners.append(unsub)
+    @callback
+    def _cooldown_elapsed(self, _now: datetime) -> None:
+        """Cooldown ran out with the power still low."""
+        self._cooldown_cancel = None
+        if self._state is _ACTIVE and self._power_dropped_at is not None:
+            self.set_state(_DONE)
+            self._machine_running = False
+            self._on_state_change()
 
     def _is_above_threshold(self, hass: HomeAssistant) -> bool | None:
         """Check if power/current is above threshold.
@@ -57,62 +131,59 @@ class PowerCycleDetector(BaseDetector):
         Returns None when all configured sensors are unavailable/unknown.
         """
         any_readable = False
-        above = False
-
-        if self._power_sensor:
-            state = hass.states.get(self._power_sensor)
-            if state and state.state not in ("unknown", "unavailable"):
-                any_readable = True
-                try:
-                    if float(state.state) > self._power_threshold:
-                        above = True
-                except (ValueError, TypeError):
-                    pass
 
-        if self._current_sensor:
-            state = hass.states.get(self._current_sensor)
-            if state and state.state not in ("unknown", "unavailable"):
+        for entity_id, threshold in self._sensor_thresholds:
+            state = hass.states.get(entity_id)
+            if state and state.state not in UNAVAILABLE_STATES:
                 any_readable = True
                 try:
-                    if float(state.state) > self._current_threshold:
-                        above = True
+                    if float(state.state) > threshold:
+                        # Either sensor above threshold settles it
+                        return True
                 except (ValueError, TypeError):
                     pass
 
-        return above if any_readable else None
+        return False if any_readable else None
 
-    def _evaluate_power(self, hass: HomeAssistant) -> None:
-        """Evaluate power state and update detector."""
+    def _evaluate_power(self, hass: HomeAssistant) -> bool:
+        """Evaluate power state and update detector. Returns True if state changed."""
         above = self._is_above_threshold(hass)
 
         if above is True:
             self._machine_running = True
             self._power_dropped_at = None
-            if self._state == SubState.IDLE:
-                self.set_state(SubState.ACTIVE)
+            if self._state is _IDLE:
+                return self.set_state(_ACTIVE)
         elif above is False:
             if self._machine_running and self._power_dropped_at is None:
                 self._power_dropped_at = dt_util.utcnow()
-
-    def evaluate(self, hass: HomeAssistant) -> SubState:
-        """Check cooldown timer on every poll."""
-        if (
-            self._state == SubState.ACTIVE
-            and self._power_dropped_at is not None
-        ):
-            elapsed = (dt_util.utcnow() - self._power_dropped_at).total_seconds()
-            if elapsed >= self._cooldown_minutes * 60:
-                self.set_state(SubState.DONE)
+        return False
+
+    def evaluate(self, hass: HomeAssistant, now: datetime | None = None) -> SubState:
+        """Check the cooldown on a poll when no wake-up is scheduled for it."""
+        if self.can_transition_on_poll():
+            if now is None:
+                now = dt_util.utcnow()
+            elapsed = (now - self._power_dropped_at).total_seconds()
+            if elapsed >= self._cooldown_seconds:
+                self.set_state(_DONE)
                 self._machine_running = False
         return self._state
 
-    def extra_attributes(self, hass: HomeAssistant) -> dict[str, Any]:
-        attrs: dict[str, Any] = {
-            "detector_type": self.detector_type.value,
-            "state_entered_at": self._state_entered_at.isoformat(),
-            "watched_entity": self._power_sensor or self._current_sensor or "N/A",
-            "machine_running": self._machine_running,
+    def can_transition_on_poll(self) -> bool:
+        return (
+            self._state is _ACTIVE
+            and self._power_dropped_at is not None
+            and self._cooldown_cancel is None
+        )
+
+    def _static_attributes(self) -> dict[str, Any]:
+        return {
+            "watched_entity": self._power_sensor or self._current_sensor or "N/A"
         }
+
+    def _add_attributes(self, hass: HomeAssistant, attrs: dict[str, Any]) -> None:
+        attrs["machine_running"] = self._machine_running
         if self._power_sensor:
             state = hass.states.get(self._power_sensor)
             attrs["power_value"] = state.state if state else None
@@ -122,19 +193,29 @@ class PowerCycleDetector(BaseDetector):
         if self._power_dropped_at:
             remaining = max(
                 0,
-                self._cooldown_minutes * 60
+                self._cooldown_seconds
                 - (dt_util.utcnow() - self._power_dropped_at).total_seconds(),
             )
             attrs["cooldown_remaining"] = int(remaining)
         else:
             attrs["cooldown_remaining"] = None
-        return attrs
 
-    def _snapshot_internal(self) -> dict[str, Any]:
-        return {
-            "machine_running": self._machine_running,
-            "power_dropped_at": self._power_dropped_at.isoformat() if self._power_dropped_at else None,
-        }
+    def _power_dropped_at_iso(self) -> str | None:
+        """ISO string of _power_dropped_at, formatted once per timestamp."""
+        dropped_at = self._power_dropped_at
+        if dropped_at is None:
+            return None
+        cached = self._power_dropped_at_iso_cache
+        if cached is None or cached[0] is not dropped_at:
+            cached = self._power_dropped_at_iso_cache = (
+                dropped_at,
+                dropped_at.isoformat(),
+            )
+        return cached[1]
+
+    def _add_snapshot(self, data: dict[str, Any]) -> None:
+        data["machine_running"] = self._machine_running
+        data["power_dropped_at"] = self._power_dropped_at_iso()
 
     def _restore_internal(self, data: dict[str, Any]) -> None:
         self._machine_running = data.get("machine_running", False)
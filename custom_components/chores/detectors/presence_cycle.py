@@ -3,12 +3,16 @@ from __future__ import annotations
 
 from typing import Any
 
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
 
-from ..const import DetectorType, SubState
+from ..const import UNAVAILABLE_STATES, DetectorType, SubState
 from .base import BaseDetector
 
+_IDLE = SubState.IDLE
+_ACTIVE = SubState.ACTIVE
+_DONE = SubState.DONE
+
 
 class PresenceCycleDetector(BaseDetector):
     """Detects a presence leave-then-return cycle (two-step).
@@ -18,6 +22,8 @@ class PresenceCycleDetector(BaseDetector):
       - binary_sensor.* / others: off / on
     """
 
+    __slots__ = ("_entity_id", "_away_state", "_home_state", "_transitions")
+
     detector_type = DetectorType.PRESENCE_CYCLE
     steps_total = 2
 
@@ -31,48 +37,57 @@ class PresenceCycleDetector(BaseDetector):
         else:
             self._away_state = "off"
             self._home_state = "on"
+        # (current sub-state, observed entity state) -> next sub-state
+        self._transitions: dict[tuple[SubState, str], SubState] = {
+            (_IDLE, self._away_state): _ACTIVE,
+            (_ACTIVE, self._home_state): _DONE,
+        }
 
     def _reset_internal(self) -> None:
         pass
 
     def async_setup_listeners(
-        self, hass: HomeAssistant, on_state_change: callback
+        self, hass: HomeAssistant, on_state_change: CALLBACK_TYPE
     ) -> None:
-        @callback
-        def _handle_state_change(event: Event) -> None:
-            new_state = event.data.get("new_state")
-            old_state = event.data.get("old_state")
-            if not new_state:
-                return
-
-            if old_state is None or old_state.state in ("unavailable", "unknown"):
-                return
-
-            if new_state.state == self._away_state and self._state == SubState.IDLE:
-                self.set_state(SubState.ACTIVE)
-                on_state_change()
-            elif new_state.state == self._home_state and self._state == SubState.ACTIVE:
-                self.set_state(SubState.DONE)
-                on_state_change()
-
+        self._on_state_change = on_state_change
         unsub = async_track_state_change_event(
-            hass, [self._entity_id], _handle_state_change
+            hass, [self._entity_id], self._handle_state_change
         )
         self._listeners.append(unsub)
 
-    def extra_attributes(self, hass: HomeAssistant) -> dict[str, Any]:
-        state = hass.states.get(self._entity_id)
+    @callback
+    def _handle_state_change(self, event: Event) -> None:
+        if self._state is _DONE:
+            return
+        data = event.data
+        new_state = data.get("new_state")
+        if new_state is None:
+            return
+        old_state = data.get("old_state")
+        if old_state is None:
+            return
+        old_value = old_state.state
+        if old_value in UNAVAILABLE_STATES:
+            return
+        value = new_state.state
+        if old_value == value:
+            return  # attribute-only update
+
+        next_state = self._transitions.get((self._state, value))
+        if next_state is not None:
+            self.set_state(next_state)
+            self._on_state_change()
+
+    def _static_attributes(self) -> dict[str, Any]:
         return {
-            "detector_type": self.detector_type.value,
-            "state_entered_at": self._state_entered_at.isoformat(),
             "watched_entity": self._entity_id,
-            "watched_entity_state": state.state if state else None,
             "away_state": self._away_state,
             "home_state": self._home_state,
         }
 
-    def _snapshot_internal(self) -> dict[str, Any]:
-        return {}
+    def _add_attributes(self, hass: HomeAssistant, attrs: dict[str, Any]) -> None:
+        state = hass.states.get(self._entity_id)
+        attrs["watched_entity_state"] = state.state if state else None
 
     def _restore_internal(self, data: dict[str, Any]) -> None:
         pass
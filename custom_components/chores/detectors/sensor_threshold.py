@@ -3,12 +3,14 @@ from __future__ import annotations
 
 from typing import Any
 
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
 
-from ..const import DetectorType, SubState
+from ..const import UNAVAILABLE_STATES, DetectorType, SubState
 from .base import BaseDetector
 
+_DONE = SubState.DONE
+
 
 class SensorThresholdDetector(BaseDetector):
     """Detects when a sensor value crosses a numeric threshold.
@@ -20,6 +22,8 @@ class SensorThresholdDetector(BaseDetector):
     value already satisfies the condition when the completion is enabled.
     """
 
+    __slots__ = ("_entity_id", "_threshold", "_operator")
+
     detector_type = DetectorType.SENSOR_THRESHOLD
 
     def __init__(self, config: dict[str, Any]) -> None:
@@ -40,59 +44,62 @@ class SensorThresholdDetector(BaseDetector):
         pass
 
     def check_immediate(
-        self, hass: HomeAssistant, on_state_change: callback
+        self, hass: HomeAssistant, on_state_change: CALLBACK_TYPE
     ) -> None:
         """Check if threshold is already met right now."""
         state = hass.states.get(self._entity_id)
-        if state and state.state not in ("unknown", "unavailable"):
+        if state and state.state not in UNAVAILABLE_STATES:
             try:
                 value = float(state.state)
             except (ValueError, TypeError):
                 return
-            if self._check_threshold(value) and self._state != SubState.DONE:
-                self.set_state(SubState.DONE)
+            if self._check_threshold(value) and self._state is not _DONE:
+                self.set_state(_DONE)
                 on_state_change()
 
     def async_setup_listeners(
-        self, hass: HomeAssistant, on_state_change: callback
+        self, hass: HomeAssistant, on_state_change: CALLBACK_TYPE
     ) -> None:
-        @callback
-        def _handle_state_change(event: Event) -> None:
-            new_state = event.data.get("new_state")
-            if not new_state or new_state.state in ("unknown", "unavailable"):
-                return
-            try:
-                value = float(new_state.state)
-            except (ValueError, TypeError):
-                return
-            if self._check_threshold(value) and self._state != SubState.DONE:
-                self.set_state(SubState.DONE)
-                on_state_change()
-
+        self._on_state_change = on_state_change
         unsub = async_track_state_change_event(
-            hass, [self._entity_id], _handle_state_change
+            hass, [self._entity_id], self._handle_state_change
         )
         self._listeners.append(unsub)
 
-    def extra_attributes(self, hass: HomeAssistant) -> dict[str, Any]:
-        state = hass.states.get(self._entity_id)
-        current_value: float | str | None = None
-        if state and state.state not in ("unknown", "unavailable"):
-            try:
-                current_value = float(state.state)
-            except (ValueError, TypeError):
-                current_value = state.state
+    @callback
+    def _handle_state_change(self, event: Event) -> None:
+        if self._state is _DONE:
+            return
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            return
+        raw = new_state.state
+        if raw in UNAVAILABLE_STATES:
+            return
+        try:
+            value = float(raw)
+        except (ValueError, TypeError):
+            return
+        if self._check_threshold(value):
+            self.set_state(_DONE)
+            self._on_state_change()
+
+    def _static_attributes(self) -> dict[str, Any]:
         return {
-            "detector_type": self.detector_type.value,
-            "state_entered_at": self._state_entered_at.isoformat(),
             "watched_entity": self._entity_id,
-            "current_value": current_value,
             "threshold": self._threshold,
             "operator": self._operator,
         }
 
-    def _snapshot_internal(self) -> dict[str, Any]:
-        return {}
+    def _add_attributes(self, hass: HomeAssistant, attrs: dict[str, Any]) -> None:
+        state = hass.states.get(self._entity_id)
+        current_value: float | str | None = None
+        if state and state.state not in UNAVAILABLE_STATES:
+            try:
+                current_value = float(state.state)
+            except (ValueError, TypeError):
+                current_value = state.state
+        attrs["current_value"] = current_value
 
     def _restore_internal(self, data: dict[str, Any]) -> None:
         pass
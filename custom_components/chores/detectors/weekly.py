@@ -4,13 +4,20 @@ from __future__ import annotations
 from datetime import datetime, time, timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
 from ..const import DetectorType, SubState
 from .base import BaseDetector
-from .helpers import WEEKDAY_MAP, WEEKDAY_SHORT_NAMES
+from .helpers import (
+    WEEKDAY_MAP,
+    WEEKDAY_SHORT_NAMES,
+    async_track_time_shared,
+    parse_time,
+)
+
+_IDLE = SubState.IDLE
+_DONE = SubState.DONE
 
 
 class WeeklyDetector(BaseDetector):
@@ -20,25 +27,38 @@ class WeeklyDetector(BaseDetector):
     Gate logic (if any) is handled by the stage wrapper, not this detector.
     """
 
-    detector_type = DetectorType.WEEKLY
+    __slots__ = (
+        "_schedule",
+        "_schedule_attrs",
+        "_day_to_time",
+        "_time_fired_today",
+        "_next_trigger_cache",
+    )
 
-    @classmethod
-    def supported_stages(cls) -> frozenset[str]:
-        return frozenset({"trigger"})
+    detector_type = DetectorType.WEEKLY
+    _SUPPORTED_STAGES = frozenset({"trigger"})
 
     def __init__(self, config: dict[str, Any]) -> None:
         super().__init__(config)
         self._schedule: list[tuple[int, time]] = []
         for entry in config["schedule"]:
-            day_int = WEEKDAY_MAP[entry["day"]]
-            time_val = entry["time"]
-            if isinstance(time_val, str):
-                parts = time_val.split(":")
-                t = time(int(parts[0]), int(parts[1]))
-            else:
-                t = time_val
-            self._schedule.append((day_int, t))
+            self._schedule.append(
+                (WEEKDAY_MAP[entry["day"]], parse_time(entry["time"]))
+            )
+        # First scheduled time per weekday (Monday == 0); None on unscheduled days
+        day_to_time: list[time | None] = [None] * 7
+        for weekday, t in self._schedule:
+            if day_to_time[weekday] is None:
+                day_to_time[weekday] = t
+        self._day_to_time: tuple[time | None, ...] = tuple(day_to_time)
+        # The schedule never changes, so its attribute form is built once
+        self._schedule_attrs: list[dict[str, str]] = [
+            {"day": WEEKDAY_SHORT_NAMES[weekday], "time": t.isoformat()}
+            for weekday, t in self._schedule
+        ]
         self._time_fired_today: bool = False
+        # (next trigger, its ISO string); valid until that moment arrives
+        self._next_trigger_cache: tuple[datetime, str] | None = None
 
     @property
     def schedule(self) -> list[tuple[int, time]]:
@@ -46,8 +66,20 @@ class WeeklyDetector(BaseDetector):
 
     @property
     def next_trigger_datetime(self) -> datetime:
-        """Calculate the next trigger datetime across all schedule entries."""
+        """Next trigger datetime, recalculated only once it has passed."""
+        return self._next_trigger()[0]
+
+    def _next_trigger(self) -> tuple[datetime, str]:
         now = dt_util.now()
+        cached = self._next_trigger_cache
+        if cached is not None and now < cached[0]:
+            return cached
+        next_trigger = self._calculate_next_trigger(now)
+        self._next_trigger_cache = (next_trigger, next_trigger.isoformat())
+        return self._next_trigger_cache
+
+    def _calculate_next_trigger(self, now: datetime) -> datetime:
+        """Calculate the next trigger datetime across all schedule entries."""
         best: datetime | None = None
         for weekday, t in self._schedule:
             candidate = now.replace(
@@ -67,71 +99,66 @@ class WeeklyDetector(BaseDetector):
 
     def _todays_trigger_time(self, now: datetime) -> time | None:
         """Return the scheduled trigger time for today, or None."""
-        current_day = now.weekday()
-        for weekday, t in self._schedule:
-            if weekday == current_day:
-                return t
-        return None
+        return self._day_to_time[now.weekday()]
 
     def _reset_internal(self) -> None:
         self._time_fired_today = False
 
     def async_setup_listeners(
-        self, hass: HomeAssistant, on_state_change: callback
+        self, hass: HomeAssistant, on_state_change: CALLBACK_TYPE
     ) -> None:
-        times_to_days: dict[time, set[int]] = {}
-        for weekday, t in self._schedule:
-            times_to_days.setdefault(t, set()).add(weekday)
-
-        for trigger_time, valid_days in times_to_days.items():
-
-            @callback
-            def _handle_time(now: datetime, _days: set[int] = valid_days) -> None:
-                if self._state != SubState.IDLE:
-                    return
-                if now.weekday() not in _days:
-                    return
-                self._time_fired_today = True
-                self.set_state(SubState.DONE)
-                on_state_change()
-
-            unsub_time = async_track_time_change(
-                hass, _handle_time,
-                hour=trigger_time.hour, minute=trigger_time.minute, second=0,
+        self._on_state_change = on_state_change
+        # Chores sharing a time of day share one HA time listener
+        for trigger_time in dict.fromkeys(t for _, t in self._schedule):
+            unsub_time = async_track_time_shared(
+                hass, trigger_time.hour, trigger_time.minute, self._handle_time
             )
             self._listeners.append(unsub_time)
 
-    def evaluate(self, hass: HomeAssistant) -> SubState:
+    @callback
+    def _handle_time(self, now: datetime) -> None:
+        if self._state is not _IDLE:
+            return
+        weekday = now.weekday()
+        if not any(
+            day == weekday and t.hour == now.hour and t.minute == now.minute
+            for day, t in self._schedule
+        ):
+            return
+        self._time_fired_today = True
+        self.set_state(_DONE)
+        self._on_state_change()
+
+    def evaluate(self, hass: HomeAssistant, now: datetime | None = None) -> SubState:
         """Check if we've passed a scheduled trigger time today (handles startup)."""
-        if self._state == SubState.IDLE and not self._time_fired_today:
-            now = dt_util.now()
-            trigger_time = self._todays_trigger_time(now)
-            if trigger_time is not None:
-                today_trigger = now.replace(
-                    hour=trigger_time.hour,
-                    minute=trigger_time.minute,
-                    second=0,
-                    microsecond=0,
-                )
-                if now >= today_trigger:
-                    self._time_fired_today = True
-                    self.set_state(SubState.DONE)
+        if not self.can_transition_on_poll():
+            return self._state
+        now = dt_util.as_local(now) if now is not None else dt_util.now()
+        trigger_time = self._todays_trigger_time(now)
+        if trigger_time is not None:
+            today_trigger = now.replace(
+                hour=trigger_time.hour,
+                minute=trigger_time.minute,
+                second=0,
+                microsecond=0,
+            )
+            if now >= today_trigger:
+                self._time_fired_today = True
+                self.set_state(_DONE)
         return self._state
 
-    def extra_attributes(self, hass: HomeAssistant) -> dict[str, Any]:
-        return {
-            "detector_type": self.detector_type.value,
-            "state_entered_at": self._state_entered_at.isoformat(),
-            "schedule": [
-                {"day": WEEKDAY_SHORT_NAMES[weekday], "time": t.isoformat()}
-                for weekday, t in self._schedule
-            ],
-            "next_trigger": self.next_trigger_datetime.isoformat(),
-            "time_fired_today": self._time_fired_today,
-        }
-
-    def _snapshot_internal(self) -> dict[str, Any]:
-        return {"time_fired_today": self._time_fired_today}
+    def can_transition_on_poll(self) -> bool:
+        return self._state is _IDLE and not self._time_fired_today
+
+    def _static_attributes(self) -> dict[str, Any]:
+        return {"schedule": self._schedule_attrs}
+
+    def _add_attributes(self, hass: HomeAssistant, attrs: dict[str, Any]) -> None:
+        attrs["next_trigger"] = self._next_trigger()[1]
+        attrs["time_fired_today"] = self._time_fired_today
+
+    def _add_snapshot(self, data: dict[str, Any]) -> None:
+        data["time_fired_today"] = self._time_fired_today
 
     def _restore_internal(self, data: dict[str, Any]) -> None:
         self._time_fired_today = data.get("time_fired_today", False)
@@ -14,10 +14,13 @@ async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    coordinator: ChoresCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator: ChoresCoordinator | None = hass.data[DOMAIN]["entries"][
+        entry.entry_id
+    ]["coordinator"]
+    chores = coordinator.chores if coordinator is not None else {}
 
     chores_data = {}
-    for chore_id, chore in coordinator.chores.items():
+    for chore_id, chore in chores.items():
         # Trigger display info
         trigger_sensor_cfg = chore.trigger.sensor_config or {}
         trigger_info = {
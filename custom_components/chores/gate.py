@@ -17,6 +17,8 @@ from typing import Any
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
 
+from .const import UNAVAILABLE_STATES
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -25,8 +27,13 @@ class Gate:
 
     Used by TriggerStage and CompletionStage to hold a detector at ACTIVE
     until the gate condition is satisfied.
+
+    Each stage owns its own Gate: the instance carries that stage's
+    listener, so gates are not shared even when configs are identical.
     """
 
+    __slots__ = ("_entity_id", "_expected_state", "_listeners")
+
     def __init__(self, config: dict[str, Any]) -> None:
         self._entity_id: str = config["entity_id"]
         self._expected_state: str = config["state"]
@@ -48,7 +55,7 @@ class Gate:
     def async_setup_listener(
         self,
         hass: HomeAssistant,
-        on_gate_change: callback,
+        on_gate_change: CALLBACK_TYPE,
     ) -> None:
         """Listen for gate entity state changes.
 
@@ -65,7 +72,7 @@ class Gate:
             # Ignore startup/reconnection events so that HA restoring state
             # while the gate entity comes online does not silently satisfy
             # the gate without a genuine state transition.
-            if old_state is None or old_state.state in ("unavailable", "unknown"):
+            if old_state is None or old_state.state in UNAVAILABLE_STATES:
                 return
             if new_state and new_state.state == self._expected_state:
                 on_gate_change()
@@ -93,9 +93,9 @@ _COMPLETED_DEFAULT = "Completed"
 
 def _get_chore(hass: HomeAssistant, chore_id: str) -> Any | None:
     """Look up a Chore instance from hass.data."""
-    for entry_data in hass.data.get(DOMAIN, {}).values():
-        if isinstance(entry_data, dict) and "coordinator" in entry_data:
-            coordinator = entry_data["coordinator"]
+    for entry_data in hass.data.get(DOMAIN, {}).get("entries", {}).values():
+        coordinator = entry_data["coordinator"]
+        if coordinator is not None:
             chore = coordinator.get_chore(chore_id)
             if chore:
                 return chore
@@ -15,6 +15,7 @@ from typing import Any
 from homeassistant.util import dt as dt_util
 
 from .const import ResetType, TriggerType
+from .detectors.helpers import parse_time
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -121,6 +122,7 @@ class DailyReset(BaseReset):
 
     def __init__(self, reset_time: time) -> None:
         self._reset_time = reset_time
+        self._reset_time_iso = reset_time.isoformat()
 
     def _next_occurrence_after(self, after: datetime) -> datetime:
         """Return the next occurrence of reset_time after *after*."""
@@ -146,7 +148,7 @@ class DailyReset(BaseReset):
 
     def extra_attributes(self, completed_at: datetime | None) -> dict[str, Any]:
         attrs = super().extra_attributes(completed_at)
-        attrs["reset_time"] = self._reset_time.isoformat()
+        attrs["reset_time"] = self._reset_time_iso
         return attrs
 
 
@@ -165,6 +167,7 @@ class ImplicitDailyReset(BaseReset):
 
     def __init__(self, trigger_time: time) -> None:
         self._trigger_time = trigger_time
+        self._trigger_time_iso = trigger_time.isoformat()
 
     def _next_occurrence_after(self, after: datetime) -> datetime:
         """Return the next occurrence of trigger_time after *after*."""
@@ -190,7 +193,7 @@ class ImplicitDailyReset(BaseReset):
 
     def extra_attributes(self, completed_at: datetime | None) -> dict[str, Any]:
         attrs = super().extra_attributes(completed_at)
-        attrs["trigger_time"] = self._trigger_time.isoformat()
+        attrs["trigger_time"] = self._trigger_time_iso
         return attrs
 
 
@@ -284,37 +287,21 @@ def create_reset(config: dict[str, Any] | None, trigger_type: TriggerType, trigg
         if reset_type == "delay":
             return DelayReset(minutes=config.get("minutes", 0))
         if reset_type == "daily_reset":
-            time_val = config.get("time", "00:00")
-            if isinstance(time_val, str):
-                parts = time_val.split(":")
-                t = time(int(parts[0]), int(parts[1]))
-            else:
-                t = time_val
-            return DailyReset(reset_time=t)
+            return DailyReset(reset_time=parse_time(config.get("time", "00:00")))
 
     # Default resets based on trigger type
     if trigger_type == TriggerType.DAILY:
-        time_val = trigger_config.get("time", "00:00")
-        if isinstance(time_val, str):
-            parts = time_val.split(":")
-            t = time(int(parts[0]), int(parts[1]))
-        else:
-            t = time_val
-        return ImplicitDailyReset(trigger_time=t)
+        return ImplicitDailyReset(
+            trigger_time=parse_time(trigger_config.get("time", "00:00"))
+        )
 
     if trigger_type == TriggerType.WEEKLY:
         from .triggers import WEEKDAY_MAP
 
-        schedule: list[tuple[int, time]] = []
-        for entry in trigger_config.get("schedule", []):
-            day_int = WEEKDAY_MAP[entry["day"]]
-            time_val = entry["time"]
-            if isinstance(time_val, str):
-                parts = time_val.split(":")
-                t = time(int(parts[0]), int(parts[1]))
-            else:
-                t = time_val
-            schedule.append((day_int, t))
+        schedule: list[tuple[int, time]] = [
+            (WEEKDAY_MAP[entry["day"]], parse_time(entry["time"]))
+            for entry in trigger_config.get("schedule", [])
+        ]
         return ImplicitWeeklyReset(schedule=schedule)
 
     # power_cycle, state_change, duration -> immediate reset
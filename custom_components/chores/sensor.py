@@ -21,7 +21,6 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import (
     AddEntitiesCallback,
@@ -38,13 +37,16 @@ from .const import (
     SERVICE_FORCE_DUE,
     SERVICE_FORCE_INACTIVE,
     ChoreState,
-    CompletionType,
     SubState,
     TriggerType,
 )
 from .coordinator import ChoresCoordinator
 _LOGGER = logging.getLogger(__name__)
 
+_IDLE = SubState.IDLE
+_ACTIVE = SubState.ACTIVE
+_DONE = SubState.DONE
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # Detector sensor defaults registry
@@ -110,7 +112,9 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up sensor entities."""
-    coordinator: ChoresCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator: ChoresCoordinator = hass.data[DOMAIN]["entries"][entry.entry_id][
+        "coordinator"
+    ]
 
     entities: list[SensorEntity] = []
 
@@ -123,7 +127,7 @@ async def async_setup_entry(
 
         # Completion progress sensor (always created except for manual, which has
         # no sensor-detectable progress; sensor: block overrides defaults)
-        if chore.completion.completion_type != CompletionType.MANUAL:
+        if not chore.completion_is_manual:
             entities.append(CompletionProgressSensor(coordinator, chore, entry))
 
         # Reset progress sensor (always created)
@@ -161,6 +165,8 @@ async def async_setup_entry(
 class ChoreStateSensor(CoordinatorEntity[ChoresCoordinator], SensorEntity):
     """Main chore state machine sensor."""
 
+    __slots__ = ("_chore", "_attrs_cache")
+
     _attr_has_entity_name = True
     _attr_translation_key = "chore_state"
 
@@ -172,11 +178,10 @@ class ChoreStateSensor(CoordinatorEntity[ChoresCoordinator], SensorEntity):
     ) -> None:
         super().__init__(coordinator)
         self._chore = chore
+        self._attrs_cache: dict[str, Any] | None = None
         self._attr_unique_id = f"{DOMAIN}_{chore.id}"
         self._attr_name = "Chore"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, chore.id)},
-        )
+        self._attr_device_info = chore.device_info
         self._attr_options = [s.value for s in ChoreState]
         self._attr_device_class = SensorDeviceClass.ENUM
 
@@ -190,10 +195,14 @@ class ChoreStateSensor(CoordinatorEntity[ChoresCoordinator], SensorEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        return self._chore.to_state_dict(self.coordinator.hass)
+        # Rebuilt only after a coordinator update invalidates the cache
+        if self._attrs_cache is None:
+            self._attrs_cache = self._chore.to_state_dict(self.coordinator.hass)
+        return self._attrs_cache
 
     @callback
     def _handle_coordinator_update(self) -> None:
+        self._attrs_cache = None
         self.async_write_ha_state()
 
     # ── Entity services ─────────────────────────────────────────────
@@ -240,9 +249,7 @@ class DetectorProgressSensor(CoordinatorEntity[ChoresCoordinator], SensorEntity)
         self._stage = stage
         sensor_cfg = stage.sensor_config or {}
         self._attr_unique_id = f"{DOMAIN}_{chore.id}_{suffix}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, chore.id)},
-        )
+        self._attr_device_info = chore.device_info
         self._attr_options = [s.value for s in SubState]
         self._attr_device_class = SensorDeviceClass.ENUM
 
@@ -263,11 +270,11 @@ class DetectorProgressSensor(CoordinatorEntity[ChoresCoordinator], SensorEntity)
     @property
     def icon(self) -> str | None:
         state = self._stage.state
-        if state == SubState.IDLE:
+        if state is _IDLE:
             return self._icon_idle
-        if state == SubState.ACTIVE:
+        if state is _ACTIVE:
             return self._icon_active
-        if state == SubState.DONE:
+        if state is _DONE:
             return self._icon_done
         return self._icon_idle
 
@@ -350,21 +357,19 @@ class ResetProgressSensor(CoordinatorEntity[ChoresCoordinator], SensorEntity):
         self._chore = chore
         self._attr_unique_id = f"{DOMAIN}_{chore.id}_reset"
         self._attr_name = "Reset Detector"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, chore.id)},
-        )
+        self._attr_device_info = chore.device_info
         self._attr_options = self._RESET_STATES
         self._attr_device_class = SensorDeviceClass.ENUM
 
     @property
     def native_value(self) -> str:
-        if self._chore.state == ChoreState.COMPLETED:
+        if self._chore.state is ChoreState.COMPLETED:
             return "waiting"
         return "idle"
 
     @property
     def icon(self) -> str:
-        if self._chore.state == ChoreState.COMPLETED:
+        if self._chore.state is ChoreState.COMPLETED:
             return "mdi:timer-sand"
         return "mdi:restart"
 
@@ -372,7 +377,7 @@ class ResetProgressSensor(CoordinatorEntity[ChoresCoordinator], SensorEntity):
     def extra_state_attributes(self) -> dict[str, Any]:
         completed_at = (
             self._chore.state_entered_at
-            if self._chore.state == ChoreState.COMPLETED
+            if self._chore.state is ChoreState.COMPLETED
             else None
         )
         return self._chore.reset_handler.extra_attributes(completed_at)
@@ -404,9 +409,7 @@ class LastCompletedSensor(CoordinatorEntity[ChoresCoordinator], SensorEntity):
         self._attr_unique_id = f"{DOMAIN}_{chore.id}_last_completed"
         self._attr_name = "Last Completed"
         self._attr_device_class = SensorDeviceClass.TIMESTAMP
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, chore.id)},
-        )
+        self._attr_device_info = chore.device_info
 
     @property
     def icon(self) -> str:
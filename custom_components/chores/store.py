@@ -8,7 +8,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
 from .const import DOMAIN
@@ -17,6 +17,8 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = DOMAIN
 STORAGE_VERSION = 2
+# Seconds to wait for further changes before writing them out
+SAVE_DELAY = 0.5
 
 
 class ChoreStore:
@@ -26,6 +28,8 @@ class ChoreStore:
         self._hass = hass
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
         self._data: dict[str, Any] = {}
+        # True when in-memory data differs from what was last written
+        self._dirty: bool = False
 
     async def async_load(self) -> None:
         """Load stored data."""
@@ -36,10 +40,26 @@ class ChoreStore:
             self._data = {"chores": {}}
         _LOGGER.debug("Loaded store with %d chores", len(self._data.get("chores", {})))
 
+    @property
+    def dirty(self) -> bool:
+        """Whether there are changes that have not been saved yet."""
+        return self._dirty
+
     async def async_save(self) -> None:
         """Save current data to disk."""
+        self._dirty = False
         await self._store.async_save(self._data)
 
+    @callback
+    def async_delay_save(self) -> None:
+        """Save after SAVE_DELAY; further calls in that window push it back."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data for a delayed save (called when it is written)."""
+        self._dirty = False
+        return self._data
+
     def get_chore_state(self, chore_id: str) -> dict[str, Any] | None:
         """Get persisted state for a chore."""
         return self._data.get("chores", {}).get(chore_id)
@@ -49,11 +69,13 @@ class ChoreStore:
         if "chores" not in self._data:
             self._data["chores"] = {}
         self._data["chores"][chore_id] = state_data
+        self._dirty = True
 
     def remove_chore_state(self, chore_id: str) -> None:
         """Remove stored state for a chore."""
         if "chores" in self._data:
-            self._data["chores"].pop(chore_id, None)
+            if self._data["chores"].pop(chore_id, None) is not None:
+                self._dirty = True
 
     @property
     def chore_ids(self) -> list[str]:
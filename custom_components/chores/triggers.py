@@ -18,7 +18,7 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 
 from .const import DetectorType, SubState, TriggerType
 from .detectors import (
@@ -31,6 +31,9 @@ from .gate import Gate
 
 _LOGGER = logging.getLogger(__name__)
 
+_ACTIVE = SubState.ACTIVE
+_DONE = SubState.DONE
+
 # Re-export for backwards compat (resets.py imports WEEKDAY_MAP from triggers)
 __all__ = [
     "TriggerStage",
@@ -49,12 +52,30 @@ class TriggerStage:
     expect from trigger objects.
     """
 
+    __slots__ = (
+        "_detector",
+        "_trigger_type",
+        "_gate",
+        "_gate_holding",
+        "_has_next_trigger",
+        "_hass",
+        "_on_state_change",
+    )
+
     def __init__(self, config: dict[str, Any]) -> None:
         self._detector: BaseDetector = create_detector(config)
+        self._trigger_type = TriggerType(self._detector.type_value)
         self._gate: Gate | None = None
         if config.get("gate"):
             self._gate = Gate(config["gate"])
         self._gate_holding: bool = False
+        # Only time-based detectors (daily/weekly) predict their next firing
+        self._has_next_trigger: bool = hasattr(
+            type(self._detector), "next_trigger_datetime"
+        )
+        # Stored during setup for the listener methods
+        self._hass: HomeAssistant | None = None
+        self._on_state_change: CALLBACK_TYPE | None = None
 
     # ── Properties ──────────────────────────────────────────────────
 
@@ -66,7 +87,7 @@ class TriggerStage:
     @property
     def trigger_type(self) -> TriggerType:
         """Backwards-compat trigger type enum."""
-        return TriggerType(self._detector.detector_type.value)
+        return self._trigger_type
 
     @property
     def detector_type(self) -> DetectorType:
@@ -76,7 +97,7 @@ class TriggerStage:
     def state(self) -> SubState:
         """Return effective state, accounting for gate holding."""
         if self._gate_holding:
-            return SubState.ACTIVE
+            return _ACTIVE
         return self._detector.state
 
     @property
@@ -94,79 +115,100 @@ class TriggerStage:
     @property
     def next_trigger_datetime(self) -> datetime | None:
         """Delegate to detector if it supports this (Daily/Weekly)."""
-        return getattr(self._detector, "next_trigger_datetime", None)
+        if not self._has_next_trigger:
+            return None
+        return self._detector.next_trigger_datetime
 
     @property
     def has_gate(self) -> bool:
         return self._gate is not None
 
+    @property
+    def needs_poll(self) -> bool:
+        """Whether evaluate() can change anything on a coordinator poll."""
+        return self._detector.needs_poll or self._gate is not None
+
     # ── State management ────────────────────────────────────────────
 
     def set_state(self, new_state: SubState) -> bool:
         """Set detector state directly (used by force actions)."""
-        if new_state == SubState.DONE:
+        if new_state is _DONE:
             # Force actions bypass gate
-            self._gate_holding = False
+            self._set_gate_holding(False)
         return self._detector.set_state(new_state)
 
     def reset(self) -> None:
         """Reset trigger to idle."""
-        self._gate_holding = False
+        self._set_gate_holding(False)
         self._detector.reset()
 
     # ── Listener management ─────────────────────────────────────────
 
     def async_setup_listeners(
-        self, hass: HomeAssistant, on_state_change: callback
+        self, hass: HomeAssistant, on_state_change: CALLBACK_TYPE
     ) -> None:
         """Set up listeners for the detector and optional gate."""
-
-        @callback
-        def _on_detector_change() -> None:
-            """Intercept detector state changes to apply gate logic."""
-            if self._detector.state == SubState.DONE and self._gate is not None:
-                if self._gate.is_met(hass):
-                    self._gate_holding = False
-                else:
-                    self._gate_holding = True
+        self._hass = hass
+        self._on_state_change = on_state_change
+        self._detector.async_setup_listeners(hass, self._on_detector_change)
+        if self._gate is not None and self._gate_holding:
+            self._gate.async_setup_listener(hass, self._on_gate_met)
+
+    @callback
+    def _on_detector_change(self) -> None:
+        """Intercept detector state changes to apply gate logic."""
+        if self._detector.state is _DONE and self._gate is not None:
+            if self._gate.is_met(self._hass):
+                self._set_gate_holding(False)
             else:
-                self._gate_holding = False
-            on_state_change()
-
-        self._detector.async_setup_listeners(hass, _on_detector_change)
-
-        if self._gate is not None:
-
-            @callback
-            def _on_gate_met() -> None:
-                """Gate entity entered expected state."""
-                if self._gate_holding and self._gate.is_met(hass):
-                    self._gate_holding = False
-                    on_state_change()
-
-            self._gate.async_setup_listener(hass, _on_gate_met)
+                self._set_gate_holding(True)
+        else:
+            self._set_gate_holding(False)
+        self._on_state_change()
+
+    @callback
+    def _on_gate_met(self) -> None:
+        """Gate entity entered expected state."""
+        if self._gate_holding and self._gate.is_met(self._hass):
+            self._set_gate_holding(False)
+            self._on_state_change()
 
     def async_remove_listeners(self) -> None:
         """Remove all registered listeners."""
+        self._hass = None
         self._detector.async_remove_listeners()
         if self._gate:
             self._gate.async_remove_listeners()
 
+    def _set_gate_holding(self, holding: bool) -> None:
+        """Update gate holding; the gate is only listened to while holding."""
+        if holding == self._gate_holding:
+            return
+        self._gate_holding = holding
+        if self._gate is None or self._hass is None:
+            return  # not set up yet; async_setup_listeners subscribes if holding
+        if holding:
+            self._gate.async_setup_listener(self._hass, self._on_gate_met)
+        else:
+            self._gate.async_remove_listeners()
+
     # ── Polling ──────────────────────────────────────────────────────
 
-    def evaluate(self, hass: HomeAssistant) -> SubState:
-        """Evaluate on every coordinator poll."""
-        old_state = self._detector.state
-        self._detector.evaluate(hass)
+    def evaluate(self, hass: HomeAssistant, now: datetime | None = None) -> SubState:
+        """Evaluate on every coordinator poll (``now`` is passed to the detector)."""
+        detector = self._detector
+        old_state = detector.state
+        if detector.needs_poll and detector.can_transition_on_poll():
+            detector.evaluate(hass, now)
 
         # If detector just transitioned to DONE, apply gate logic
-        if self._detector.state == SubState.DONE and old_state != SubState.DONE:
+        if detector.state is _DONE and old_state is not _DONE:
             if self._gate is not None and not self._gate.is_met(hass):
-                self._gate_holding = True
+                self._set_gate_holding(True)
 
         # If holding for gate, check if gate is now met
         if self._gate_holding and self._gate is not None and self._gate.is_met(hass):
-            self._gate_holding = False
+            self._set_gate_holding(False)
 
         return self.state
 
@@ -174,10 +216,7 @@ class TriggerStage:
 
     def extra_attributes(self, hass: HomeAssistant) -> dict[str, Any]:
         """Return attributes for the progress sensor."""
-        attrs = self._detector.extra_attributes(hass)
-        # Remap detector_type -> trigger_type for backwards compat
-        if "detector_type" in attrs:
-            attrs["trigger_type"] = attrs.pop("detector_type")
+        attrs = self._detector.extra_attributes(hass, "trigger_type")
         if self._gate:
             attrs.update(self._gate.extra_attributes(hass))
         return attrs
@@ -193,7 +232,7 @@ class TriggerStage:
     def restore_state(self, data: dict[str, Any]) -> None:
         """Restore state from persistence."""
         self._detector.restore_state(data)
-        self._gate_holding = data.get("gate_holding", False)
+        self._set_gate_holding(data.get("gate_holding", False))
 
 
 # Backwards-compat alias for type hints in other modules
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import sys
 import types
+from contextlib import contextmanager
 from datetime import datetime, time, timezone
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -102,6 +103,7 @@ class _StubDataUpdateCoordinator:
         self.name = name
         self.update_interval = update_interval
         self.data = {}
+        self._listeners = {}
 
     def __class_getitem__(cls, item):
         return cls
@@ -318,19 +320,21 @@ def hass():
     return MockHass()
 
 
-def setup_listeners_capturing(hass, component, on_change=None):
-    """Set up listeners on a trigger/completion/detector while capturing the callbacks.
+@contextmanager
+def capture_listeners(hass, state_listeners=None, time_listeners=None):
+    """Capture listener callbacks registered inside the ``with`` block.
 
     Patches async_track_state_change_event, async_track_time_change, and
     async_call_later across all detector modules and gate.py so the inner
-    listener callbacks are stored on hass for direct invocation.
-    Returns (state_listeners, time_listeners, on_change) lists of captured callbacks.
+    listener callbacks are stored on hass for direct invocation.  Completion
+    stages only subscribe their detector while enabled, so wrap enable()
+    calls made after setup in this context.
+    Yields the (state_listeners, time_listeners) lists.
     """
-    if on_change is None:
-        on_change = MagicMock()
-
-    state_listeners: list[Any] = []
-    time_listeners: list[Any] = []
+    if state_listeners is None:
+        state_listeners = []
+    if time_listeners is None:
+        time_listeners = []
 
     def _fake_track_state(hass_arg, entities, cb):
         state_listeners.append(cb)
@@ -342,6 +346,7 @@ def setup_listeners_capturing(hass, component, on_change=None):
         time_listeners.append(cb)
         hass._last_time_listener = cb
         unsub = MagicMock()
+        hass._last_time_unsub = unsub
         return unsub
 
     def _fake_call_later(hass_arg, delay, cb):
@@ -364,8 +369,12 @@ def setup_listeners_capturing(hass, component, on_change=None):
         f"{_det}.sensor_threshold",
         "custom_components.chores.gate",
     ]
-    _time_modules = [f"{_det}.daily", f"{_det}.weekly"]
-    _call_later_modules = [f"{_det}.contact_cycle"]
+    _time_modules = [f"{_det}.helpers"]
+    _call_later_modules = [
+        f"{_det}.contact_cycle",
+        f"{_det}.duration",
+        f"{_det}.power_cycle",
+    ]
 
     patches = []
     for mod in _state_modules:
@@ -378,14 +387,43 @@ def setup_listeners_capturing(hass, component, on_change=None):
     for p in patches:
         p.start()
     try:
-        component.async_setup_listeners(hass, on_change)
+        yield state_listeners, time_listeners
     finally:
         for p in patches:
             p.stop()
 
+
+def setup_listeners_capturing(hass, component, on_change=None):
+    """Set up listeners on a trigger/completion/detector while capturing the callbacks.
+
+    Returns (state_listeners, time_listeners, on_change) lists of captured callbacks.
+    """
+    if on_change is None:
+        on_change = MagicMock()
+
+    with capture_listeners(hass) as (state_listeners, time_listeners):
+        component.async_setup_listeners(hass, on_change)
+
     return state_listeners, time_listeners, on_change
 
 
+def capture_gate_listeners(state_listeners: list[Any]):
+    """Patch gate.py's state tracking so gate listeners land in state_listeners.
+
+    Stages only subscribe to their gate while holding, which happens inside
+    a detector callback after setup_listeners_capturing has returned.
+    """
+
+    def _fake_track_state(hass_arg, entities, cb):
+        state_listeners.append(cb)
+        return MagicMock()
+
+    return patch(
+        "custom_components.chores.gate.async_track_state_change_event",
+        _fake_track_state,
+    )
+
+
 # ── Helper to create HA state-change Events ─────────────────────────
 
 
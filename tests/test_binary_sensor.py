@@ -112,3 +112,14 @@ class TestNeedsAttentionBinarySensor:
         attrs = sensor.extra_state_attributes
         assert attrs["chore_state"] == ChoreState.DUE.value
         assert attrs["due_since"] is not None
+
+    def test_attributes_cached_until_coordinator_update(self):
+        chore = Chore(daily_manual_config())
+        sensor = NeedsAttentionBinarySensor(
+            _make_coordinator_mock(), chore, _make_entry_mock()
+        )
+        attrs = sensor.extra_state_attributes
+        assert sensor.extra_state_attributes is attrs
+        chore.force_due()
+        sensor._handle_coordinator_update()
+        assert sensor.extra_state_attributes["chore_state"] == ChoreState.DUE.value
@@ -4,11 +4,7 @@ from __future__ import annotations
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
-from custom_components.chores.button import (
-    ForceCompleteButton,
-    ForceDueButton,
-    ForceInactiveButton,
-)
+from custom_components.chores.button import FORCE_BUTTONS, ChoreForceButton
 from custom_components.chores.chore_core import Chore
 from custom_components.chores.const import DOMAIN
 from conftest import daily_manual_config
@@ -22,98 +18,84 @@ def _make_coordinator_mock() -> MagicMock:
     return coord
 
 
+def _make_button(key: str) -> tuple[ChoreForceButton, Chore, MagicMock]:
+    spec = next(spec for spec in FORCE_BUTTONS if spec.key == key)
+    chore = Chore(daily_manual_config())
+    coord = _make_coordinator_mock()
+    return ChoreForceButton(coord, chore, spec), chore, coord
+
+
+class TestForceButtonTable:
+    def test_three_buttons(self):
+        assert [spec.key for spec in FORCE_BUTTONS] == [
+            "force_due",
+            "force_inactive",
+            "force_complete",
+        ]
+
+    def test_actions_exist_on_coordinator(self):
+        from custom_components.chores.coordinator import ChoresCoordinator
+
+        for spec in FORCE_BUTTONS:
+            assert callable(getattr(ChoresCoordinator, spec.action))
+
+
 class TestForceDueButton:
     def test_unique_id(self):
-        chore = Chore(daily_manual_config())
-        coord = _make_coordinator_mock()
-        btn = ForceDueButton(coord, chore)
-
+        btn, chore, _ = _make_button("force_due")
         assert btn._attr_unique_id == f"{DOMAIN}_{chore.id}_force_due"
 
     def test_name(self):
-        chore = Chore(daily_manual_config())
-        coord = _make_coordinator_mock()
-        btn = ForceDueButton(coord, chore)
-
+        btn, _, _ = _make_button("force_due")
         assert btn._attr_name == "Force Due"
 
     def test_icon(self):
-        chore = Chore(daily_manual_config())
-        coord = _make_coordinator_mock()
-        btn = ForceDueButton(coord, chore)
-
+        btn, _, _ = _make_button("force_due")
         assert btn._attr_icon == "mdi:alert-circle"
 
     @pytest.mark.asyncio
     async def test_press_calls_coordinator(self):
-        chore = Chore(daily_manual_config())
-        coord = _make_coordinator_mock()
-        btn = ForceDueButton(coord, chore)
-
+        btn, chore, coord = _make_button("force_due")
         await btn.async_press()
         coord.async_force_due.assert_awaited_once_with(chore.id)
 
 
 class TestForceInactiveButton:
     def test_unique_id(self):
-        chore = Chore(daily_manual_config())
-        coord = _make_coordinator_mock()
-        btn = ForceInactiveButton(coord, chore)
-
+        btn, chore, _ = _make_button("force_inactive")
         assert btn._attr_unique_id == f"{DOMAIN}_{chore.id}_force_inactive"
 
     def test_name(self):
-        chore = Chore(daily_manual_config())
-        coord = _make_coordinator_mock()
-        btn = ForceInactiveButton(coord, chore)
-
+        btn, _, _ = _make_button("force_inactive")
         assert btn._attr_name == "Force Inactive"
 
     def test_icon(self):
-        chore = Chore(daily_manual_config())
-        coord = _make_coordinator_mock()
-        btn = ForceInactiveButton(coord, chore)
-
+        btn, _, _ = _make_button("force_inactive")
         assert btn._attr_icon == "mdi:cancel"
 
     @pytest.mark.asyncio
     async def test_press_calls_coordinator(self):
-        chore = Chore(daily_manual_config())
-        coord = _make_coordinator_mock()
-        btn = ForceInactiveButton(coord, chore)
-
+        btn, chore, coord = _make_button("force_inactive")
         await btn.async_press()
         coord.async_force_inactive.assert_awaited_once_with(chore.id)
 
 
 class TestForceCompleteButton:
     def test_unique_id(self):
-        chore = Chore(daily_manual_config())
-        coord = _make_coordinator_mock()
-        btn = ForceCompleteButton(coord, chore)
-
+        btn, chore, _ = _make_button("force_complete")
         assert btn._attr_unique_id == f"{DOMAIN}_{chore.id}_force_complete"
 
     def test_name(self):
-        chore = Chore(daily_manual_config())
-        coord = _make_coordinator_mock()
-        btn = ForceCompleteButton(coord, chore)
-
+        btn, _, _ = _make_button("force_complete")
         assert btn._attr_name == "Force Complete"
 
     def test_icon(self):
-        chore = Chore(daily_manual_config())
-        coord = _make_coordinator_mock()
-        btn = ForceCompleteButton(coord, chore)
-
+        btn, _, _ = _make_button("force_complete")
         assert btn._attr_icon == "mdi:check-circle"
 
     @pytest.mark.asyncio
     async def test_press_calls_coordinator(self):
-        chore = Chore(daily_manual_config())
-        coord = _make_coordinator_mock()
-        btn = ForceCompleteButton(coord, chore)
-
+        btn, chore, coord = _make_button("force_complete")
         await btn.async_press()
         coord.async_force_complete.assert_awaited_once_with(chore.id)
 
@@ -125,8 +107,8 @@ class TestDeviceInfo:
         chore = Chore(daily_manual_config())
         coord = _make_coordinator_mock()
 
-        for BtnClass in [ForceDueButton, ForceInactiveButton, ForceCompleteButton]:
-            btn = BtnClass(coord, chore)
+        for spec in FORCE_BUTTONS:
+            btn = ChoreForceButton(coord, chore, spec)
             info = btn._attr_device_info
             assert info is not None
             # DeviceInfo is our _StubDeviceInfo (dict subclass with attrs)
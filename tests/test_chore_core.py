@@ -1,8 +1,8 @@
 """Tests for chore_core.py — Chore state machine orchestrator."""
 from __future__ import annotations
 
-from datetime import time, timedelta
-from unittest.mock import MagicMock
+from datetime import datetime, time, timedelta
+from unittest.mock import MagicMock, patch
 
 from freezegun import freeze_time
 
@@ -17,6 +17,7 @@ from conftest import (
 )
 
 from custom_components.chores.chore_core import Chore
+from custom_components.chores.triggers import TriggerStage
 from custom_components.chores.const import ChoreState, CompletionType, SubState
 
 from homeassistant.util import dt as dt_util
@@ -33,6 +34,10 @@ class TestChoreInit:
         assert c.trigger_type == "daily"
         assert c.completion_type == "manual"
 
+    def test_completion_is_manual(self):
+        assert Chore(daily_manual_config()).completion_is_manual is True
+        assert Chore(daily_gate_contact_config()).completion_is_manual is False
+
     def test_initial_state(self):
         c = Chore(daily_manual_config())
         assert c.state == ChoreState.INACTIVE
@@ -60,6 +65,12 @@ class TestChoreInit:
         c = Chore(config)
         assert c.state_label == "All Good"
 
+    def test_default_labels_and_icons_shared(self):
+        a = Chore(daily_manual_config())
+        b = Chore(power_cycle_config())
+        assert a._state_labels is b._state_labels
+        assert a._state_icons is b._state_icons
+
     def test_description_and_context(self):
         c = Chore(daily_gate_contact_config())
         state_dict = c.to_state_dict(MockHass())
@@ -79,6 +90,15 @@ class TestChoreInit:
         assert Chore(duration_contact_cycle_config()).trigger_type == "duration"
         assert Chore(state_change_presence_config()).trigger_type == "state_change"
 
+    def test_model_label(self):
+        assert Chore(power_cycle_config()).model_label == "Power Cycle"
+        assert Chore(daily_manual_config()).model_label == "Daily"
+
+    def test_device_info_built_once(self):
+        c = Chore(daily_manual_config())
+        assert c.device_info is c.device_info
+        assert ("chores", c.id) in c.device_info["identifiers"]
+
 
 # ── State transitions via evaluate() ────────────────────────────────
 
@@ -170,6 +190,24 @@ class TestEvaluateTransitions:
         assert c.state == ChoreState.INACTIVE
         assert old == ChoreState.COMPLETED
 
+    def test_completed_asks_reset_for_deadline_once(self):
+        hass = MockHass()
+        with freeze_time("2024-06-01 09:00:00") as frozen:
+            c = Chore(daily_manual_config())
+            c.force_complete()
+            c._state_entered_at = dt_util.now()
+            with patch.object(
+                c._reset, "next_reset_at", wraps=c._reset.next_reset_at
+            ) as next_reset_at:
+                assert c.evaluate(hass) is None
+                frozen.move_to("2024-06-02 07:59:00")
+                assert c.evaluate(hass) is None
+                assert next_reset_at.call_count == 1
+                frozen.move_to("2024-06-02 08:00:00")
+                assert c.evaluate(hass) == ChoreState.COMPLETED
+            assert c.state == ChoreState.INACTIVE
+            assert c._reset_at is None
+
     def test_no_change_returns_none(self):
         # Use state_change config — DailyTrigger.evaluate() auto-fires when
         # past trigger time, so we use a trigger whose evaluate() is a no-op.
@@ -178,6 +216,43 @@ class TestEvaluateTransitions:
         result = c.evaluate(hass)
         assert result is None
 
+    def test_no_transition_settles_inputs(self):
+        c = Chore(state_change_presence_config())
+        hass = MockHass()
+        assert c.evaluate(hass) is None
+        assert c._settled == (ChoreState.INACTIVE, SubState.IDLE, SubState.IDLE)
+        assert c.evaluate(hass) is None
+
+    def test_settled_cache_invalidated_by_substate_change(self):
+        c = Chore(state_change_presence_config())
+        hass = MockHass()
+        assert c.evaluate(hass) is None
+        c._trigger.set_state(SubState.ACTIVE)
+        assert c.evaluate(hass) == ChoreState.INACTIVE
+        assert c.state == ChoreState.PENDING
+
+    def test_transition_does_not_settle(self):
+        """A transition may enable a further one with unchanged sub-states."""
+        c = Chore(daily_manual_config())
+        c._trigger.set_state(SubState.DONE)
+        hass = MockHass()
+        c.evaluate(hass)  # → DUE
+        c._completion.set_state(SubState.DONE)
+        assert c.evaluate(hass) == ChoreState.DUE
+        assert c.state == ChoreState.COMPLETED
+
+    def test_listener_update_skips_stage_polls(self):
+        c = Chore(daily_manual_config())
+        on_update = MagicMock()
+        c._on_update = on_update
+        c._trigger.set_state(SubState.DONE)
+        with patch.object(TriggerStage, "evaluate") as trigger_evaluate:
+            c._fire_update()
+            c._fire_update()
+        trigger_evaluate.assert_not_called()
+        assert c.state == ChoreState.DUE
+        on_update.assert_called_once_with(c.id, ChoreState.INACTIVE, ChoreState.DUE)
+
 
 # ── Timestamps ───────────────────────────────────────────────────────
 
@@ -356,11 +431,52 @@ class TestPersistence:
         c2.restore_state(snap)
         assert len(c2.completion_history) == 2
 
+    def test_history_persisted_as_dicts(self):
+        c = Chore(daily_manual_config())
+        c.force_complete()
+        record = c.snapshot_state()["completion_history"][0]
+        assert record["completed_by"] == "forced"
+        assert record["completed_at"] == c.last_completed.isoformat(timespec="seconds")
+
+    def test_history_records_reused_until_next_completion(self):
+        c = Chore(daily_manual_config())
+        c.force_complete()
+        first = c.snapshot_state()["completion_history"]
+        assert c.snapshot_state()["completion_history"] is first
+        c.force_inactive()
+        c.force_complete()
+        assert len(c.snapshot_state()["completion_history"]) == 2
+
+    def test_restore_skips_invalid_history_records(self):
+        c = Chore(daily_manual_config())
+        c.restore_state({
+            "completion_history": [
+                {"completed_at": "not-a-date", "completed_by": "manual"},
+                {"completed_at": "2024-01-01T08:00:00+00:00", "completed_by": "sensor"},
+            ]
+        })
+        assert len(c.completion_history) == 1
+        assert c.last_completed_by() == "sensor"
+
     def test_restore_with_empty_data(self):
         c = Chore(daily_manual_config())
         c.restore_state({})
         assert c.state == ChoreState.INACTIVE
 
+    def test_timestamps_serialized_consistently(self):
+        c = Chore(daily_manual_config())
+        c.force_due()
+        snap = c.snapshot_state()
+        assert snap["due_since"] == c.due_since.isoformat(timespec="seconds")
+        assert snap["state_entered_at"] == c.state_entered_at.isoformat(
+            timespec="seconds"
+        )
+        c2 = Chore(daily_manual_config())
+        c2.restore_state(snap)
+        d = c2.to_state_dict(MockHass())
+        assert d["due_since"] == snap["due_since"]
+        assert d["state_entered_at"] == snap["state_entered_at"]
+
 
 # ── to_state_dict() ──────────────────────────────────────────────────
 
@@ -404,12 +520,56 @@ class TestToStateDict:
         d = c.to_state_dict(hass)
         assert d["next_due"] is not None
 
+    def test_next_due_refreshed_once_passed(self):
+        hass = MockHass()
+        with freeze_time("2024-06-01 07:00:00") as frozen:
+            c = Chore(daily_manual_config())
+            first = c.to_state_dict(hass)["next_due"]
+            assert first == c.next_due.isoformat()
+            frozen.move_to("2024-06-01 07:30:00")
+            assert c.to_state_dict(hass)["next_due"] == first
+            frozen.move_to("2024-06-01 09:00:00")
+            second = c.to_state_dict(hass)["next_due"]
+            assert second != first
+            assert second == c.next_due.isoformat()
+
     def test_no_next_due_for_power_cycle(self):
         hass = MockHass()
         c = Chore(power_cycle_config())
         d = c.to_state_dict(hass)
         assert d["next_due"] is None
 
+    def test_returns_copies_of_cached_dict(self):
+        hass = MockHass()
+        c = Chore(daily_manual_config())
+        d1 = c.to_state_dict(hass)
+        d1["state_label"] = "mutated"
+        assert c.to_state_dict(hass)["state_label"] == "Inactive"
+
+    def test_cache_refreshed_on_transition(self):
+        hass = MockHass()
+        c = Chore(daily_manual_config())
+        assert c.to_state_dict(hass)["state_label"] == "Inactive"
+        c.force_due()
+        d = c.to_state_dict(hass)
+        assert d["state_label"] == "Due"
+        assert d["forced"] is True
+
+    def test_cache_refreshed_on_substate_change(self):
+        hass = MockHass()
+        c = Chore(duration_contact_cycle_config())
+        assert c.to_state_dict(hass)["completion_state"] == "idle"
+        c._completion.set_state(SubState.ACTIVE)
+        assert c.to_state_dict(hass)["completion_state"] == "active"
+
+    def test_completion_button_setter_refreshes_cache(self):
+        hass = MockHass()
+        c = Chore(daily_manual_config())
+        assert "completion_button" not in c.to_state_dict(hass)
+        c.completion_button_entity_id = "button.feed_fay_morning_force_complete"
+        d = c.to_state_dict(hass)
+        assert d["completion_button"] == "button.feed_fay_morning_force_complete"
+
 
 # ── Notification timing ──────────────────────────────────────────────
 
@@ -504,6 +664,20 @@ class TestNotifyAfter:
         assert d["notify_at"] == "21:00"
         assert d["notify_after_minutes"] == 30
 
+    def test_state_dict_timestamps_share_precision(self):
+        """notify_after and next_due use the same whole-second format as due_since."""
+        config = daily_manual_config()
+        config["notify_after_minutes"] = 30
+        c = Chore(config)
+        c.force_due()
+        d = c.to_state_dict(MockHass())
+        for key in ("due_since", "state_entered_at", "notify_after", "next_due"):
+            assert d[key] is not None
+            assert datetime.fromisoformat(d[key]).microsecond == 0, key
+        assert datetime.fromisoformat(d["notify_after"]) - datetime.fromisoformat(
+            d["due_since"]
+        ) == timedelta(minutes=30)
+
     def test_notify_after_persists_through_started(self):
         """notify_after stays computed in started state."""
         config = duration_contact_cycle_config()
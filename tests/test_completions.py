@@ -5,7 +5,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from conftest import MockHass, make_state_change_event, setup_listeners_capturing
+from conftest import (
+    MockHass,
+    capture_listeners,
+    make_state_change_event,
+    setup_listeners_capturing,
+)
 
 from custom_components.chores.const import CompletionType, SubState
 from custom_components.chores.completions import CompletionStage, create_completion
@@ -78,6 +83,23 @@ class TestBaseCompletionBehavior:
         assert c2.enabled is True
         assert c2.steps_done == 1
 
+    def test_state_entered_at_attribute_tracks_restore(self):
+        c = create_completion({"type": "manual"})
+        c.restore_state({"state": "done", "state_entered_at": "2025-06-15T10:00:00+00:00"})
+        attrs = c.extra_attributes(MockHass())
+        assert attrs["state_entered_at"] == "2025-06-15T10:00:00+00:00"
+        c.set_state(SubState.IDLE)
+        attrs = c.extra_attributes(MockHass())
+        assert attrs["state_entered_at"] == c.state_entered_at.isoformat()
+
+    def test_evaluate_skips_detector_once_done(self):
+        c = create_completion({"type": "manual"})
+        c.enable()
+        c.set_state(SubState.DONE)
+        with patch.object(ManualDetector, "evaluate") as detector_evaluate:
+            assert c.evaluate(MockHass()) == SubState.DONE
+        detector_evaluate.assert_not_called()
+
 
 # ── ManualCompletion ─────────────────────────────────────────────────
 
@@ -156,6 +178,22 @@ class TestContactCompletion:
         assert attrs["completion_type"] == "contact"
         assert attrs["watched_entity"] == "binary_sensor.door_contact"
 
+    def test_opening_completes(self):
+        hass = MockHass()
+        c = self._make()
+        state_cbs, _, on_change = setup_listeners_capturing(hass, c.detector)
+        state_cbs[0](make_state_change_event("binary_sensor.door_contact", "on", "off"))
+        assert c.detector.state == SubState.DONE
+        on_change.assert_called_once()
+
+    def test_attribute_only_update_ignored(self):
+        hass = MockHass()
+        c = self._make()
+        state_cbs, _, on_change = setup_listeners_capturing(hass, c.detector)
+        state_cbs[0](make_state_change_event("binary_sensor.door_contact", "on", "on"))
+        assert c.detector.state == SubState.IDLE
+        on_change.assert_not_called()
+
 
 # ── ContactCycleCompletion ───────────────────────────────────────────
 
@@ -321,6 +359,9 @@ class TestCreateCompletionFactory:
 # ── ContactCycleCompletion debounce tests ─────────────────────────────
 
 
+_CONTACT_CYCLE = "custom_components.chores.detectors.contact_cycle"
+
+
 class TestContactCycleDebounce:
     """Tests for the debounce timer in ContactCycleDetector."""
 
@@ -370,12 +411,16 @@ class TestContactCycleDebounce:
             listener_cb(event)
         # Manually fire the deferred callback (simulating timer expiry)
         deferred = comp.detector._pending_active_cancel._deferred_cb
-        deferred(None)  # _confirm_active(now)
+        with patch(
+            f"{_CONTACT_CYCLE}.monotonic",
+            return_value=comp.detector._pending_active_deadline,
+        ):
+            deferred(None)  # _confirm_active(now)
         assert comp.state == SubState.ACTIVE
         on_change.assert_called()
 
     def test_bounce_back_cancels_debounce(self):
-        """Closing before debounce fires cancels the pending ACTIVE."""
+        """Closing before debounce fires drops the pending ACTIVE."""
         comp = self._make()
         comp.enable()
         hass = MockHass()
@@ -397,9 +442,45 @@ class TestContactCycleDebounce:
         # Simulate close before debounce fires
         event_close = make_state_change_event("binary_sensor.door", "off", "on")
         listener_cb(event_close)
-        assert comp.detector._pending_active_cancel is None
+        assert comp.detector._pending_active_deadline is None
+        # The timer stays armed but finds nothing to confirm
+        pending.assert_not_called()
+        with patch(f"{_CONTACT_CYCLE}.monotonic", return_value=1e12):
+            pending._deferred_cb(None)
         assert comp.state == SubState.IDLE
-        pending.assert_called_once()  # The cancel callable was invoked
+        on_change.assert_not_called()
+
+    def test_reopen_after_bounce_rearms_for_remainder(self):
+        """A bounce re-opening the contact reuses the armed timer."""
+        comp = self._make(debounce_seconds=2)
+        comp.enable()
+        hass = MockHass()
+        state_cbs, _, on_change = setup_listeners_capturing(hass, comp)
+        listener_cb = state_cbs[0]
+        delays = []
+
+        def _fake_call_later(hass_arg, delay, cb):
+            delays.append(delay)
+            cancel = MagicMock()
+            cancel._deferred_cb = cb
+            return cancel
+
+        with patch(f"{_CONTACT_CYCLE}.async_call_later", _fake_call_later):
+            with patch(f"{_CONTACT_CYCLE}.monotonic", return_value=100.0):
+                listener_cb(make_state_change_event("binary_sensor.door", "on", "off"))
+            with patch(f"{_CONTACT_CYCLE}.monotonic", return_value=101.0):
+                listener_cb(make_state_change_event("binary_sensor.door", "off", "on"))
+                listener_cb(make_state_change_event("binary_sensor.door", "on", "off"))
+            assert delays == [2]  # no timer churn for the bounce
+            first = comp.detector._pending_active_cancel
+            with patch(f"{_CONTACT_CYCLE}.monotonic", return_value=102.0):
+                first._deferred_cb(None)
+            assert comp.state == SubState.IDLE
+            assert delays == [2, 1.0]
+            with patch(f"{_CONTACT_CYCLE}.monotonic", return_value=103.0):
+                comp.detector._pending_active_cancel._deferred_cb(None)
+        assert comp.state == SubState.ACTIVE
+        on_change.assert_called_once()
 
     def test_reset_cancels_pending_debounce(self):
         """Resetting the completion cancels any pending debounce timer."""
@@ -407,9 +488,11 @@ class TestContactCycleDebounce:
         comp.enable()
         cancel_mock = MagicMock()
         comp.detector._pending_active_cancel = cancel_mock
+        comp.detector._pending_active_deadline = 0.0
         comp.reset()
         cancel_mock.assert_called_once()
         assert comp.detector._pending_active_cancel is None
+        assert comp.detector._pending_active_deadline is None
 
     def test_step2_close_from_active(self):
         """Closing while ACTIVE completes the cycle (step 2)."""
@@ -464,9 +547,11 @@ class TestContactCycleDebounce:
     def test_disabled_listener_does_not_propagate(self):
         """When disabled, detector may process events but outer callback is not called."""
         comp = self._make()
-        # NOT enabled
+        comp.enable()
         hass = MockHass()
         state_cbs, _, on_change = setup_listeners_capturing(hass, comp)
+        # Disabling unsubscribes; an event already in flight is still ignored
+        comp.disable()
         listener_cb = state_cbs[0]
 
         # Firing a "close from ACTIVE" event while disabled — detector processes
@@ -478,6 +563,32 @@ class TestContactCycleDebounce:
         on_change.assert_not_called()
 
 
+# ── DurationCompletion re-enable ───────────────────────────────────────
+
+
+class TestDurationCompletionReenable:
+    def test_state_seen_before_disable_is_not_reused(self):
+        comp = create_completion({
+            "type": "duration",
+            "entity_id": "binary_sensor.rack",
+            "state": "on",
+            "duration_hours": 1,
+        })
+        hass = MockHass()
+        with capture_listeners(hass) as (state_cbs, _):
+            comp.async_setup_listeners(hass, MagicMock())
+            comp.enable()
+            state_cbs[-1](make_state_change_event("binary_sensor.rack", "on", "off"))
+        assert comp.state == SubState.ACTIVE
+
+        comp.reset()
+        hass.states.set("binary_sensor.rack", "off")
+        with capture_listeners(hass):
+            comp.enable()
+        assert comp.evaluate(hass) == SubState.IDLE
+        assert comp.detector._duration_cancel is None
+
+
 # ── PresenceCycleCompletion startup filtering ─────────────────────────
 
 
@@ -516,9 +627,11 @@ class TestPresenceCycleStartupFiltering:
             "type": "presence_cycle",
             "entity_id": "person.alice",
         })
-        # NOT enabled
+        comp.enable()
         hass = MockHass()
         state_cbs, _, on_change = setup_listeners_capturing(hass, comp)
+        # Disabling unsubscribes; an event already in flight is still ignored
+        comp.disable()
         listener_cb = state_cbs[0]
 
         event = make_state_change_event("person.alice", "not_home", "home")
@@ -549,6 +662,19 @@ class TestPresenceCycleStartupFiltering:
         assert comp.state == SubState.DONE
         assert on_change.call_count == 2
 
+    def test_return_without_leave_is_ignored(self):
+        comp = create_completion({
+            "type": "presence_cycle",
+            "entity_id": "person.alice",
+        })
+        comp.enable()
+        hass = MockHass()
+        state_cbs, _, on_change = setup_listeners_capturing(hass, comp)
+
+        state_cbs[0](make_state_change_event("person.alice", "home", "work"))
+        assert comp.state == SubState.IDLE
+        on_change.assert_not_called()
+
 
 # ── SensorStateCompletion disabled/new_state=None tests ──────────────
 
@@ -561,9 +687,11 @@ class TestSensorStateCompletionEdgeCases:
             "entity_id": "sensor.test",
             "state": "on",
         })
-        # NOT enabled
+        comp.enable()
         hass = MockHass()
         state_cbs, _, on_change = setup_listeners_capturing(hass, comp)
+        # Disabling unsubscribes; an event already in flight is still ignored
+        comp.disable()
         listener_cb = state_cbs[0]
 
         event = make_state_change_event("sensor.test", "on", "off")
@@ -726,6 +854,17 @@ class TestSensorThresholdCompletionListener:
         assert comp.state == SubState.IDLE
         on_change.assert_not_called()
 
+    def test_listener_ignores_events_once_done(self):
+        comp = self._make(operator="above", threshold=30.0)
+        comp.enable()
+        hass = MockHass()
+        state_cbs, _, on_change = setup_listeners_capturing(hass, comp)
+        state_cbs[0](make_state_change_event("sensor.temperature", "35.0", "25.0"))
+        with patch.object(SensorThresholdDetector, "_check_threshold") as check:
+            state_cbs[0](make_state_change_event("sensor.temperature", "40.0", "35.0"))
+        check.assert_not_called()
+        on_change.assert_called_once()
+
     def test_listener_ignores_unavailable(self):
         comp = self._make()
         comp.enable()
@@ -750,9 +889,11 @@ class TestSensorThresholdCompletionListener:
 
     def test_listener_ignores_when_disabled(self):
         comp = self._make()
-        # NOT enabled
+        comp.enable()
         hass = MockHass()
         state_cbs, _, on_change = setup_listeners_capturing(hass, comp)
+        # Disabling unsubscribes; an event already in flight is still ignored
+        comp.disable()
         listener_cb = state_cbs[0]
 
         event = make_state_change_event("sensor.temperature", "35.0", "25.0")
@@ -817,7 +958,8 @@ class TestSensorThresholdCompletionEnable:
         hass.states.set("sensor.temperature", "35.0")
         state_cbs, _, on_change = setup_listeners_capturing(hass, comp)
 
-        comp.enable()
+        with capture_listeners(hass, state_cbs):
+            comp.enable()
         assert comp.state == SubState.DONE
         on_change.assert_called_once()
 
@@ -827,7 +969,8 @@ class TestSensorThresholdCompletionEnable:
         hass.states.set("sensor.temperature", "25.0")
         state_cbs, _, on_change = setup_listeners_capturing(hass, comp)
 
-        comp.enable()
+        with capture_listeners(hass, state_cbs):
+            comp.enable()
         assert comp.state == SubState.IDLE
         on_change.assert_not_called()
 
@@ -837,7 +980,8 @@ class TestSensorThresholdCompletionEnable:
         hass.states.set("sensor.temperature", "unavailable")
         state_cbs, _, on_change = setup_listeners_capturing(hass, comp)
 
-        comp.enable()
+        with capture_listeners(hass, state_cbs):
+            comp.enable()
         assert comp.state == SubState.IDLE
 
     def test_enable_handles_no_entity(self):
@@ -845,7 +989,8 @@ class TestSensorThresholdCompletionEnable:
         hass = MockHass()
         state_cbs, _, on_change = setup_listeners_capturing(hass, comp)
 
-        comp.enable()
+        with capture_listeners(hass, state_cbs):
+            comp.enable()
         assert comp.state == SubState.IDLE
 
     def test_enable_handles_non_numeric(self):
@@ -854,7 +999,8 @@ class TestSensorThresholdCompletionEnable:
         hass.states.set("sensor.temperature", "foobar")
         state_cbs, _, on_change = setup_listeners_capturing(hass, comp)
 
-        comp.enable()
+        with capture_listeners(hass, state_cbs):
+            comp.enable()
         assert comp.state == SubState.IDLE
 
     def test_enable_without_listeners_setup(self):
@@ -23,6 +23,7 @@ from custom_components.chores.const import (
     SERVICE_FORCE_COMPLETE,
     SERVICE_FORCE_DUE,
     SERVICE_FORCE_INACTIVE,
+    UNAVAILABLE_STATES,
     ChoreState,
     CompletionType,
     ResetType,
@@ -122,3 +123,7 @@ class TestConstants:
         assert SERVICE_FORCE_DUE == "force_due"
         assert SERVICE_FORCE_INACTIVE == "force_inactive"
         assert SERVICE_FORCE_COMPLETE == "force_complete"
+
+    def test_unavailable_states(self):
+        assert isinstance(UNAVAILABLE_STATES, frozenset)
+        assert UNAVAILABLE_STATES == {"unavailable", "unknown"}
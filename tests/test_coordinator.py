@@ -37,6 +37,22 @@ def _make_coordinator(hass=None, logbook_enabled=True):
     return coord, store
 
 
+@pytest.fixture(autouse=True)
+def scheduled_updates():
+    """Capture coalesced data pushes instead of arming a loop timer."""
+    scheduled: list = []
+
+    def _fake_call_later(hass, delay, action):
+        cancel = MagicMock()
+        scheduled.append((action, cancel))
+        return cancel
+
+    with patch(
+        "custom_components.chores.coordinator.async_call_later", _fake_call_later
+    ):
+        yield scheduled
+
+
 class TestStateEventMap:
     def test_all_states_mapped(self):
         assert ChoreState.PENDING in STATE_EVENT_MAP
@@ -53,6 +69,12 @@ class TestStateEventMap:
         assert STATE_EVENT_MAP[ChoreState.INACTIVE] == EVENT_CHORE_RESET
 
 
+class TestSlots:
+    def test_own_attributes_live_in_slots(self):
+        coord, _ = _make_coordinator()
+        assert not set(ChoresCoordinator.__slots__) & set(vars(coord))
+
+
 class TestRegisterChore:
     def test_registers_chore(self):
         coord, store = _make_coordinator()
@@ -138,6 +160,19 @@ class TestFireEvent:
         _, event_data = hass.bus.events[0]
         assert event_data["forced"] is True
 
+    def test_each_event_gets_its_own_data(self):
+        hass = MockHass()
+        coord, _ = _make_coordinator(hass)
+        chore = Chore(daily_manual_config())
+        coord.register_chore(chore)
+        coord._fire_event(chore, ChoreState.INACTIVE, ChoreState.DUE)
+        coord._fire_event(chore, ChoreState.DUE, ChoreState.COMPLETED)
+        (_, first), (_, second) = hass.bus.events
+        assert first is not second
+        assert first["new_state"] == "due"
+        assert second["new_state"] == "completed"
+        assert "new_state" not in coord._event_templates["feed_fay_morning"]
+
 
 class TestForceActions:
     @pytest.mark.asyncio
@@ -190,6 +225,54 @@ class TestPersistChore:
         store.set_chore_state.assert_called_once_with(
             "feed_fay_morning", chore.snapshot_state()
         )
+        store.async_delay_save.assert_called_once_with()
+
+
+class TestRefreshCompletionButtons:
+    @staticmethod
+    def _registry_entries(*entries):
+        return [
+            MagicMock(domain=domain, unique_id=unique_id, entity_id=entity_id)
+            for domain, unique_id, entity_id in entries
+        ]
+
+    @pytest.mark.asyncio
+    async def test_resolves_from_single_registry_scan(self):
+        coord, _ = _make_coordinator()
+        coord.register_chore(Chore(daily_manual_config()))
+        coord.register_chore(Chore(power_cycle_config()))
+        entries = self._registry_entries(
+            ("button", "chores_feed_fay_morning_force_complete", "button.feed_done"),
+            ("sensor", "chores_feed_fay_morning_force_complete", "sensor.wrong"),
+        )
+        with patch(
+            "custom_components.chores.coordinator.er.async_get"
+        ), patch(
+            "custom_components.chores.coordinator.er.async_entries_for_config_entry",
+            return_value=entries,
+        ) as entries_for_entry:
+            await coord.async_refresh_completion_buttons()
+
+        entries_for_entry.assert_called_once()
+        assert entries_for_entry.call_args.args[1] == "test_entry"
+        assert coord.get_chore("feed_fay_morning").completion_button_entity_id == (
+            "button.feed_done"
+        )
+        # Non-manual completion never gets a button
+        assert coord.get_chore("unload_washing").completion_button_entity_id is None
+
+    @pytest.mark.asyncio
+    async def test_skips_registry_when_all_resolved(self):
+        coord, _ = _make_coordinator()
+        chore = Chore(daily_manual_config())
+        chore.completion_button_entity_id = "button.feed_done"
+        coord.register_chore(chore)
+        with patch(
+            "custom_components.chores.coordinator.er.async_get"
+        ) as async_get:
+            await coord.async_refresh_completion_buttons()
+        async_get.assert_not_called()
+        assert chore.completion_button_entity_id == "button.feed_done"
 
 
 class TestBuildData:
@@ -211,6 +294,34 @@ class TestBuildData:
         data = coord._build_data()
         assert data[chore.id] == chore.to_state_dict(hass)
 
+    @pytest.mark.asyncio
+    async def test_transition_rebuilds_only_changed_chore(self):
+        coord, _ = _make_coordinator()
+        c1 = Chore(daily_manual_config())
+        c2 = Chore(power_cycle_config())
+        coord.register_chore(c1)
+        coord.register_chore(c2)
+        coord._build_data()
+
+        await coord.async_force_due(c1.id)
+        with patch.object(Chore, "to_state_dict", autospec=True) as to_state_dict:
+            to_state_dict.return_value = {}
+            data = coord._build_data()
+        to_state_dict.assert_called_once_with(c1, coord.hass)
+        assert set(data) == {c1.id, c2.id}
+
+    @pytest.mark.asyncio
+    async def test_poll_rebuilds_every_chore(self):
+        coord, _ = _make_coordinator()
+        coord.register_chore(Chore(daily_manual_config()))
+        coord.register_chore(Chore(power_cycle_config()))
+        coord._build_data()
+
+        with patch.object(Chore, "to_state_dict", autospec=True) as to_state_dict:
+            to_state_dict.return_value = {}
+            await coord._async_update_data()
+        assert to_state_dict.call_count == 2
+
 
 class TestAsyncUpdateData:
     @pytest.mark.asyncio
@@ -227,6 +338,30 @@ class TestAsyncUpdateData:
         store.async_save.assert_awaited_once()
         assert chore.id in result
 
+    @pytest.mark.asyncio
+    async def test_poll_shares_one_timestamp(self):
+        coord, _ = _make_coordinator()
+        first, second = Chore(daily_manual_config()), Chore(power_cycle_config())
+        coord.register_chore(first)
+        coord.register_chore(second)
+        with patch.object(
+            Chore, "evaluate", autospec=True, return_value=None
+        ) as evaluate:
+            await coord._async_update_data()
+        (_, _, now_a), (_, _, now_b) = (c.args for c in evaluate.call_args_list)
+        assert now_a is now_b
+        assert now_a.tzinfo is not None
+
+    @pytest.mark.asyncio
+    async def test_skips_save_when_nothing_changed(self):
+        coord, store = _make_coordinator()
+        store.dirty = False
+        from conftest import state_change_presence_config
+        coord.register_chore(Chore(state_change_presence_config()))
+
+        await coord._async_update_data()
+        store.async_save.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_fires_event_on_state_change(self):
         """If evaluate returns a previous state, event is fired."""
@@ -262,3 +397,65 @@ class TestOnChoreStateChange:
         coord._on_chore_state_change("nonexistent", ChoreState.INACTIVE, ChoreState.DUE)
         assert len(hass.bus.events) == 0
         store.set_chore_state.assert_not_called()
+
+
+class TestCoalescedUpdates:
+    @pytest.mark.asyncio
+    async def test_burst_of_force_actions_pushes_data_once(self, scheduled_updates):
+        hass = MockHass()
+        coord, _ = _make_coordinator(hass)
+        coord.register_chore(Chore(daily_manual_config()))
+        coord.register_chore(Chore(power_cycle_config()))
+        coord._listeners = {MagicMock(): MagicMock()}
+        coord.async_set_updated_data = MagicMock()
+
+        await coord.async_force_due("feed_fay_morning")
+        await coord.async_force_due("unload_washing")
+        await coord.async_force_complete("feed_fay_morning")
+        assert len(hass.bus.events) == 3
+        assert len(scheduled_updates) == 1
+        coord.async_set_updated_data.assert_not_called()
+
+        action, _ = scheduled_updates[0]
+        action(None)
+        coord.async_set_updated_data.assert_called_once()
+        data = coord.async_set_updated_data.call_args.args[0]
+        assert data["feed_fay_morning"]["state_label"] == "Completed"
+
+        # The next change arms a new batch
+        await coord.async_force_inactive("feed_fay_morning")
+        assert len(scheduled_updates) == 2
+
+    @pytest.mark.asyncio
+    async def test_flush_without_listeners_skips_build(self, scheduled_updates):
+        coord, _ = _make_coordinator()
+        coord.register_chore(Chore(daily_manual_config()))
+        coord.async_set_updated_data = MagicMock()
+        await coord.async_force_due("feed_fay_morning")
+
+        with patch.object(coord, "_build_data") as build_data:
+            scheduled_updates[0][0](None)
+        build_data.assert_not_called()
+        coord.async_set_updated_data.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_poll_cancels_pending_batch(self, scheduled_updates):
+        hass = MockHass()
+        coord, _ = _make_coordinator(hass)
+        coord.register_chore(Chore(daily_manual_config()))
+        await coord.async_force_due("feed_fay_morning")
+        _, cancel = scheduled_updates[0]
+
+        await coord._async_update_data()
+        cancel.assert_called_once()
+
+    def test_remove_listeners_cancels_pending_batch(self, scheduled_updates):
+        hass = MockHass()
+        coord, _ = _make_coordinator(hass)
+        chore = Chore(daily_manual_config())
+        coord.register_chore(chore)
+        coord._on_chore_state_change(chore.id, ChoreState.INACTIVE, ChoreState.DUE)
+        _, cancel = scheduled_updates[0]
+
+        coord.remove_listeners()
+        cancel.assert_called_once()
@@ -34,7 +34,7 @@ class TestDiagnostics:
         coord.register_chore(c2)
 
         hass.data[DOMAIN] = {
-            entry.entry_id: {"coordinator": coord},
+            "entries": {entry.entry_id: {"coordinator": coord}},
         }
 
         result = await async_get_config_entry_diagnostics(hass, entry)
@@ -73,7 +73,21 @@ class TestDiagnostics:
         coord.register_chore(chore)
         chore.force_due()
 
-        hass.data[DOMAIN] = {entry.entry_id: {"coordinator": coord}}
+        hass.data[DOMAIN] = {"entries": {entry.entry_id: {"coordinator": coord}}}
 
         result = await async_get_config_entry_diagnostics(hass, entry)
         assert result["chores"][chore.id]["due_since"] is not None
+
+    @pytest.mark.asyncio
+    async def test_entry_without_chores(self):
+        from custom_components.chores.diagnostics import async_get_config_entry_diagnostics
+
+        hass = MockHass()
+        entry = MagicMock()
+        entry.entry_id = "test"
+        entry.version = 2
+
+        hass.data[DOMAIN] = {"entries": {entry.entry_id: {"coordinator": None}}}
+
+        result = await async_get_config_entry_diagnostics(hass, entry)
+        assert result["chores"] == {}
@@ -12,6 +12,7 @@ from freezegun import freeze_time
 
 from conftest import (
     MockHass,
+    capture_listeners,
     daily_gate_contact_config,
     daily_gate_manual_config,
     daily_manual_config,
@@ -377,10 +378,11 @@ class TestOpenWindowHumidityLifecycle:
         hass = MockHass()
         chore = Chore(daily_sensor_threshold_config())
         # Set up listeners (patched) so the completion has access to hass
-        setup_listeners_capturing(hass, chore.completion)
+        state_cbs, _, _ = setup_listeners_capturing(hass, chore.completion)
         hass.states.set("sensor.bathroom_humidity", "50.0")
-        # Trigger fires → DUE → enable() checks and completes
-        chore.evaluate(hass)
+        # Trigger fires → DUE → enable() subscribes, checks and completes
+        with capture_listeners(hass, state_cbs):
+            chore.evaluate(hass)
         assert chore.state == ChoreState.DUE
         # The enable() should have set completion to DONE
         assert chore.completion.state == SubState.DONE
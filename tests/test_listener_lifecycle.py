@@ -6,9 +6,15 @@ and that async_remove_listeners() properly cleans up.
 """
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from conftest import MockHass, make_state_change_event, setup_listeners_capturing
+from conftest import (
+    MockHass,
+    capture_gate_listeners,
+    capture_listeners,
+    make_state_change_event,
+    setup_listeners_capturing,
+)
 
 from custom_components.chores.const import SubState
 from custom_components.chores.triggers import TriggerStage, create_trigger
@@ -112,7 +118,7 @@ class TestDailyTriggerListenerLifecycle:
         assert len(time_cbs) == 1
         assert len(state_cbs) == 0
 
-    def test_with_gate_registers_time_plus_state_listener(self):
+    def test_with_gate_registers_only_time_listener(self):
         trigger = create_trigger({
             "type": "daily",
             "time": "08:00",
@@ -121,20 +127,56 @@ class TestDailyTriggerListenerLifecycle:
         hass = MockHass()
         state_cbs, time_cbs, _ = setup_listeners_capturing(hass, trigger)
         assert len(time_cbs) == 1  # time listener
-        assert len(state_cbs) == 1  # gate listener
+        assert len(state_cbs) == 0  # gate is only watched while holding
+
+    def test_gate_listener_registered_while_holding(self):
+        from datetime import datetime
+        trigger = create_trigger({
+            "type": "daily",
+            "time": "08:00",
+            "gate": {"entity_id": "binary_sensor.door", "state": "on"},
+        })
+        hass = MockHass()
+        hass.states.set("binary_sensor.door", "off")
+        state_cbs, time_cbs, _ = setup_listeners_capturing(hass, trigger)
+        with capture_gate_listeners(state_cbs):
+            time_cbs[0](datetime(2025, 1, 15, 8, 0, 0))
+        assert len(state_cbs) == 1
+        gate_unsub = trigger._gate._listeners[0]
+
+        hass.states.set("binary_sensor.door", "on")
+        state_cbs[0](make_state_change_event("binary_sensor.door", "on", "off"))
+        assert trigger.state == SubState.DONE
+        gate_unsub.assert_called_once()
+        assert trigger._gate._listeners == []
+
+    def test_restored_holding_registers_gate_listener(self):
+        trigger = create_trigger({
+            "type": "daily",
+            "time": "08:00",
+            "gate": {"entity_id": "binary_sensor.door", "state": "on"},
+        })
+        trigger.restore_state({"state": "done", "gate_holding": True})
+        hass = MockHass()
+        state_cbs, _, _ = setup_listeners_capturing(hass, trigger)
+        assert len(state_cbs) == 1
 
     def test_remove_listeners_calls_all_unsubs(self):
+        from datetime import datetime
         trigger = create_trigger({
             "type": "daily",
             "time": "08:00",
             "gate": {"entity_id": "binary_sensor.door", "state": "on"},
         })
         hass = MockHass()
-        setup_listeners_capturing(hass, trigger)
-        # Collect unsubs from both detector and gate
-        detector_unsubs = list(trigger.detector._listeners)
+        hass.states.set("binary_sensor.door", "off")
+        state_cbs, time_cbs, _ = setup_listeners_capturing(hass, trigger)
+        with capture_gate_listeners(state_cbs):
+            time_cbs[0](datetime(2025, 1, 15, 8, 0, 0))  # gate holding
+        # Collect unsubs from both the shared time listener and gate
+        assert len(trigger.detector._listeners) == 1
         gate_unsubs = list(trigger._gate._listeners) if trigger._gate else []
-        all_unsubs = detector_unsubs + gate_unsubs
+        all_unsubs = [hass._last_time_unsub] + gate_unsubs
         assert len(all_unsubs) == 2
         trigger.async_remove_listeners()
         for unsub in all_unsubs:
@@ -161,10 +203,11 @@ class TestDailyTriggerListenerLifecycle:
         })
         hass = MockHass()
         hass.states.set("binary_sensor.door", "off")  # gate not met
-        _, time_cbs, on_change = setup_listeners_capturing(hass, trigger)
+        state_cbs, time_cbs, on_change = setup_listeners_capturing(hass, trigger)
         time_cb = time_cbs[0]
 
-        time_cb(datetime(2025, 1, 15, 8, 0, 0))
+        with capture_gate_listeners(state_cbs):
+            time_cb(datetime(2025, 1, 15, 8, 0, 0))
         assert trigger.state == SubState.ACTIVE  # pending, gate not met
         on_change.assert_called_once()
 
@@ -179,11 +222,12 @@ class TestDailyTriggerListenerLifecycle:
         hass.states.set("binary_sensor.door", "off")
         state_cbs, time_cbs, on_change = setup_listeners_capturing(hass, trigger)
         time_cb = time_cbs[0]
-        gate_cb = state_cbs[0]
 
         # Time fires -> detector goes DONE, gate not met -> stage holds ACTIVE
-        time_cb(datetime(2025, 1, 15, 8, 0, 0))
+        with capture_gate_listeners(state_cbs):
+            time_cb(datetime(2025, 1, 15, 8, 0, 0))
         assert trigger.state == SubState.ACTIVE
+        gate_cb = state_cbs[0]
 
         # Gate met -> stage releases hold -> DONE
         hass.states.set("binary_sensor.door", "on")
@@ -202,11 +246,12 @@ class TestDailyTriggerListenerLifecycle:
         hass = MockHass()
         state_cbs, time_cbs, on_change = setup_listeners_capturing(hass, trigger)
         time_cb = time_cbs[0]
-        gate_cb = state_cbs[0]
 
         # Time fires -> ACTIVE (gate holding)
         hass.states.set("binary_sensor.door", "off")
-        time_cb(datetime(2025, 1, 15, 8, 0, 0))
+        with capture_gate_listeners(state_cbs):
+            time_cb(datetime(2025, 1, 15, 8, 0, 0))
+        gate_cb = state_cbs[0]
 
         # Gate event with old_state=None (startup) -> should be ignored
         event = make_state_change_event("binary_sensor.door", "on", None)
@@ -214,6 +259,78 @@ class TestDailyTriggerListenerLifecycle:
         assert trigger.state == SubState.ACTIVE  # still active, not done
 
 
+class TestWeeklyTriggerListenerLifecycle:
+    def _make(self, day: str = "wed"):
+        return create_trigger({
+            "type": "weekly",
+            "schedule": [{"day": day, "time": "17:00"}],
+        })
+
+    def test_same_time_shares_one_time_listener(self):
+        from datetime import datetime
+        hass = MockHass()
+        wednesday, friday = self._make("wed"), self._make("fri")
+        on_change = MagicMock()
+        with capture_listeners(hass) as (_, time_cbs):
+            wednesday.async_setup_listeners(hass, on_change)
+            friday.async_setup_listeners(hass, on_change)
+        assert len(time_cbs) == 1
+
+        time_cbs[0](datetime(2025, 6, 11, 17, 0, 0))  # Wednesday
+        assert wednesday.state == SubState.DONE
+        assert friday.state == SubState.IDLE
+
+    def test_daily_and_weekly_share_one_time_listener(self):
+        from datetime import datetime
+        hass = MockHass()
+        weekly = self._make("wed")
+        daily = create_trigger({"type": "daily", "time": "17:00"})
+        with capture_listeners(hass) as (_, time_cbs):
+            weekly.async_setup_listeners(hass, MagicMock())
+            daily.async_setup_listeners(hass, MagicMock())
+        assert len(time_cbs) == 1
+
+        time_cbs[0](datetime(2025, 6, 11, 17, 0, 0))  # Wednesday
+        assert weekly.state == SubState.DONE
+        assert daily.state == SubState.DONE
+
+    def test_failing_action_does_not_stop_the_others(self):
+        from datetime import datetime
+        hass = MockHass()
+        first, second = self._make(), self._make()
+        failing = MagicMock(side_effect=RuntimeError("boom"))
+        with capture_listeners(hass) as (_, time_cbs):
+            first.async_setup_listeners(hass, failing)
+            second.async_setup_listeners(hass, MagicMock())
+
+        time_cbs[0](datetime(2025, 6, 11, 17, 0, 0))  # Wednesday
+        failing.assert_called_once()
+        assert second.state == SubState.DONE
+
+    def test_shared_listener_removed_with_last_detector(self):
+        hass = MockHass()
+        first, second = self._make(), self._make()
+        unsubs = []
+
+        def _fake_track_time(hass_arg, cb, **kwargs):
+            unsubs.append(MagicMock())
+            return unsubs[-1]
+
+        with patch(
+            "custom_components.chores.detectors.helpers.async_track_time_change",
+            _fake_track_time,
+        ):
+            first.async_setup_listeners(hass, MagicMock())
+            second.async_setup_listeners(hass, MagicMock())
+        assert len(unsubs) == 1
+
+        first.async_remove_listeners()
+        unsubs[0].assert_not_called()
+        second.async_remove_listeners()
+        unsubs[0].assert_called_once()
+        assert hass.data["chores"]["shared_time_trackers"] == {}
+
+
 class TestDurationTriggerListenerLifecycle:
     def test_no_gate_registers_one_listener(self):
         trigger = create_trigger({
@@ -226,7 +343,7 @@ class TestDurationTriggerListenerLifecycle:
         state_cbs, _, _ = setup_listeners_capturing(hass, trigger)
         assert len(state_cbs) == 1
 
-    def test_with_gate_registers_two_listeners(self):
+    def test_with_gate_registers_entity_listener_only(self):
         trigger = create_trigger({
             "type": "duration",
             "entity_id": "binary_sensor.contact",
@@ -236,7 +353,7 @@ class TestDurationTriggerListenerLifecycle:
         })
         hass = MockHass()
         state_cbs, _, _ = setup_listeners_capturing(hass, trigger)
-        assert len(state_cbs) == 2  # entity + gate
+        assert len(state_cbs) == 1  # entity; gate is only watched while holding
 
 
 # ── Completion listener lifecycle ─────────────────────────────────────
@@ -245,12 +362,14 @@ class TestDurationTriggerListenerLifecycle:
 class TestContactCompletionListenerLifecycle:
     def test_registers_one_listener(self):
         comp = create_completion({"type": "contact", "entity_id": "binary_sensor.door"})
+        comp.enable()
         hass = MockHass()
         state_cbs, _, _ = setup_listeners_capturing(hass, comp)
         assert len(state_cbs) == 1
 
     def test_remove_listeners(self):
         comp = create_completion({"type": "contact", "entity_id": "binary_sensor.door"})
+        comp.enable()
         hass = MockHass()
         setup_listeners_capturing(hass, comp)
         assert len(comp.detector._listeners) == 1
@@ -259,6 +378,20 @@ class TestContactCompletionListenerLifecycle:
         assert len(comp.detector._listeners) == 0
         unsub.assert_called_once()
 
+    def test_subscribes_only_while_enabled(self):
+        comp = create_completion({"type": "contact", "entity_id": "binary_sensor.door"})
+        hass = MockHass()
+        state_cbs, _, _ = setup_listeners_capturing(hass, comp)
+        assert state_cbs == []
+        with capture_listeners(hass, state_cbs):
+            comp.enable()
+            comp.enable()  # re-enabling keeps the single subscription
+        assert len(state_cbs) == 1
+        unsub = comp.detector._listeners[0]
+        comp.disable()
+        unsub.assert_called_once()
+        assert comp.detector._listeners == []
+
     def test_listener_fires_done_on_contact_open(self):
         comp = create_completion({"type": "contact", "entity_id": "binary_sensor.door"})
         comp.enable()
@@ -278,10 +411,29 @@ class TestContactCycleListenerLifecycle:
             "type": "contact_cycle",
             "entity_id": "binary_sensor.door",
         })
+        comp.enable()
         hass = MockHass()
         state_cbs, _, _ = setup_listeners_capturing(hass, comp)
         assert len(state_cbs) == 1
 
+    def test_remove_listeners_cancels_pending_debounce(self):
+        comp = create_completion({
+            "type": "contact_cycle",
+            "entity_id": "binary_sensor.door",
+        })
+        comp.enable()
+        hass = MockHass()
+        with capture_listeners(hass) as (state_cbs, _):
+            comp.async_setup_listeners(hass, MagicMock())
+            state_cbs[0](make_state_change_event("binary_sensor.door", "on", "off"))
+        cancel = comp.detector._pending_active_cancel
+        assert cancel is not None
+
+        comp.async_remove_listeners()
+        cancel.assert_called_once()
+        assert comp.detector._pending_active_cancel is None
+        assert comp.detector._listeners == []
+
 
 class TestPresenceCycleListenerLifecycle:
     def test_registers_one_listener(self):
@@ -289,6 +441,7 @@ class TestPresenceCycleListenerLifecycle:
             "type": "presence_cycle",
             "entity_id": "person.alice",
         })
+        comp.enable()
         hass = MockHass()
         state_cbs, _, _ = setup_listeners_capturing(hass, comp)
         assert len(state_cbs) == 1
@@ -301,6 +454,7 @@ class TestSensorStateCompletionListenerLifecycle:
             "entity_id": "sensor.test",
             "state": "on",
         })
+        comp.enable()
         hass = MockHass()
         state_cbs, _, _ = setup_listeners_capturing(hass, comp)
         assert len(state_cbs) == 1
@@ -327,12 +481,10 @@ class TestCoordinatorListenerOrchestration:
         coord.register_chore(c1)
         coord.register_chore(c2)
 
-        c1.async_setup_listeners = MagicMock()
-        c2.async_setup_listeners = MagicMock()
-
-        coord.setup_listeners()
-        c1.async_setup_listeners.assert_called_once()
-        c2.async_setup_listeners.assert_called_once()
+        with patch.object(Chore, "async_setup_listeners", autospec=True) as mock_setup:
+            coord.setup_listeners()
+        assert mock_setup.call_count == 2
+        assert {call.args[0] for call in mock_setup.call_args_list} == {c1, c2}
 
     def test_remove_listeners_calls_all_chores(self):
         from custom_components.chores.coordinator import ChoresCoordinator
@@ -351,9 +503,7 @@ class TestCoordinatorListenerOrchestration:
         coord.register_chore(c1)
         coord.register_chore(c2)
 
-        c1.async_remove_listeners = MagicMock()
-        c2.async_remove_listeners = MagicMock()
-
-        coord.remove_listeners()
-        c1.async_remove_listeners.assert_called_once()
-        c2.async_remove_listeners.assert_called_once()
+        with patch.object(Chore, "async_remove_listeners", autospec=True) as mock_remove:
+            coord.remove_listeners()
+        assert mock_remove.call_count == 2
+        assert {call.args[0] for call in mock_remove.call_args_list} == {c1, c2}
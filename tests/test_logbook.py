@@ -170,7 +170,7 @@ class TestGetChore:
         mock_coordinator.get_chore.return_value = mock_chore
         hass.data[DOMAIN] = {
             "yaml_config": {},
-            "entry_1": {"coordinator": mock_coordinator},
+            "entries": {"entry_1": {"coordinator": mock_coordinator}},
         }
         result = _get_chore(hass, "my_chore")
         assert result == mock_chore
@@ -180,7 +180,7 @@ class TestGetChore:
         mock_coordinator = MagicMock()
         mock_coordinator.get_chore.return_value = None
         hass.data[DOMAIN] = {
-            "entry_1": {"coordinator": mock_coordinator},
+            "entries": {"entry_1": {"coordinator": mock_coordinator}},
         }
         result = _get_chore(hass, "nonexistent")
         assert result is None
@@ -193,7 +193,7 @@ class TestGetChore:
     def test_skips_non_dict_entries(self):
         hass = MockHass()
         hass.data[DOMAIN] = {
-            "yaml_config": {"chores": []},  # Not a dict with "coordinator"
+            "yaml_config": {"chores": []},  # No "entries" namespace yet
         }
         result = _get_chore(hass, "any")
         assert result is None
@@ -250,7 +250,7 @@ class TestAsyncDescribeEvents:
         mock_coordinator = MagicMock()
         mock_coordinator.get_chore.return_value = mock_chore
         hass.data[DOMAIN] = {
-            "entry_1": {"coordinator": mock_coordinator},
+            "entries": {"entry_1": {"coordinator": mock_coordinator}},
         }
 
         registered = {}
@@ -283,7 +283,7 @@ class TestAsyncDescribeEvents:
         mock_chore.trigger_type = TriggerType.POWER_CYCLE
         mock_coordinator = MagicMock()
         mock_coordinator.get_chore.return_value = mock_chore
-        hass.data[DOMAIN] = {"e1": {"coordinator": mock_coordinator}}
+        hass.data[DOMAIN] = {"entries": {"e1": {"coordinator": mock_coordinator}}}
 
         registered = {}
         async_describe_events(hass, lambda d, e, c: registered.update({e: c}))
@@ -304,7 +304,7 @@ class TestAsyncDescribeEvents:
         mock_chore.completion_type = CompletionType.CONTACT_CYCLE
         mock_coordinator = MagicMock()
         mock_coordinator.get_chore.return_value = mock_chore
-        hass.data[DOMAIN] = {"e1": {"coordinator": mock_coordinator}}
+        hass.data[DOMAIN] = {"entries": {"e1": {"coordinator": mock_coordinator}}}
 
         registered = {}
         async_describe_events(hass, lambda d, e, c: registered.update({e: c}))
@@ -325,7 +325,7 @@ class TestAsyncDescribeEvents:
         mock_chore.completion_type = CompletionType.PRESENCE_CYCLE
         mock_coordinator = MagicMock()
         mock_coordinator.get_chore.return_value = mock_chore
-        hass.data[DOMAIN] = {"e1": {"coordinator": mock_coordinator}}
+        hass.data[DOMAIN] = {"entries": {"e1": {"coordinator": mock_coordinator}}}
 
         registered = {}
         async_describe_events(hass, lambda d, e, c: registered.update({e: c}))
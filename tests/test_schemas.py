@@ -148,6 +148,18 @@ class TestTriggerSchema:
         with pytest.raises(vol.Invalid):
             TRIGGER_SCHEMA(config)
 
+    def test_unknown_type_rejected(self):
+        with pytest.raises(vol.Invalid, match="invalid trigger type"):
+            TRIGGER_SCHEMA({"type": "bogus"})
+
+    def test_completion_only_type_rejected(self):
+        with pytest.raises(vol.Invalid):
+            TRIGGER_SCHEMA({"type": "manual"})
+
+    def test_missing_type_rejected(self):
+        with pytest.raises(vol.Invalid):
+            TRIGGER_SCHEMA({"time": "08:00"})
+
     def test_power_cycle_with_gate(self):
         config = {
             "type": "power_cycle",
@@ -4,7 +4,7 @@ from __future__ import annotations
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from custom_components.chores.store import ChoreStore
+from custom_components.chores.store import SAVE_DELAY, ChoreStore
 
 
 class TestChoreStore:
@@ -73,6 +73,32 @@ class TestChoreStore:
         await store.async_save()
         store._store.async_save.assert_called_once_with(store._data)
 
+    @pytest.mark.asyncio
+    async def test_dirty_tracks_unsaved_changes(self):
+        store = self._make()
+        store._data = {"chores": {}}
+        assert store.dirty is False
+        store.set_chore_state("test", {"state": "due"})
+        assert store.dirty is True
+        await store.async_save()
+        assert store.dirty is False
+        store.remove_chore_state("missing")
+        assert store.dirty is False
+        store.remove_chore_state("test")
+        assert store.dirty is True
+
+    def test_delay_save_clears_dirty_when_written(self):
+        store = self._make()
+        store._data = {"chores": {}}
+        store.set_chore_state("test", {"state": "due"})
+        store.async_delay_save()
+        store._store.async_delay_save.assert_called_once()
+        data_func, delay = store._store.async_delay_save.call_args.args
+        assert delay == SAVE_DELAY
+        assert store.dirty is True
+        assert data_func() is store._data
+        assert store.dirty is False
+
     def test_set_creates_chores_key(self):
         store = self._make()
         store._data = {}
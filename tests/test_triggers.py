@@ -4,9 +4,10 @@ from __future__ import annotations
 from datetime import datetime, time, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
+import pytest
 from freezegun import freeze_time
 
-from conftest import MockHass, make_state_change_event
+from conftest import MockHass, capture_listeners, make_state_change_event
 
 from custom_components.chores.const import SubState, TriggerType
 from custom_components.chores.triggers import TriggerStage, create_trigger
@@ -52,6 +53,14 @@ class TestPowerCycleTrigger:
         hass.states.set("sensor.plug_current", "0.01")
         assert t.detector._is_above_threshold(hass) is True
 
+    def test_power_above_threshold_skips_current_read(self):
+        hass = MockHass()
+        t = self._make()
+        hass.states.set("sensor.plug_power", "15.0")
+        with patch.object(hass.states, "get", wraps=hass.states.get) as get:
+            assert t.detector._is_above_threshold(hass) is True
+        get.assert_called_once_with("sensor.plug_power")
+
     def test_above_threshold_current(self):
         hass = MockHass()
         t = self._make()
@@ -115,6 +124,21 @@ class TestPowerCycleTrigger:
         t.evaluate(hass)
         assert t.state == SubState.DONE
 
+    def test_cooldown_measured_against_poll_time(self):
+        hass = MockHass()
+        t = self._make(cooldown_minutes=5)
+        hass.states.set("sensor.plug_power", "15.0")
+        hass.states.set("sensor.plug_current", "0.1")
+        t.detector._evaluate_power(hass)
+        hass.states.set("sensor.plug_power", "1.0")
+        hass.states.set("sensor.plug_current", "0.01")
+        t.detector._evaluate_power(hass)
+        dropped_at = t.detector._power_dropped_at
+        t.evaluate(hass, dropped_at + timedelta(minutes=4))
+        assert t.state == SubState.ACTIVE
+        t.evaluate(hass, dropped_at + timedelta(minutes=5))
+        assert t.state == SubState.DONE
+
     def test_unavailable_does_not_start_cooldown(self):
         hass = MockHass()
         t = self._make()
@@ -262,6 +286,14 @@ class TestDailyTriggerNoGate:
         t = self._make()
         assert t.detector.trigger_time == time(8, 0)
 
+    def test_trigger_time_parsing(self):
+        from custom_components.chores.detectors.helpers import parse_time
+
+        assert parse_time("08:30") == time(8, 30)
+        assert parse_time("8:30") == time(8, 30)
+        assert parse_time("08:30:45") == time(8, 30)
+        assert parse_time(time(9, 15)) == time(9, 15)
+
     @freeze_time("2025-06-15 07:00:00")
     def test_before_time_stays_idle(self):
         hass = MockHass()
@@ -363,6 +395,52 @@ class TestDailyTriggerWithGate:
 # ── WeeklyTrigger ────────────────────────────────────────────────────
 
 
+class TestStaticAttributes:
+    def test_config_attributes_built_once(self):
+        t = create_trigger({
+            "type": "state_change",
+            "entity_id": "input_boolean.x",
+            "from": "off",
+            "to": "on",
+        })
+        hass = MockHass()
+        hass.states.set("input_boolean.x", "off")
+        with patch.object(
+            StateChangeDetector,
+            "_static_attributes",
+            autospec=True,
+            side_effect=StateChangeDetector._static_attributes,
+        ) as static:
+            t.extra_attributes(hass)
+            hass.states.set("input_boolean.x", "on")
+            attrs = t.extra_attributes(hass)
+        static.assert_called_once()
+        assert attrs["watched_entity"] == "input_boolean.x"
+        assert attrs["expected_from"] == "off"
+        assert attrs["expected_to"] == "on"
+        assert attrs["watched_entity_state"] == "on"
+
+
+class TestTimestampIsoCache:
+    def test_state_since_formatted_once_per_timestamp(self):
+        t = create_trigger({
+            "type": "duration",
+            "entity_id": "binary_sensor.contact",
+            "duration_hours": 1,
+        })
+        detector = t.detector
+        first = dt_util.utcnow()
+        detector._state_since = first
+        iso = detector.snapshot_state()["state_since"]
+        assert iso == first.isoformat()
+        assert detector._state_since_iso() is iso
+        second = first + timedelta(minutes=1)
+        detector._state_since = second
+        assert detector.snapshot_state()["state_since"] == second.isoformat()
+        detector._state_since = None
+        assert detector.snapshot_state()["state_since"] is None
+
+
 class TestWeeklyTrigger:
     def _make(self, with_gate=False):
         config = {
@@ -390,6 +468,21 @@ class TestWeeklyTrigger:
         assert t.detector.schedule[0] == (2, time(17, 0))
         assert t.detector.schedule[1] == (4, time(18, 0))
 
+    def test_todays_trigger_time_lookup(self):
+        t = self._make()
+        wednesday = datetime(2025, 6, 11, 9, 0)
+        assert t.detector._todays_trigger_time(wednesday) == time(17, 0)
+        assert t.detector._todays_trigger_time(wednesday + timedelta(days=2)) == time(18, 0)
+        assert t.detector._todays_trigger_time(wednesday + timedelta(days=1)) is None
+
+    def test_schedule_attribute(self):
+        t = self._make()
+        attrs = t.extra_attributes(MockHass())
+        assert attrs["schedule"] == [
+            {"day": "Wed", "time": "17:00:00"},
+            {"day": "Fri", "time": "18:00:00"},
+        ]
+
     @freeze_time("2025-06-11 17:01:00")  # Wednesday past 17:00
     def test_evaluate_fires_on_correct_day(self):
         hass = MockHass()
@@ -428,6 +521,28 @@ class TestWeeklyTrigger:
         assert nxt.weekday() == 4
         assert nxt.hour == 18
 
+    def test_next_trigger_recalculated_only_once_passed(self):
+        t = self._make()
+        detector = t.detector
+        with freeze_time("2025-06-11 12:00:00") as frozen, patch.object(
+            WeeklyDetector,
+            "_calculate_next_trigger",
+            autospec=True,
+            side_effect=WeeklyDetector._calculate_next_trigger,
+        ) as calculate:
+            first = t.next_trigger_datetime
+            assert (first.weekday(), first.hour) == (2, 17)
+            frozen.move_to("2025-06-11 16:59:00")
+            assert t.next_trigger_datetime == first
+            assert calculate.call_count == 1
+            frozen.move_to("2025-06-11 17:00:00")
+            second = t.next_trigger_datetime
+            assert (second.weekday(), second.hour) == (4, 18)
+            assert calculate.call_count == 2
+            assert detector.extra_attributes(MockHass())["next_trigger"] == (
+                second.isoformat()
+            )
+
     def test_reset(self):
         t = self._make()
         t.set_state(SubState.DONE)
@@ -472,6 +587,47 @@ class TestDurationTrigger:
         assert t.state == SubState.ACTIVE
         assert t.detector._state_since is not None
 
+    def test_evaluate_reads_entity_once(self):
+        hass = MockHass()
+        t = self._make()
+        hass.states.set("binary_sensor.clothes_rack_contact", "on")
+        with patch.object(hass.states, "get", wraps=hass.states.get) as get:
+            t.evaluate(hass)
+        assert t.state == SubState.ACTIVE
+        get.assert_called_once_with("binary_sensor.clothes_rack_contact")
+
+    def test_evaluate_uses_listener_state_once_seen(self):
+        from conftest import setup_listeners_capturing
+
+        hass = MockHass()
+        t = self._make()
+        state_cbs, _, _ = setup_listeners_capturing(hass, t)
+        with capture_listeners(hass):
+            state_cbs[0](make_state_change_event(
+                "binary_sensor.clothes_rack_contact", "on", "off"
+            ))
+        assert t.state == SubState.ACTIVE
+        # An unavailable event clears the cached value
+        state_cbs[0](make_state_change_event(
+            "binary_sensor.clothes_rack_contact", "unavailable", "on"
+        ))
+        hass.states.set("binary_sensor.clothes_rack_contact", "off")
+        with patch.object(hass.states, "get", wraps=hass.states.get) as get:
+            t.evaluate(hass)
+        get.assert_called_once_with("binary_sensor.clothes_rack_contact")
+        assert t.state == SubState.IDLE
+
+        with capture_listeners(hass):
+            state_cbs[0](make_state_change_event(
+                "binary_sensor.clothes_rack_contact", "on", "off"
+            ))
+        # Stale state machine value: the poll trusts the listener's "on"
+        hass.states.set("binary_sensor.clothes_rack_contact", "off")
+        with patch.object(hass.states, "get", wraps=hass.states.get) as get:
+            t.evaluate(hass)
+        get.assert_not_called()
+        assert t.state == SubState.ACTIVE
+
     @freeze_time("2025-06-15 10:00:00", tz_offset=0)
     def test_entity_not_in_target_stays_idle(self):
         hass = MockHass()
@@ -623,6 +779,100 @@ class TestCreateTriggerFactory:
             create_trigger({"type": "nonexistent"})
 
 
+class TestDetectorSlots:
+    def test_detectors_have_no_instance_dict(self):
+        from custom_components.chores.detectors import DETECTOR_REGISTRY
+
+        for cls in DETECTOR_REGISTRY.values():
+            assert not any(
+                "__dict__" in vars(klass) for klass in cls.__mro__ if klass is not object
+            ), cls.__name__
+
+    def test_gate_has_no_instance_dict(self):
+        from custom_components.chores.gate import Gate
+
+        gate = Gate({"entity_id": "binary_sensor.door", "state": "on"})
+        assert not hasattr(gate, "__dict__")
+
+    def test_type_value_resolved_per_class(self):
+        from custom_components.chores.detectors import DETECTOR_REGISTRY
+
+        for key, cls in DETECTOR_REGISTRY.items():
+            assert cls.type_value == key == cls.detector_type.value
+            assert type(cls.type_value) is str
+
+
+class TestImmediateCheckFlag:
+    def test_only_sensor_threshold_checks_on_enable(self):
+        from custom_components.chores.detectors import DETECTOR_REGISTRY
+
+        flagged = {
+            key for key, cls in DETECTOR_REGISTRY.items() if cls.has_immediate_check
+        }
+        assert flagged == {"sensor_threshold"}
+
+
+class TestTriggerNeedsPoll:
+    def test_time_based_detectors_need_poll(self):
+        assert DailyDetector.needs_poll is True
+        assert WeeklyDetector.needs_poll is True
+        assert DurationDetector.needs_poll is True
+        assert PowerCycleDetector.needs_poll is True
+
+    def test_event_driven_detector_does_not_need_poll(self):
+        assert StateChangeDetector.needs_poll is False
+        t = create_trigger({
+            "type": "state_change",
+            "entity_id": "input_boolean.x",
+            "from": "off",
+            "to": "on",
+        })
+        assert t.needs_poll is False
+
+    def test_gate_requires_poll(self):
+        t = create_trigger({
+            "type": "state_change",
+            "entity_id": "input_boolean.x",
+            "from": "off",
+            "to": "on",
+            "gate": {"entity_id": "binary_sensor.door", "state": "on"},
+        })
+        assert t.needs_poll is True
+
+
+class TestPollFastPath:
+    def test_idle_power_cycle_is_not_evaluated(self):
+        t = create_trigger({"type": "power_cycle", "power_sensor": "sensor.power"})
+        assert t.detector.can_transition_on_poll() is False
+        with patch.object(PowerCycleDetector, "evaluate") as detector_evaluate:
+            assert t.evaluate(MockHass()) == SubState.IDLE
+        detector_evaluate.assert_not_called()
+
+    def test_power_cycle_cooling_down_without_timer_is_evaluated(self):
+        t = create_trigger({"type": "power_cycle", "power_sensor": "sensor.power"})
+        t.detector.set_state(SubState.ACTIVE)
+        t.detector._power_dropped_at = dt_util.utcnow() - timedelta(hours=1)
+        assert t.detector.can_transition_on_poll() is True
+        assert t.evaluate(MockHass()) == SubState.DONE
+
+    def test_fired_daily_is_not_evaluated(self):
+        t = create_trigger({"type": "daily", "time": "08:00"})
+        t.detector._time_fired_today = True
+        with patch.object(DailyDetector, "evaluate") as detector_evaluate:
+            t.evaluate(MockHass())
+        detector_evaluate.assert_not_called()
+
+    def test_done_duration_cannot_transition(self):
+        t = create_trigger({
+            "type": "duration",
+            "entity_id": "binary_sensor.x",
+            "duration_hours": 1,
+        })
+        assert t.detector.can_transition_on_poll() is True
+        t.detector.set_state(SubState.DONE)
+        assert t.detector.can_transition_on_poll() is False
+
+
 # ── PowerCycleTrigger bad sensor values ───────────────────────────────
 
 
@@ -922,7 +1172,8 @@ class TestDurationTriggerListenerFiltering:
         listener_cb = state_cbs[0]
 
         event = make_state_change_event("binary_sensor.contact", "on", "off")
-        listener_cb(event)
+        with capture_listeners(hass):
+            listener_cb(event)
         assert trigger.state == SubState.ACTIVE
         on_change.assert_called_once()
 
@@ -946,3 +1197,155 @@ class TestDurationTriggerListenerFiltering:
         assert trigger.state == SubState.IDLE
         assert trigger.detector._state_since is None
         on_change.assert_called_once()
+
+
+# ── Scheduled wake-ups (power_cycle cooldown, duration) ─────────────
+
+
+class TestWakeUpTimers:
+    """Running cooldowns/durations end on a timer instead of on a poll."""
+
+    @staticmethod
+    def _patch_call_later(module: str, delays: list[float]):
+        def _fake_call_later(hass_arg, delay, cb):
+            delays.append(delay)
+            cancel = MagicMock()
+            cancel._deferred_cb = cb
+            return cancel
+
+        return patch(
+            f"custom_components.chores.detectors.{module}.async_call_later",
+            _fake_call_later,
+        )
+
+    def _power_cycle(self, hass, delays):
+        from conftest import setup_listeners_capturing
+
+        t = create_trigger({
+            "type": "power_cycle",
+            "power_sensor": "sensor.plug_power",
+            "cooldown_minutes": 5,
+        })
+        state_cbs, _, on_change = setup_listeners_capturing(hass, t)
+        listener_cb = state_cbs[0]
+
+        def set_power(value: str, old: str) -> None:
+            hass.states.set("sensor.plug_power", value)
+            with self._patch_call_later("power_cycle", delays):
+                listener_cb(make_state_change_event("sensor.plug_power", value, old))
+
+        return t, set_power, on_change
+
+    def test_power_drop_arms_cooldown_timer(self):
+        hass, delays = MockHass(), []
+        t, set_power, on_change = self._power_cycle(hass, delays)
+        set_power("15.0", "0.0")
+        assert delays == []
+        set_power("1.0", "15.0")
+        assert delays == [pytest.approx(300, abs=1)]
+
+        on_change.reset_mock()
+        t.detector._cooldown_cancel._deferred_cb(None)
+        assert t.state == SubState.DONE
+        assert t.detector._machine_running is False
+        on_change.assert_called_once()
+
+    def test_readings_without_transition_do_not_notify(self):
+        hass, delays = MockHass(), []
+        t, set_power, on_change = self._power_cycle(hass, delays)
+        set_power("15.0", "0.0")
+        on_change.assert_called_once()
+        set_power("18.0", "15.0")
+        set_power("1.0", "18.0")
+        on_change.assert_called_once()
+
+    def test_power_rise_cancels_cooldown_timer(self):
+        hass, delays = MockHass(), []
+        t, set_power, _ = self._power_cycle(hass, delays)
+        set_power("15.0", "0.0")
+        set_power("1.0", "15.0")
+        cancel = t.detector._cooldown_cancel
+        set_power("20.0", "1.0")
+        cancel.assert_called_once()
+        assert t.detector._cooldown_cancel is None
+        assert t.state == SubState.ACTIVE
+
+    def test_poll_skips_cooldown_check_while_timer_armed(self):
+        hass, delays = MockHass(), []
+        t, set_power, _ = self._power_cycle(hass, delays)
+        set_power("15.0", "0.0")
+        set_power("1.0", "15.0")
+        t.evaluate(hass, dt_util.utcnow() + timedelta(minutes=10))
+        assert t.state == SubState.ACTIVE
+
+    def test_remove_listeners_cancels_timer(self):
+        hass, delays = MockHass(), []
+        t, set_power, _ = self._power_cycle(hass, delays)
+        set_power("15.0", "0.0")
+        set_power("1.0", "15.0")
+        cancel = t.detector._cooldown_cancel
+        t.async_remove_listeners()
+        cancel.assert_called_once()
+
+    def test_duration_timer_for_remaining_time(self):
+        t = create_trigger({
+            "type": "duration",
+            "entity_id": "binary_sensor.contact",
+            "state": "on",
+            "duration_hours": 1,
+        })
+        hass, delays = MockHass(), []
+        # Restored 15 minutes into the duration
+        t.detector.set_state(SubState.ACTIVE)
+        t.detector._state_since = dt_util.utcnow() - timedelta(minutes=15)
+        on_change = MagicMock()
+        with capture_listeners(hass), self._patch_call_later("duration", delays):
+            t.async_setup_listeners(hass, on_change)
+        assert delays == [pytest.approx(45 * 60, abs=1)]
+
+        t.detector._duration_cancel._deferred_cb(None)
+        assert t.state == SubState.DONE
+        on_change.assert_called_once()
+
+    def test_duration_leaving_target_cancels_timer(self):
+        from conftest import setup_listeners_capturing
+
+        t = create_trigger({
+            "type": "duration",
+            "entity_id": "binary_sensor.contact",
+            "state": "on",
+            "duration_hours": 1,
+        })
+        hass, delays = MockHass(), []
+        state_cbs, _, _ = setup_listeners_capturing(hass, t)
+        with self._patch_call_later("duration", delays):
+            state_cbs[0](make_state_change_event("binary_sensor.contact", "on", "off"))
+        cancel = t.detector._duration_cancel
+        assert delays == [pytest.approx(3600, abs=1)]
+        state_cbs[0](make_state_change_event("binary_sensor.contact", "off", "on"))
+        cancel.assert_called_once()
+        assert t.state == SubState.IDLE
+
+    def test_duration_timer_after_leaving_through_unavailable(self):
+        from conftest import setup_listeners_capturing
+
+        t = create_trigger({
+            "type": "duration",
+            "entity_id": "binary_sensor.contact",
+            "state": "on",
+            "duration_hours": 1,
+        })
+        hass, delays = MockHass(), []
+        state_cbs, _, on_change = setup_listeners_capturing(hass, t)
+        with self._patch_call_later("duration", delays):
+            state_cbs[0](make_state_change_event("binary_sensor.contact", "on", "off"))
+        # Both edges pass through unavailable, so the listener skips them
+        state_cbs[0](make_state_change_event("binary_sensor.contact", "unavailable", "on"))
+        state_cbs[0](make_state_change_event("binary_sensor.contact", "off", "unavailable"))
+        assert t.state == SubState.ACTIVE
+        on_change.reset_mock()
+
+        t.detector._duration_cancel._deferred_cb(None)
+        assert t.state == SubState.IDLE
+        assert t.detector._state_since is None
+        on_change.assert_called_once()